@@ -2,7 +2,7 @@
 app.py
 Samuel Koller
 Created: 15 October 2024
-Updated: 23 October 2024
+Updated: 17 October 2026
 
 Main file for the Bluestaq Elevator Problem. Houses the Flask server and relevant endpoints.
 
@@ -11,27 +11,144 @@ Functions:
     step(int): A route to induce a given number of steps for the state machine.
     press_button(): A route to manually press a button.
     step(): A route to add persons to the system.
+    trace(): A route to view the most recent step snapshots.
+    state(): A route to read the latest snapshot of the elevator as JSON.
+    metrics(): A route to view the metrics of the elevator in the Prometheus text format, or its journeys as JSON.
+    create_session(): A route to start a new, independent simulation.
+    delete_session(str): A route to remove a simulation.
+    session_step(str, int), session_state(str), session_press_button(str), session_create_person(str): The step,
+        state, press button and create person routes of a simulation.
+
+Every change to the elevator is made by a single worker thread, the ticker, and the routes read the snapshot it
+publishes after each change. Setting REAL_TIME steps the elevator at TICK_RATE steps per second on the worker thread,
+with requests applied at the start of the next step. Setting EVENT_LOG_PATH appends every command the ticker accepts to
+an event log, which replay.py replays without the server. Setting CHECKPOINT_PATH saves the elevator as it steps and
+on shutdown, and restores it on startup.
+
+Routes under /sim/<id> drive independent simulations, each with its own ticker, which are saved to disk and dropped
+from memory when they exceed SESSION_MEMORY_BUDGET, least recently used first, and restored when next used.
 """
 
-__version__ = "1.0.1"
+__version__ = "1.22.14"
 
 
+import atexit
 import logging
+import os
+import time
+from collections.abc import Iterable, Iterator
+from functools import partial
+from itertools import islice
 
 from dotenv import load_dotenv
-from flask import Flask, request
-
-from src.classes.elevator import Elevator
-from src.classes.person import Person
-from src.utils.custom_exceptions import InvalidButton, InvalidFloor
+from flask import Flask, g, request
+
+from src.classes.checkpoint import CheckpointFile
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.event_log import EventLog
+from src.classes.instrumentation import Instrumentation
+from src.classes.passenger_table import PassengerTable
+from src.classes.session_registry import SessionNotFound, SessionRegistry
+from src.classes.state_view import StateView
+from src.classes.step_tracer import StepTracer
+from src.classes.ticker import Ticker
+from src.utils import constants, custom_exceptions, serializer
+from src.utils.custom_exceptions import InvalidButton
 
 load_dotenv()
 app = Flask(__name__)
-elevator = Elevator()
-
-
-logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+serializer.use_serializer(os.getenv("JSON_SERIALIZER", constants.JSON_SERIALIZER))
+checkpoint_path: str | None = os.getenv("CHECKPOINT_PATH", constants.CHECKPOINT_PATH)
+checkpoint_file: CheckpointFile | None = (
+    CheckpointFile(
+        checkpoint_path,
+        int(os.getenv("CHECKPOINT_EVERY", str(constants.CHECKPOINT_EVERY))),
+    )
+    if checkpoint_path
+    else None
+)
+# ? A saved elevator is restored as it was, including its number of cars and building.
+elevator = (
+    checkpoint_file.load()
+    if checkpoint_file is not None and checkpoint_file.exists()
+    else ElevatorBank(int(os.getenv("ELEVATOR_CARS", str(constants.ELEVATOR_CARS))))
+)
+
+
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", constants.LOG_LEVEL).upper(), format="%(message)s"
+)
 logger = logging.getLogger("Elevator")
+tracer = StepTracer(
+    logger,
+    sample_every=int(
+        os.getenv("TRACE_SAMPLE_EVERY", str(constants.TRACE_SAMPLE_EVERY))
+    ),
+    buffer_size=int(os.getenv("TRACE_BUFFER_SIZE", str(constants.TRACE_BUFFER_SIZE))),
+)
+# ? Only the ticker changes the elevator, so concurrent requests never interleave inside it.
+real_time: bool = os.getenv("REAL_TIME", str(constants.REAL_TIME)).lower() in (
+    "true",
+    "1",
+)
+instrumentation = Instrumentation(
+    os.getenv("METRICS_ENABLED", str(constants.METRICS_ENABLED)).lower()
+    in ("true", "1")
+)
+instrumentation.instrument(elevator)
+event_log_path: str | None = os.getenv("EVENT_LOG_PATH", constants.EVENT_LOG_PATH)
+event_log: EventLog | None = (
+    EventLog(
+        event_log_path,
+        elevator,
+        checkpoint_every=int(
+            os.getenv(
+                "EVENT_LOG_CHECKPOINT_EVERY", str(constants.EVENT_LOG_CHECKPOINT_EVERY)
+            )
+        ),
+    )
+    if event_log_path
+    else None
+)
+ticker = Ticker(
+    elevator,
+    tick_rate=(
+        float(os.getenv("TICK_RATE", str(constants.TICK_RATE))) if real_time else None
+    ),
+    tracer=tracer,
+    event_log=event_log,
+    checkpoint_file=checkpoint_file,
+)
+ticker.start()
+if event_log is not None:
+    atexit.register(event_log.close)
+if event_log is not None or checkpoint_file is not None:
+    # ? The ticker writes its last steps to the log and saves the elevator as it stops, before the log is closed.
+    atexit.register(ticker.stop, 30)
+# ? Sessions are not instrumented or logged, and are saved to the directory as they are dropped from memory.
+sessions = SessionRegistry(
+    os.getenv("SESSION_DIRECTORY", constants.SESSION_DIRECTORY),
+    int(os.getenv("SESSION_MEMORY_BUDGET", str(constants.SESSION_MEMORY_BUDGET))) << 20,
+    int(os.getenv("SESSION_MAX_CARS", str(constants.SESSION_MAX_CARS))),
+)
+atexit.register(sessions.close)
+
+
+# ? Requests are only timed when enabled, so there is no cost otherwise.
+if instrumentation.enabled:
+
+    @app.before_request
+    def start_timer():
+        """Notes when the handling of a request began."""
+        g.start_time = time.perf_counter()
+
+    @app.after_request
+    def stop_timer(response):
+        """Records the time taken to handle a request."""
+        instrumentation.observe_request(
+            request.endpoint, time.perf_counter() - g.start_time
+        )
+        return response
 
 
 @app.route("/health", methods=["GET"])
@@ -40,47 +157,93 @@ def health_check():
     Health check route to ping for program status.
 
     Responses:
-        - **200 OK**: "Elevator is Online"
+        - **200 OK**: {"message": "Elevator is Online"}
     """
-    return "Elevator is Online", 200
+    return json_response({"message": "Elevator is Online"})
 
 
 @app.route("/step/<int:steps>", methods=["GET"])
 def step(steps: int):
     """
-    Route to submit a request to the elevator system.
+    Route to submit a request to the elevator system. Every car of the elevator bank takes the steps, in addition to
+    any steps taken in real time.
 
     Parameters:
         steps (int): The number of steps to take.
 
+    Query Parameters:
+        trace (str): If "1" or "true", stream a record of each change of a car's state as it steps instead.
+
     Responses:
-        - **200 OK**: "Moved 0 step(s)."
+        - **200 OK**: "Moved 0 step(s).", details show the state of each car and the number of persons at each
+            location.
+        - **200 OK**: With trace, newline delimited JSON of each change of the floor, doors or queue lengths of a car,
+            with the persons who boarded and alighted.
     """
-    response_details: dict = {}
-    person_locations: str | list[str] = ""
-
-    for _ in range(steps):
-        elevator.update()
-        person_locations = [
-            {k: f"There are: {len(v)} persons here"}
-            for k, v in elevator.persons.items()
-            if v
-        ]
-        logger.debug(
-            f"After this step, the elevator is at {elevator.current_floor} and has a status of "
-            f"{'Open' if elevator.is_open else 'Moving'} and a queue of stops for these floors:\nPriority: "
-            f"{elevator.priority_queue}\nUp: {elevator.up_queue}\nDown: {elevator.down_queue}\n{person_locations}"
+    return step_response(ticker, steps)
+
+
+@app.route("/trace", methods=["GET"])
+def trace():
+    """
+    Route to view the most recent snapshots of the elevator, taken as it steps.
+
+    Responses:
+        - **200 OK**: "Showing 0 step snapshot(s).", details show the snapshots from oldest to newest.
+    """
+    # ? Recorded snapshots are never changed, and the buffer is copied in a single call.
+    snapshots: list[dict] = list(tracer.snapshots)
+    return json_stream(
+        {"message": f"Showing {len(snapshots)} step snapshot(s)."},
+        "Snapshots",
+        snapshots,
+    )
+
+
+@app.route("/state", methods=["GET"])
+def state():
+    """
+    Route to read the latest snapshot of the elevator, published after it last changed. Each version of the snapshot
+    has a weak ETag that changes when the cars do, not when only the step does, and each snapshot is only serialized
+    once however often it is read.
+
+    Headers:
+        If-None-Match: The ETag of a version already read, to not receive it again.
+
+    Responses:
+        - **200 OK**: JSON of the version, step and the state of each car, with the ETag of the version.
+        - **304 NOT MODIFIED**: The version with the given ETag is still the latest.
+    """
+    return state_response(ticker)
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """
+    Route to view the metrics of the elevator, in the Prometheus text format.
+
+    Query Parameters:
+        format (str): If "json", show the wait, ride and trip times of completed journeys as JSON instead.
+
+    Responses:
+        - **200 OK**: The counters of each car, the summaries of the journeys, and, when enabled, the time taken by the
+            hot paths of each car and by each route.
+        - **200 OK**: With format=json, "Showing metrics of 0 journey(s).", details show the count, mean, minimum,
+            maximum, p50, p90, p95 and p99 of the wait, ride and trip times.
+    """
+    if request.args.get("format", "").lower() == "json":
+        journeys: dict = ticker.submit(elevator.passengers.journeys.summary).result()
+        return json_response(
+            {
+                "message": f"Showing metrics of {journeys['journeys']} journey(s).",
+                "Journeys": journeys,
+            }
         )
 
-    response_details["details"] = {
-        "Elevator Floor": elevator.current_floor,
-        "Status": "Open" if elevator.is_open else "Moving",
-        "Priority Queue": elevator.priority_queue,
-        "Up Queue": elevator.up_queue,
-        "Down Queue": elevator.down_queue,
-        "Person Locations": person_locations,
-    }
-    return f"Moved {steps} step(s).\n{response_details}", 200
+    return app.response_class(
+        ticker.submit(partial(instrumentation.export, elevator)).result(),
+        mimetype="text/plain; version=0.0.4",
+    )
 
 
 @app.route("/press_button", methods=["POST"])
@@ -90,12 +253,247 @@ def press_button():
 
     Body:
         JSON list of buttons to press, each button must follow the format of
-        {"source": int | str, "button": int | str | [int, str]}.
+        {"source": int | str, "button": int | str | [int, str]}, with an optional key of {"car": int} for buttons
+        pressed inside an elevator. Hall calls are answered by the car chosen by the dispatcher.
 
     Responses:
         - **200 OK**: "Succesfully pressed requested button(s)."
         - **400 OK**: "Submitted button invalid, details show invalid button."
     """
+    return press_button_response(ticker)
+
+
+@app.route("/create_person", methods=["POST"])
+def create_person():
+    """
+    Route to add a person to the elevator system.
+
+    Body:
+        JSON list of persons to add, each person must follow the format of {"origin": int , "destination": int},
+        with optional keys of {"weight": float, "cargo": float}.
+
+    Responses:
+        - **200 OK**: "Succesfully created requested person(s).", details show the number and id range of the persons.
+        - **202 ACCEPTED**: "Succesfully queued requested person(s).", in real time, details show the number of persons.
+        - **400 ERROR**: "Submitted person invalid, details show invalid person."
+    """
+    return create_person_response(ticker)
+
+
+@app.route("/sim", methods=["POST"])
+def create_session():
+    """
+    Starts a new simulation, with its own elevator bank on the first floor, driven by the routes under /sim/<id>.
+
+    Request body (optional):
+        - **id** (str): The id of the simulation, of up to 64 letters, digits, underscores and hyphens. A random id
+          if not given.
+        - **cars** (int): The number of cars in the simulation's elevator bank, from 1 to SESSION_MAX_CARS, defaults
+          to 1.
+
+    Returns:
+        - **201 CREATED**: "Succesfully created simulation.", with the id of the simulation.
+        - **400 ERROR**: "Submitted simulation invalid.", with the error.
+        - **409 CONFLICT**: "Simulation already exists.", with the id of the simulation.
+    """
+    new_request = request.get_json(silent=True) or {}
+    session_id = new_request.get("id")
+    cars = new_request.get("cars", 1)
+    if session_id is not None and not isinstance(session_id, str):
+        return json_response(
+            {
+                "message": "Submitted simulation invalid.",
+                "error": "The id must be a string.",
+            },
+            400,
+        )
+
+    try:
+        session_id = sessions.create(session_id, cars)
+    except ValueError as exc:
+        return json_response(
+            {"message": "Submitted simulation invalid.", "error": str(exc)}, 400
+        )
+    except FileExistsError:
+        return json_response(
+            {"message": "Simulation already exists.", "id": session_id}, 409
+        )
+
+    return json_response(
+        {"message": "Succesfully created simulation.", "id": session_id}, 201
+    )
+
+
+@app.route("/sim/<session_id>", methods=["DELETE"])
+def delete_session(session_id: str):
+    """
+    Removes a simulation from memory and disk.
+
+    Path Parameters:
+        - **session_id** (str): The id of the simulation.
+
+    Returns:
+        - **200 OK**: "Succesfully deleted simulation."
+        - **404 NOT FOUND**: "Simulation does not exist."
+        - **409 CONFLICT**: "Simulation is in use.", while a request to it is being handled.
+    """
+    try:
+        sessions.delete(session_id)
+    except SessionNotFound as exc:
+        return json_response(
+            {"message": "Simulation does not exist.", "error": str(exc)}, 404
+        )
+    except RuntimeError as exc:
+        return json_response(
+            {"message": "Simulation is in use.", "error": str(exc)}, 409
+        )
+
+    return json_response(
+        {"message": "Succesfully deleted simulation.", "id": session_id}
+    )
+
+
+@app.route("/sim/<session_id>/step/<int:steps>", methods=["GET"])
+def session_step(session_id: str, steps: int):
+    """
+    The step route of a simulation, answering as /step/<steps> does, or 404 if the simulation does not exist.
+    """
+    if request.args.get("trace", "").lower() in ("1", "true"):
+        # ? The simulation is kept in memory until the stream of its changes is read.
+        return in_session(
+            session_id,
+            lambda worker: app.response_class(
+                session_changes(session_id, steps), mimetype="application/x-ndjson"
+            ),
+        )
+    return in_session(session_id, step_response, steps)
+
+
+@app.route("/sim/<session_id>/state", methods=["GET"])
+def session_state(session_id: str):
+    """
+    The state route of a simulation, answering as /state does, or 404 if the simulation does not exist.
+    """
+    return in_session(session_id, state_response)
+
+
+@app.route("/sim/<session_id>/press_button", methods=["POST"])
+def session_press_button(session_id: str):
+    """
+    The press button route of a simulation, answering as /press_button does, or 404 if the simulation does not exist.
+    """
+    return in_session(session_id, press_button_response)
+
+
+@app.route("/sim/<session_id>/create_person", methods=["POST"])
+def session_create_person(session_id: str):
+    """
+    The create person route of a simulation, answering as /create_person does, or 404 if the simulation does not
+    exist.
+    """
+    return in_session(session_id, create_person_response)
+
+
+def in_session(session_id: str, respond, *args):
+    """
+    Answers a request to a simulation, which is kept in memory until answered.
+
+    Parameters:
+        session_id (str): The id of the simulation.
+        respond (Callable): Builds the response, given the ticker of the simulation and args.
+        args: Further arguments to respond.
+
+    Returns: The response, or 404 if the simulation does not exist.
+    """
+    try:
+        with sessions.session(session_id) as worker:
+            return respond(worker, *args)
+    except SessionNotFound as exc:
+        return json_response(
+            {"message": "Simulation does not exist.", "error": str(exc)}, 404
+        )
+
+
+def session_changes(session_id: str, steps: int) -> Iterator[bytes]:
+    """
+    Takes steps with the elevator bank of a simulation as the response is read, keeping it in memory until done.
+
+    Parameters:
+        session_id (str): The id of the simulation.
+        steps (int): The number of steps to take.
+
+    Returns: The records of each change of a car's state, as newline delimited JSON.
+    """
+    with sessions.session(session_id) as worker:
+        yield from stream_changes(worker, steps)
+
+
+def step_response(worker: Ticker, steps: int):
+    """
+    Takes steps with the elevator bank of a ticker, for the step routes.
+
+    Parameters:
+        worker (Ticker): The ticker of the elevator bank.
+        steps (int): The number of steps to take.
+
+    Returns: The state of each car, or the stream of records of each change with trace.
+    """
+    if request.args.get("trace", "").lower() in ("1", "true"):
+        return app.response_class(
+            stream_changes(worker, steps), mimetype="application/x-ndjson"
+        )
+
+    worker.submit(partial(take_steps, worker, steps)).result()
+    snapshot: dict = worker.view.state
+
+    # ? The snapshot is never changed, so the details are built as the response streams.
+    return json_stream(
+        {"message": f"Moved {steps} step(s)."},
+        "details",
+        (
+            {
+                "Car": index,
+                "Elevator Floor": car["floor"],
+                "Status": car["status"],
+                "Priority Queue": car["priority_queue"],
+                "Up Queue": car["up_queue"],
+                "Down Queue": car["down_queue"],
+                "Person Locations": car["persons"],
+            }
+            for index, car in enumerate(snapshot["cars"])
+        ),
+    )
+
+
+def state_response(worker: Ticker):
+    """
+    Reads the latest snapshot of the elevator bank of a ticker, for the state routes.
+
+    Parameters:
+        worker (Ticker): The ticker of the elevator bank.
+
+    Returns: The snapshot with its ETag, or 304 if the ETag given is of the latest snapshot.
+    """
+    view: StateView = worker.view
+    # ? The ETag is weak, as the step in the body changes within a version.
+    if request.if_none_match.contains_weak(view.etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(view.body, mimetype="application/json")
+    response.set_etag(view.etag, weak=True)
+    response.cache_control.no_cache = True
+    return response
+
+
+def press_button_response(worker: Ticker):
+    """
+    Presses the buttons in the body of the request in the elevator bank of a ticker, for the press button routes.
+
+    Parameters:
+        worker (Ticker): The ticker of the elevator bank.
+
+    Returns: The buttons pressed, or the first invalid button.
+    """
     new_request = request.get_json()
 
     response_details: dict = {"Buttons": []}
@@ -104,7 +502,9 @@ def press_button():
     # Validate inputs
     for button in new_request:
         try:
-            elevator.process_request(**button)
+            # ? The button is checked now and pressed by the ticker, before any later request.
+            worker.elevator.validate_request(**button)
+            worker.submit(partial(press, worker, **button))
             response_details["Buttons"].append(
                 {"button": button.get("button"), "source": button.get("source")}
             )
@@ -113,60 +513,204 @@ def press_button():
                 {"button": button.get("button"), "source": button.get("source")}
             ]
             response_message = "Submitted button invalid, details show invalid button."
-            return f"{response_message}\n{exc}\n{response_details}", 400
+            return json_response(
+                {"message": response_message, "error": str(exc), **response_details},
+                400,
+            )
 
-    response_message = "Succesfully created requested person(s)."
+    response_message = "Succesfully pressed requested button(s)."
 
-    return f"{response_message}\n{response_details}", 200
+    return json_response({"message": response_message, **response_details})
 
 
-@app.route("/create_person", methods=["POST"])
-def create_person():
+def create_person_response(worker: Ticker):
     """
-    Route to add a person to the elevator system.
+    Adds the persons in the body of the request to the elevator bank of a ticker, for the create person routes.
 
-    Body:
-        JSON list of persons to add, each person must follow the format of {"origin": int , "destination": int},
-        with optional keys of {"weight": float, "cargo": float}.
+    Parameters:
+        worker (Ticker): The ticker of the elevator bank.
 
-    Responses:
-        - **200 OK**: "Succesfully created requested person(s)."
-        - **400 ERROR**: "Submitted person invalid, details show invalid person."
+    Returns: The number and ids of the persons added, or the first invalid person.
     """
     new_request = request.get_json()
 
-    response_details: dict = {"Persons": []}
+    response_details: dict = {}
     response_message: str = ""
 
-    # Validate inputs
-    for person in new_request:
-        try:
-            new_person = Person(**person)
-            elevator.add_person(new_person)
-            response_details["Persons"].append(
-                {
-                    "id": new_person.id,
-                    "origin": new_person.location,
-                    "destination": new_person.destination,
-                    "weight": new_person.weight,
-                    "cargo": new_person.cargo,
-                }
-            )
-        except InvalidFloor as exc:
-            response_details["Persons"] = [
-                {
-                    "origin": person.get("origin"),
-                    "destination": person.get("destination"),
-                    "weight": person.get("weight", "No weight provided"),
-                    "cargo": person.get("weight", "No cargo provided"),
-                }
-            ]
-            response_message = "Submitted person invalid, details show invalid person."
-            return f"{response_message}\n{exc}\n{response_details}", 400
+    # Validate inputs, before any person is added
+    invalid: tuple[int, Exception] | None = (
+        worker.elevator.passengers.invalid_record(new_request)
+        if isinstance(new_request, list)
+        else (-1, custom_exceptions.InvalidPerson())
+    )
+    if invalid is not None:
+        index, exc = invalid
+        return invalid_person_response(
+            new_request[index] if index >= 0 else new_request, exc
+        )
+    origins, destinations, weights, cargo = PassengerTable.columns_from_records(
+        new_request
+    )
+
+    if worker.interval is not None:
+        # ? The persons are added at the start of the next step, so their ids are not yet known.
+        worker.submit(
+            partial(add_persons, worker, origins, destinations, weights, cargo)
+        )
+        response_details["Persons"] = {"Count": len(new_request)}
+        response_message = "Succesfully queued requested person(s)."
+        return json_response({"message": response_message, **response_details}, 202)
+
+    response_details["Persons"] = worker.submit(
+        partial(add_persons, worker, origins, destinations, weights, cargo)
+    ).result()
 
     response_message = "Succesfully created requested person(s)."
 
-    return f"{response_message}\n{response_details}", 200
+    return json_response({"message": response_message, **response_details})
+
+
+def invalid_person_response(person, exc: Exception):
+    """
+    Creates the response to an invalid person submitted to a create person route.
+
+    Parameters:
+        person (dict | object): The first invalid person, or the whole body if it is not a list.
+        exc (Exception): The error describing why the person is invalid.
+
+    Returns: A 400 response showing the invalid person.
+    """
+    return json_response(
+        {
+            "message": "Submitted person invalid, details show invalid person.",
+            "error": str(exc),
+            "Persons": [
+                (
+                    {
+                        "origin": person.get("origin"),
+                        "destination": person.get("destination"),
+                        "weight": person.get("weight", "No weight provided"),
+                        "cargo": person.get("cargo", "No cargo provided"),
+                    }
+                    if isinstance(person, dict)
+                    else person
+                )
+            ],
+        },
+        400,
+    )
+
+
+def json_response(payload: dict, status: int = 200):
+    """
+    Creates a JSON response.
+
+    Parameters:
+        payload (dict): The body of the response.
+        status (int): The status code of the response.
+
+    Returns: The response.
+    """
+    return app.response_class(
+        serializer.to_json(payload), status=status, mimetype="application/json"
+    )
+
+
+def json_stream(fields: dict, key: str, items: Iterable, status: int = 200):
+    """
+    Creates a JSON response whose list of items is serialized and sent in pieces.
+
+    Parameters:
+        fields (dict): The other fields of the body.
+        key (str): The key of the list, after the other fields.
+        items (Iterable): The items of the list, which must not change while the response is sent.
+        status (int): The status code of the response.
+
+    Returns: The streamed response.
+    """
+    return app.response_class(
+        serializer.iter_json(fields, key, items),
+        status=status,
+        mimetype="application/json",
+    )
+
+
+def take_steps(worker: Ticker, steps: int) -> None:
+    """
+    Takes steps with every car of the elevator bank of a ticker, run by the ticker.
+
+    Parameters:
+        worker (Ticker): The ticker of the elevator bank.
+        steps (int): The number of steps to take.
+    """
+    remaining_steps: int = steps
+    # ? Snapshots are only built when they will be logged or buffered, and no more often than sampled.
+    tracing: bool = worker.tracer is not None and worker.tracer.enabled()
+
+    # ? Idle steps and runs of moves through floors where nothing happens are taken at once.
+    while remaining_steps > 0:
+        remaining_steps -= worker.elevator.advance(remaining_steps)
+        if tracing:
+            worker.tracer.record(worker.elevator)
+
+
+def stream_changes(worker: Ticker, steps: int) -> Iterator[bytes]:
+    """
+    Takes steps with the elevator bank of a ticker as the response is read, a batch of records at a time by the
+    ticker.
+
+    Parameters:
+        worker (Ticker): The ticker of the elevator bank.
+        steps (int): The number of steps to take.
+
+    Returns: The records of each change of a car's state, as newline delimited JSON.
+    """
+    changes: Iterator[dict] = StepTracer.changes(worker.elevator, steps)
+    while records := worker.submit(
+        partial(list, islice(changes, serializer.STREAM_BATCH_SIZE))
+    ).result():
+        yield b"".join(serializer.to_json(record) + b"\n" for record in records)
+
+
+def press(worker: Ticker, source, button, car: int = 0) -> None:
+    """
+    Presses a button in the elevator bank of a ticker, run by the ticker, and logs it once accepted.
+
+    Parameters:
+        worker (Ticker): The ticker of the elevator bank.
+        source (int | str): The source of the button press.
+        button (int | str | list[int , str]): The button pressed.
+        car (int): The car the button was pressed in, defaults to the first car.
+    """
+    worker.elevator.process_request(source, button, car)
+    if worker.event_log is not None:
+        worker.event_log.button(source, button, car)
+
+
+def add_persons(worker: Ticker, origins, destinations, weights, cargo) -> dict:
+    """
+    Adds persons to the passenger table and the elevator bank of a ticker, run by the ticker.
+
+    Parameters:
+        worker (Ticker): The ticker of the elevator bank.
+        origins (np.ndarray): The origin of each person.
+        destinations (np.ndarray): The destination of each person.
+        weights (np.ndarray): The weight of each person, NaN to generate.
+        cargo (np.ndarray): The cargo of each person, NaN to generate.
+
+    Returns: The number of persons added and the first and last of their ids.
+    """
+    # ? Weights and cargo are generated for every person in a single draw, and each floor is queued once.
+    passengers: PassengerTable = worker.elevator.passengers
+    rows: range = passengers.extend(origins, destinations, weights, cargo)
+    worker.elevator.add_person_rows(rows)
+    if worker.event_log is not None:
+        worker.event_log.persons(rows)
+    return {
+        "Count": len(rows),
+        "First Id": passengers.ids.item(rows.start) if rows else None,
+        "Last Id": passengers.ids.item(rows.stop - 1) if rows else None,
+    }
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+"""
+benchmark.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Command line entry point for benchmarking the elevator and its routes, saving the results as JSON to compare between
+commits.
+
+Usage:
+    python benchmark.py [--output FILE] [--compare FILE] [--scale S] [--repeat N] [--seed N] [--only NAME ...]
+        [--no-http]
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+
+from benchmark_suite import BenchmarkSuite
+
+
+def git_commit() -> str | None:
+    """
+    Finds the commit being benchmarked.
+
+    Returns: The hash of the checked out commit, or None if it is not known.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> dict:
+    """
+    Parses the command line arguments, runs the benchmarks and prints the results as JSON, comparing them with the
+    results of an earlier run if given.
+
+    Parameters:
+        argv (list[str] | None): The command line arguments, defaults to the arguments the program was run with.
+
+    Returns: The commit, platform and results of the benchmarks, and any comparison.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the elevator and its routes."
+    )
+    parser.add_argument("--output", help="The file to save the results to.")
+    parser.add_argument(
+        "--compare", help="The file of earlier results to compare the results with."
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="The fraction of the default operations of each benchmark.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="The runs of each benchmark."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="The seed of the generated work."
+    )
+    parser.add_argument("--only", nargs="+", help="The benchmarks to run.")
+    parser.add_argument(
+        "--no-http", action="store_true", help="Do not benchmark the routes."
+    )
+    args = parser.parse_args(argv)
+
+    client = None
+    if not args.no_http:
+        # ? Imported here, as importing the app starts its ticker.
+        from app import app  # pylint: disable=import-outside-toplevel
+
+        client = app.test_client()
+
+    report: dict = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "scale": args.scale,
+        "results": BenchmarkSuite(
+            scale=args.scale, repeat=args.repeat, seed=args.seed, client=client
+        ).run(args.only),
+    }
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            report["comparison"] = BenchmarkSuite.compare(
+                report["results"], json.load(file)["results"]
+            )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+"""
+benchmark_suite.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the BenchmarkSuite object, which measures the speed of the elevator state machine and HTTP layer.
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from src.classes.checkpoint import load_checkpoint, save_checkpoint
+from src.classes.elevator import Elevator
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.passenger_table import PassengerTable
+from src.classes.person import Person
+from src.classes.sweep_runner import random_arrivals
+from src.utils.building_config import BuildingConfig
+
+
+class BenchmarkSuite:
+    """
+    Seeded benchmarks of the elevator, each timing a number of operations after any setup, and repeated to find the
+    best and median rate. Routes are only benchmarked when given a Flask test client.
+    """
+
+    def __init__(
+        self, scale: float = 1.0, repeat: int = 3, seed: int = 0, client=None
+    ) -> None:
+        """
+        Attributes:
+            scale (float): The fraction of the default number of operations of each benchmark, for quicker runs.
+            repeat (int): The number of times each benchmark is run.
+            seed (int): The seed of the generated persons and buttons, so every run measures the same work.
+            client (flask.testing.FlaskClient | None): The test client of the app, or None to not benchmark routes.
+        """
+        self.scale: float = scale
+        self.repeat: int = max(1, repeat)
+        self.seed: int = seed
+        self.client = client
+
+    def operations(self, default: int) -> int:
+        """
+        Scales the number of operations of a benchmark.
+
+        Parameters:
+            default (int): The number of operations at full scale.
+
+        Returns: The scaled number of operations, at least 1.
+        """
+        return max(1, int(default * self.scale))
+
+    def benchmarks(self) -> dict[str, tuple[str, Callable[[], tuple[int, float]]]]:
+        """
+        Lists the benchmarks to run.
+
+        Returns: The unit and function of each benchmark by name. Each function returns the number of operations and
+            the seconds they took.
+        """
+        benchmarks: dict[str, tuple[str, Callable[[], tuple[int, float]]]] = {
+            "update_idle": ("steps/s", lambda: self.update_workload(0)),
+            "update_light": ("steps/s", lambda: self.update_workload(0.02)),
+            "update_rush_hour": (
+                "steps/s",
+                lambda: self.update_workload(0.3, lobby=True),
+            ),
+            "update_priority_storm": (
+                "steps/s",
+                lambda: self.update_workload(0.02, priority_every=10),
+            ),
+            "update_stranded": (
+                "steps/s",
+                lambda: self.update_workload(1.0, lobby=True),
+            ),
+        }
+        for queue_size in (10, 100, 1000):
+            benchmarks[f"add_up_stop_{queue_size}"] = (
+                "stops/s",
+                lambda size=queue_size: self.add_stops(size, True),
+            )
+            benchmarks[f"add_down_stop_{queue_size}"] = (
+                "stops/s",
+                lambda size=queue_size: self.add_stops(size, False),
+            )
+        benchmarks["person_construction"] = ("persons/s", self.person_construction)
+        benchmarks["passenger_table_extend"] = ("persons/s", self.passenger_extend)
+        benchmarks["checkpoint_save"] = ("persons/s", lambda: self.checkpoint(False))
+        benchmarks["checkpoint_load"] = ("persons/s", lambda: self.checkpoint(True))
+        if self.client is not None:
+            benchmarks["http_step"] = ("requests/s", self.http_step)
+            benchmarks["http_press_button"] = ("requests/s", self.http_press_button)
+            benchmarks["http_create_person"] = ("requests/s", self.http_create_person)
+        return benchmarks
+
+    def run(self, names: list[str] | None = None) -> list[dict]:
+        """
+        Runs the benchmarks.
+
+        Parameters:
+            names (list[str] | None): The benchmarks to run, or None to run every benchmark.
+
+        Returns: The name, unit, operations per run, and best and median rate of each benchmark, in order.
+        """
+        results: list[dict] = []
+        for name, benchmark in self.benchmarks().items():
+            if names is not None and name not in names:
+                continue
+            rates: list[float] = []
+            operations: int = 0
+            for _ in range(self.repeat):
+                operations, seconds = benchmark[1]()
+                rates.append(operations / seconds if seconds > 0 else float("inf"))
+            results.append(
+                {
+                    "name": name,
+                    "unit": benchmark[0],
+                    "operations": operations,
+                    "best": max(rates),
+                    "median": statistics.median(rates),
+                }
+            )
+        return results
+
+    @staticmethod
+    def compare(results: list[dict], baseline: list[dict]) -> list[dict]:
+        """
+        Compares benchmark results with the results of an earlier run, such as from another commit.
+
+        Parameters:
+            results (list[dict]): The results to compare.
+            baseline (list[dict]): The earlier results.
+
+        Returns: The name, best rate, baseline best rate and relative change of each benchmark in both, where a
+            negative change is a slowdown.
+        """
+        baseline_best: dict[str, float] = {
+            result["name"]: result["best"] for result in baseline
+        }
+        return [
+            {
+                "name": result["name"],
+                "best": result["best"],
+                "baseline": baseline_best[result["name"]],
+                "change": result["best"] / baseline_best[result["name"]] - 1,
+            }
+            for result in results
+            if baseline_best.get(result["name"])
+        ]
+
+    def update_workload(
+        self, arrival_rate: float, lobby: bool = False, priority_every: int = 0
+    ) -> tuple[int, float]:
+        """
+        Steps an elevator one update() at a time while persons arrive at random.
+
+        Parameters:
+            arrival_rate (float): The mean persons arriving per step.
+            lobby (bool): If every person arrives on the first floor, as in a morning rush hour.
+            priority_every (int): Press a random priority button every given number of steps, 0 for none.
+
+        Returns: The number of steps and the seconds they took, including adding the persons as they arrive.
+        """
+        steps: int = self.operations(20000)
+        passengers: PassengerTable = PassengerTable(seed=self.seed)
+        elevator: Elevator = Elevator(passengers)
+        rows, arrivals = self.arrivals(passengers, arrival_rate, steps, lobby)
+        priority_floors: list[int] = passengers.rng.choice(
+            passengers.config.floors, size=steps
+        ).tolist()
+
+        start: float = time.perf_counter()
+        for step in range(steps):
+            if arrivals[step] < arrivals[step + 1]:
+                elevator.add_person_rows(
+                    range(rows.start + arrivals[step], rows.start + arrivals[step + 1])
+                )
+            if priority_every and step % priority_every == 0:
+                elevator.process_request("elevator", [priority_floors[step], "close"])
+            elevator.update()
+        return steps, time.perf_counter() - start
+
+    @staticmethod
+    def arrivals(
+        passengers: PassengerTable, arrival_rate: float, steps: int, lobby: bool
+    ) -> tuple[range, list[int]]:
+        """
+        Adds persons arriving at random to a passenger table, ahead of the steps they arrive at.
+
+        Parameters:
+            passengers (PassengerTable): The table to add the persons to.
+            arrival_rate (float): The mean persons arriving per step.
+            steps (int): The number of steps to draw arrivals for.
+            lobby (bool): If every person arrives on the first floor.
+
+        Returns: The rows of the persons, and the number of persons arriving before each step and after the last.
+        """
+        config: BuildingConfig = passengers.config
+        arrival_steps, origins, destinations = random_arrivals(
+            passengers, arrival_rate, steps
+        )
+        if lobby:
+            origins[:] = 1
+            destinations[destinations == 1] = config.top_floor
+        rows: range = passengers.extend(origins, destinations)
+        return rows, np.searchsorted(arrival_steps, np.arange(steps + 1)).tolist()
+
+    def add_stops(self, queue_size: int, up: bool) -> tuple[int, float]:
+        """
+        Fills an empty queue with stops in a random order, repeatedly.
+
+        Parameters:
+            queue_size (int): The number of stops in a full queue.
+            up (bool): Add up stops above the elevator if true, down stops below the elevator if false.
+
+        Returns: The number of stops added and the seconds they took.
+        """
+        config: BuildingConfig = BuildingConfig(
+            top_floor=queue_size + 1, skipped_floors=()
+        )
+        elevator: Elevator = Elevator(config=config)
+        floors: list[int] = (
+            np.random.default_rng(self.seed).permutation(config.floors[1:]).tolist()
+        )
+        if not up:
+            elevator.current_floor = config.top_floor
+            floors = [floor - 1 for floor in floors]
+        add_stop: Callable[[int], None] = (
+            elevator.add_up_stop if up else elevator.add_down_stop
+        )
+        queue = elevator.up_queue if up else elevator.down_queue
+        repeats: int = max(1, self.operations(20000) // queue_size)
+
+        start: float = time.perf_counter()
+        for _ in range(repeats):
+            for floor in floors:
+                add_stop(floor)
+            queue.clear()
+        return repeats * queue_size, time.perf_counter() - start
+
+    def person_construction(self) -> tuple[int, float]:
+        """
+        Creates persons one at a time, generating their weights and cargo.
+
+        Returns: The number of persons and the seconds they took.
+        """
+        count: int = self.operations(20000)
+        passengers: PassengerTable = PassengerTable(seed=self.seed)
+        origins: list[int] = passengers.random_floors(count).tolist()
+        destinations: list[int] = passengers.random_floors(count).tolist()
+
+        start: float = time.perf_counter()
+        for origin, destination in zip(origins, destinations):
+            Person(origin, destination)
+        return count, time.perf_counter() - start
+
+    def passenger_extend(self) -> tuple[int, float]:
+        """
+        Adds persons to a passenger table in batches, generating their weights and cargo.
+
+        Returns: The number of persons and the seconds they took.
+        """
+        count: int = self.operations(200000)
+        passengers: PassengerTable = PassengerTable(seed=self.seed)
+        origins: np.ndarray = passengers.random_floors(count)
+        destinations: np.ndarray = passengers.random_floors(count)
+
+        start: float = time.perf_counter()
+        for batch in range(0, count, 1000):
+            passengers.extend(
+                origins[batch : batch + 1000], destinations[batch : batch + 1000]
+            )
+        return count, time.perf_counter() - start
+
+    def checkpoint(self, load: bool) -> tuple[int, float]:
+        """
+        Saves, or loads, a checkpoint of an elevator with a crowd waiting on every floor.
+
+        Parameters:
+            load (bool): Time loading the checkpoint if true, saving it if false.
+
+        Returns: The number of waiting persons and the seconds the checkpoint took.
+        """
+        count: int = self.operations(1000000)
+        passengers: PassengerTable = PassengerTable(capacity=count, seed=self.seed)
+        elevator: ElevatorBank = ElevatorBank(passengers=passengers)
+        origins: np.ndarray = passengers.random_floors(count)
+        origins[origins == 1] = passengers.config.top_floor
+        elevator.add_person_rows(passengers.extend(origins, 1))
+
+        start: float = time.perf_counter()
+        data: bytes = save_checkpoint(elevator)
+        if load:
+            start = time.perf_counter()
+            load_checkpoint(data)
+        return count, time.perf_counter() - start
+
+    def http_step(self) -> tuple[int, float]:
+        """
+        Requests a hundred steps at a time from the step route.
+
+        Returns: The number of requests and the seconds they took.
+        """
+        count: int = self.operations(500)
+        start: float = time.perf_counter()
+        for _ in range(count):
+            self.client.get("/step/100")
+        return count, time.perf_counter() - start
+
+    def http_press_button(self) -> tuple[int, float]:
+        """
+        Presses random hall and elevator buttons through the press button route, one button per request.
+
+        Returns: The number of requests and the seconds they took.
+        """
+        count: int = self.operations(500)
+        floors: list[int] = (
+            np.random.default_rng(self.seed)
+            .choice(BuildingConfig().floors, size=count)
+            .tolist()
+        )
+        start: float = time.perf_counter()
+        for index, floor in enumerate(floors):
+            self.client.post(
+                "/press_button",
+                json=[
+                    (
+                        {"source": "elevator", "button": floor}
+                        if index % 2
+                        else {"source": floor, "button": "up"}
+                    )
+                ],
+            )
+        return count, time.perf_counter() - start
+
+    def http_create_person(self) -> tuple[int, float]:
+        """
+        Creates ten random persons per request through the create person route.
+
+        Returns: The number of requests and the seconds they took.
+        """
+        count: int = self.operations(500)
+        floors: list[list[int]] = (
+            np.random.default_rng(self.seed)
+            .choice(BuildingConfig().floors, size=(count, 10, 2))
+            .tolist()
+        )
+        start: float = time.perf_counter()
+        for persons in floors:
+            self.client.post(
+                "/create_person",
+                json=[
+                    {"origin": origin, "destination": destination}
+                    for origin, destination in persons
+                    if origin != destination
+                ],
+            )
+        return count, time.perf_counter() - start
@@ -0,0 +1,62 @@
+"""
+replay.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Command line entry point for replaying an event log of the elevator without the Flask server, to reproduce its state
+at any step.
+
+Usage:
+    python replay.py <log> [--step N] [--session N]
+"""
+
+import argparse
+import json
+import time
+
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.event_log import replay
+from src.classes.step_tracer import StepTracer
+
+
+def main(argv: list[str] | None = None) -> dict:
+    """
+    Parses the command line arguments, replays the log and prints the state of the elevator as JSON.
+
+    Parameters:
+        argv (list[str] | None): The command line arguments, defaults to the arguments the program was run with.
+
+    Returns: The seconds the replay took and the snapshot of the elevator.
+    """
+    parser = argparse.ArgumentParser(
+        description="Replay an event log of the elevator without the server."
+    )
+    parser.add_argument("log", help="The event log to replay.")
+    parser.add_argument(
+        "--step",
+        type=int,
+        help="The step to stop at, after the commands made at it, defaults to the end of the session.",
+    )
+    parser.add_argument(
+        "--session",
+        type=int,
+        default=-1,
+        help="The session to replay, from 0 for the first, defaults to -1 for the last.",
+    )
+    args = parser.parse_args(argv)
+
+    start: float = time.perf_counter()
+    elevator: ElevatorBank = replay(args.log, args.step, args.session)
+    result: dict = {
+        "seconds": time.perf_counter() - start,
+        "state": StepTracer.snapshot(elevator),
+        "persons_created": len(elevator.passengers),
+        "journeys": elevator.passengers.journeys.summary(),
+    }
+    print(json.dumps(result, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+simulate.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Command line entry point for running the elevator state machine headlessly, without the Flask server.
+
+Usage:
+    python simulate.py <steps> [--schedule schedule.json] [--snapshot-every N] [--seed N]
+"""
+
+import argparse
+import json
+
+from src.classes.simulation import Simulation
+
+
+def main(argv: list[str] | None = None) -> dict:
+    """
+    Parses the command line arguments, runs the simulation and prints the results as JSON.
+
+    Parameters:
+        argv (list[str] | None): The command line arguments, defaults to the arguments the program was run with.
+
+    Returns: The aggregate results of the simulation.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run the elevator state machine headlessly."
+    )
+    parser.add_argument("steps", type=int, help="The number of steps to take.")
+    parser.add_argument(
+        "--schedule",
+        help='A JSON file of events keyed by step, e.g. {"0": {"buttons": [...], "persons": [...]}}.',
+    )
+    parser.add_argument(
+        "--snapshot-every",
+        type=int,
+        default=0,
+        help="Record a snapshot of the elevator every given number of steps.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed the generated weights and cargo of persons, for reproducible results.",
+    )
+    args = parser.parse_args(argv)
+
+    schedule: dict = {}
+    if args.schedule:
+        with open(args.schedule, encoding="utf-8") as schedule_file:
+            schedule = json.load(schedule_file)
+
+    results: dict = Simulation(schedule=schedule, seed=args.seed).run(
+        args.steps, args.snapshot_every
+    )
+    print(json.dumps(results, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main()
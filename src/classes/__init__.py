@@ -2,10 +2,28 @@
 classes
 Samuel Koller
 Created: 16 October 2024
-Updated: 16 October 2024
+Updated: 17 October 2026
 
 Contains all classes used for simulating a running elevator.
 """
 
+from .call_index import *
+from .checkpoint import *
+from .dispatcher import *
 from .elevator import *
+from .elevator_bank import *
+from .elevator_load import *
+from .event_log import *
+from .floor_queue import *
+from .instrumentation import *
+from .journey_metrics import *
+from .latency_histogram import *
+from .passenger_table import *
 from .person import *
+from .session_registry import *
+from .simulation import *
+from .state_view import *
+from .step_tracer import *
+from .stop_queue import *
+from .sweep_runner import *
+from .ticker import *
@@ -0,0 +1,103 @@
+"""
+call_index.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the CallIndex object, which tracks the floors an elevator has calls to answer.
+"""
+
+
+class CallIndex:
+    """
+    The calls of an elevator, as a bitset of floors for each kind of call: the floors persons are waiting on to travel
+    upwards, the floors persons are waiting on to travel downwards, and the destinations of the persons riding.
+
+    The index is kept as persons arrive, board and alight, and is not cleared by priority stops, so the stop queues
+    can be rebuilt from it with a few bitwise operations rather than a scan of every floor and person.
+    """
+
+    def __init__(self) -> None:
+        """
+        The index begins with no calls.
+
+        Attributes:
+            up (int): A bitset of the floors with persons waiting to travel upwards, where bit n is floor n.
+            down (int): A bitset of the floors with persons waiting to travel downwards.
+            car (int): A bitset of the destinations of the persons riding.
+        """
+        self.up: int = 0
+        self.down: int = 0
+        self.car: int = 0
+
+    def hall(self, up: bool) -> int:
+        """
+        Finds the hall calls of a direction of travel.
+
+        Parameters:
+            up (bool): The upward calls if true, the downward calls if false.
+
+        Returns: The bitset of floors with persons waiting to travel in that direction.
+        """
+        return self.up if up else self.down
+
+    def waiting(self, floor: int) -> bool:
+        """
+        Checks if persons are waiting on a floor, in either direction.
+
+        Parameters:
+            floor (int): The floor to check.
+
+        Returns: True if persons are waiting on the floor, otherwise False.
+        """
+        return bool((self.up | self.down) >> floor & 1)
+
+    def add_hall(self, floor: int, up: bool) -> None:
+        """
+        Notes that persons are waiting on a floor to travel in a direction.
+
+        Parameters:
+            floor (int): The floor persons are waiting on.
+            up (bool): If the persons are travelling upwards.
+        """
+        if up:
+            self.up |= 1 << floor
+        else:
+            self.down |= 1 << floor
+
+    def remove_hall(self, floor: int, up: bool) -> None:
+        """
+        Notes that no one is left waiting on a floor to travel in a direction.
+
+        Parameters:
+            floor (int): The floor no one is waiting on.
+            up (bool): The direction no one is waiting to travel in.
+        """
+        if up:
+            self.up &= ~(1 << floor)
+        else:
+            self.down &= ~(1 << floor)
+
+    def add_car(self, floor: int) -> None:
+        """
+        Notes that a person riding is travelling to a floor.
+
+        Parameters:
+            floor (int): The destination of the person.
+        """
+        self.car |= 1 << floor
+
+    def remove_car(self, floor: int) -> None:
+        """
+        Notes that no one riding is travelling to a floor.
+
+        Parameters:
+            floor (int): The floor the persons travelling to have alighted at.
+        """
+        self.car &= ~(1 << floor)
+
+    def clear(self) -> None:
+        """Removes every call."""
+        self.up = 0
+        self.down = 0
+        self.car = 0
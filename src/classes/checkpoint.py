@@ -0,0 +1,410 @@
+"""
+checkpoint.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Functions to save the state of an ElevatorBank as bytes and restore it, in a compact, versioned binary format, and the
+class for the CheckpointFile object, which keeps the latest checkpoint on disk.
+"""
+
+import json
+import os
+import struct
+from collections import deque
+
+import numpy as np
+
+from src.classes.dispatcher import Dispatcher
+from src.classes.elevator import Elevator
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.floor_queue import FloorQueue
+from src.classes.latency_histogram import LatencyHistogram
+from src.classes.passenger_table import PassengerTable
+from src.classes.stop_queue import StopQueue
+from src.utils.building_config import BuildingConfig
+from src.utils.id_generator import next_id, set_next_id
+
+CHECKPOINT_MAGIC: bytes = b"ELEVCKPT"
+CHECKPOINT_VERSION: int = 1
+# ? The magic, then the version and length of the JSON header, which describes the arrays that follow it.
+CHECKPOINT_PREFIX: struct.Struct = struct.Struct("<8sHI")
+CAR_COUNTERS: tuple[str, ...] = (
+    "step_count",
+    "boardings",
+    "alightings",
+    "door_openings",
+    "rejected_boardings",
+    "priority_stops",
+)
+JOURNEY_HISTOGRAMS: tuple[str, ...] = ("wait", "ride", "trip")
+
+
+def save_checkpoint(elevator: ElevatorBank) -> bytes:
+    """
+    Saves the state of an elevator bank as a checkpoint.
+
+    Parameters:
+        elevator (ElevatorBank): The elevator bank to save.
+
+    Returns: The checkpoint.
+    """
+    return b"".join(checkpoint_chunks(elevator))
+
+
+def checkpoint_chunks(elevator: ElevatorBank) -> list:
+    """
+    Saves the state of an elevator bank: its building, dispatcher and hall calls, the queues, direction, doors,
+    counters, waiting persons and riders of each car, the passenger table, its random number generator and journey
+    metrics, and the next id to generate.
+    Scalars are kept in a JSON header, and every list of floors or persons is kept as a raw array after it, so the
+    size of a checkpoint grows with the number of persons rather than the number of Python objects.
+
+    Parameters:
+        elevator (ElevatorBank): The elevator bank to save.
+
+    Returns: The pieces of the checkpoint in order, with each array given as a view of its memory rather than a copy.
+    """
+    arrays: dict[str, np.ndarray] = {}
+    passengers: PassengerTable = elevator.passengers
+    for column in PassengerTable.COLUMNS:
+        arrays[f"passengers.{column}"] = getattr(passengers, column)[: passengers.size]
+    histograms: dict[str, dict] = {}
+    for name in JOURNEY_HISTOGRAMS:
+        histogram: LatencyHistogram = getattr(passengers.journeys, name)
+        # ? Most buckets are empty, so only the others are kept.
+        buckets: np.ndarray = np.flatnonzero(histogram.counts)
+        arrays[f"journeys.{name}.buckets"] = buckets
+        arrays[f"journeys.{name}.counts"] = histogram.counts[buckets]
+        histograms[name] = {
+            "significant_bits": histogram.significant_bits,
+            "max_bits": histogram.max_value.bit_length(),
+            "count": histogram.count,
+            "total": histogram.total,
+            "minimum": histogram.minimum,
+            "maximum": histogram.maximum,
+        }
+    arrays["hall_calls"] = np.array(
+        [(floor, up, car) for (floor, up), car in elevator.hall_calls.items()],
+        dtype=np.int64,
+    ).reshape(-1)
+    cars: list[dict] = []
+    for index, car in enumerate(elevator.cars):
+        cars.append(save_car(car, arrays, f"cars.{index}."))
+
+    header: dict = {
+        "config": {
+            "top_floor": elevator.config.top_floor,
+            "max_weight": elevator.config.max_weight,
+            "max_capacity": elevator.config.max_capacity,
+            "skipped_floors": sorted(elevator.config.skipped_floors),
+        },
+        "dispatcher": type(elevator.dispatcher).__name__,
+        "step_count": elevator.step_count,
+        "next_id": next_id(),
+        "passengers": {
+            "size": passengers.size,
+            "rng": passengers.rng.bit_generator.state,
+        },
+        "journeys": histograms,
+        "cars": cars,
+        "arrays": [
+            [name, array.dtype.str, array.size] for name, array in arrays.items()
+        ],
+    }
+    # ? The state of the random number generator holds integers too large for some serializers, so the standard
+    # ? library is used for the header.
+    encoded: bytes = json.dumps(header, separators=(",", ":")).encode()
+    return [
+        CHECKPOINT_PREFIX.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION, len(encoded)),
+        encoded,
+        *(
+            memoryview(np.ascontiguousarray(array)).cast("B")
+            for array in arrays.values()
+        ),
+    ]
+
+
+def save_car(car: Elevator, arrays: dict[str, np.ndarray], prefix: str) -> dict:
+    """
+    Saves the state of a car, adding its lists of floors and persons to the arrays of a checkpoint.
+
+    Parameters:
+        car (Elevator): The car to save.
+        arrays (dict[str, np.ndarray]): The arrays of the checkpoint, by name.
+        prefix (str): The prefix of the names of the car's arrays.
+
+    Returns: The scalars of the car.
+    """
+    floors: list[int] = [floor for floor in car.persons if floor != "elevator"]
+    lanes: list[deque[int]] = [
+        lane
+        for floor in floors
+        for lane in (car.persons[floor].up, car.persons[floor].down)
+    ]
+    arrays[prefix + "up_queue"] = np.array(list(car.up_queue), dtype=np.int64)
+    arrays[prefix + "down_queue"] = np.array(list(car.down_queue), dtype=np.int64)
+    arrays[prefix + "priority_queue"] = np.array(car.priority_queue, dtype=np.int64)
+    arrays[prefix + "waiting_floors"] = np.array(floors, dtype=np.int64)
+    arrays[prefix + "waiting_lengths"] = np.array(
+        [len(lane) for lane in lanes], dtype=np.int64
+    )
+    arrays[prefix + "waiting_rows"] = concatenate(lanes)
+    load = car.persons["elevator"]
+    arrays[prefix + "rider_destinations"] = np.array(
+        list(load.by_destination), dtype=np.int64
+    )
+    arrays[prefix + "rider_lengths"] = np.array(
+        [len(rows) for rows in load.by_destination.values()], dtype=np.int64
+    )
+    arrays[prefix + "rider_weights"] = np.array(
+        list(load.destination_weights.values()), dtype=np.float64
+    )
+    arrays[prefix + "rider_rows"] = concatenate(load.by_destination.values())
+    return {
+        "current_floor": car.current_floor,
+        "direction_up": car.direction_up,
+        "is_open": car.is_open,
+        "up_pivot": [car.up_queue.pivot_floor, car.up_queue.pivot_up],
+        "down_pivot": [car.down_queue.pivot_floor, car.down_queue.pivot_up],
+        "load_weight": load.weight,
+        **{counter: getattr(car, counter) for counter in CAR_COUNTERS},
+    }
+
+
+def concatenate(lists) -> np.ndarray:
+    """
+    Joins lists of rows into a single array.
+
+    Parameters:
+        lists (Iterable[Iterable[int]]): The lists of rows.
+
+    Returns: The rows of every list, in order.
+    """
+    arrays: list[np.ndarray] = [
+        np.fromiter(rows, dtype=np.int64, count=len(rows)) for rows in lists if rows
+    ]
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int64)
+
+
+def load_checkpoint(data: bytes, restore_id: bool = True) -> ElevatorBank:
+    """
+    Restores an elevator bank from a checkpoint, and sets the next id to generate to the id saved with it.
+
+    Parameters:
+        data (bytes): The checkpoint, as made by save_checkpoint().
+        restore_id (bool): If the next id is set to the saved id, otherwise it is only moved past the saved id, so ids
+            are not repeated while other elevators run in the same process.
+
+    Returns: The restored elevator bank.
+    """
+    header, arrays = read_checkpoint(data)
+    passengers: PassengerTable = load_passengers(header, arrays)
+    dispatchers: dict[str, type[Dispatcher]] = {
+        dispatcher.__name__: dispatcher for dispatcher in Dispatcher.__subclasses__()
+    }
+    elevator: ElevatorBank = ElevatorBank(
+        cars=len(header["cars"]),
+        dispatcher=dispatchers[header["dispatcher"]](),
+        passengers=passengers,
+        config=passengers.config,
+    )
+    elevator.step_count = header["step_count"]
+    hall_calls: list[int] = arrays["hall_calls"].tolist()
+    elevator.hall_calls = {
+        (floor, bool(up)): car
+        for floor, up, car in zip(hall_calls[::3], hall_calls[1::3], hall_calls[2::3])
+    }
+    for index, (car, saved) in enumerate(zip(elevator.cars, header["cars"])):
+        load_car(car, saved, arrays, f"cars.{index}.")
+    set_next_id(header["next_id"] if restore_id else max(header["next_id"], next_id()))
+    return elevator
+
+
+def read_checkpoint(data: bytes) -> tuple[dict, dict[str, np.ndarray]]:
+    """
+    Reads the header and arrays of a checkpoint, without copying the arrays.
+
+    Parameters:
+        data (bytes): The checkpoint, as made by save_checkpoint().
+
+    Returns: The header, and the arrays by name.
+    """
+    if len(data) < CHECKPOINT_PREFIX.size or data[:8] != CHECKPOINT_MAGIC:
+        raise ValueError("The data is not an elevator checkpoint.")
+    _, version, header_length = CHECKPOINT_PREFIX.unpack_from(data)
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {version}.")
+    offset: int = CHECKPOINT_PREFIX.size
+    header: dict = json.loads(data[offset : offset + header_length])
+    offset += header_length
+    arrays: dict[str, np.ndarray] = {}
+    for name, dtype, size in header["arrays"]:
+        arrays[name] = np.frombuffer(data, dtype=dtype, count=size, offset=offset)
+        offset += arrays[name].nbytes
+    return header, arrays
+
+
+def load_passengers(header: dict, arrays: dict[str, np.ndarray]) -> PassengerTable:
+    """
+    Restores the passenger table of a checkpoint, with its random number generator and journey metrics.
+
+    Parameters:
+        header (dict): The header of the checkpoint.
+        arrays (dict[str, np.ndarray]): The arrays of the checkpoint, by name.
+
+    Returns: The restored passenger table.
+    """
+    size: int = header["passengers"]["size"]
+    passengers: PassengerTable = PassengerTable(
+        capacity=max(1024, size), config=BuildingConfig(**header["config"])
+    )
+    for column in PassengerTable.COLUMNS:
+        getattr(passengers, column)[:size] = arrays[f"passengers.{column}"]
+    passengers.size = size
+    passengers.rng = np.random.default_rng()
+    passengers.rng.bit_generator.state = header["passengers"]["rng"]
+    for name, saved in header["journeys"].items():
+        histogram: LatencyHistogram = LatencyHistogram(
+            saved["significant_bits"], saved["max_bits"]
+        )
+        histogram.counts[arrays[f"journeys.{name}.buckets"]] = arrays[
+            f"journeys.{name}.counts"
+        ]
+        histogram.count = saved["count"]
+        histogram.total = saved["total"]
+        histogram.minimum = saved["minimum"]
+        histogram.maximum = saved["maximum"]
+        setattr(passengers.journeys, name, histogram)
+    return passengers
+
+
+def load_car(
+    car: Elevator, saved: dict, arrays: dict[str, np.ndarray], prefix: str
+) -> None:
+    """
+    Restores the state of a car from the scalars and arrays of a checkpoint.
+
+    Parameters:
+        car (Elevator): A new car to restore into.
+        saved (dict): The scalars of the car.
+        arrays (dict[str, np.ndarray]): The arrays of the checkpoint, by name.
+        prefix (str): The prefix of the names of the car's arrays.
+    """
+    car.current_floor = saved["current_floor"]
+    car.direction_up = saved["direction_up"]
+    car.is_open = saved["is_open"]
+    for counter in CAR_COUNTERS:
+        setattr(car, counter, saved[counter])
+    for name in ("up", "down"):
+        queue: StopQueue = getattr(car, f"{name}_queue")
+        for floor in arrays[f"{prefix}{name}_queue"].tolist():
+            queue.add(floor, *saved[f"{name}_pivot"])
+    car.priority_queue = arrays[prefix + "priority_queue"].tolist()
+
+    lanes: list[list[int]] = split(
+        arrays[prefix + "waiting_rows"], arrays[prefix + "waiting_lengths"]
+    )
+    for index, floor in enumerate(arrays[prefix + "waiting_floors"].tolist()):
+        waiting: FloorQueue = FloorQueue()
+        waiting.up.extend(lanes[2 * index])
+        waiting.down.extend(lanes[2 * index + 1])
+        car.persons[floor] = waiting
+
+    load = car.persons["elevator"]
+    destinations: list[int] = arrays[prefix + "rider_destinations"].tolist()
+    load.by_destination = dict(
+        zip(
+            destinations,
+            split(arrays[prefix + "rider_rows"], arrays[prefix + "rider_lengths"]),
+        )
+    )
+    load.destination_weights = dict(
+        zip(destinations, arrays[prefix + "rider_weights"].tolist())
+    )
+    load.count = len(arrays[prefix + "rider_rows"])
+    load.weight = saved["load_weight"]
+    car.index_calls()
+
+
+def split(rows: np.ndarray, lengths: np.ndarray) -> list[list[int]]:
+    """
+    Splits an array of rows into lists of the given lengths.
+
+    Parameters:
+        rows (np.ndarray): The rows of every list, in order.
+        lengths (np.ndarray): The length of each list.
+
+    Returns: The lists of rows.
+    """
+    flat: list[int] = rows.tolist()
+    ends: list[int] = np.cumsum(lengths).tolist()
+    return [flat[start:end] for start, end in zip([0] + ends, ends)]
+
+
+class CheckpointFile:
+    """
+    A file holding the latest checkpoint of an elevator bank, replaced whole each time it is saved so a crash while
+    saving leaves the previous checkpoint in place.
+    """
+
+    def __init__(self, path: str, checkpoint_every: int = 0) -> None:
+        """
+        Attributes:
+            path (str): The file the checkpoint is saved to.
+            checkpoint_every (int): The steps between saves when synced, or 0 to only save when asked.
+            saved_step (int | None): The step count of the bank when it was last saved, or None if not yet saved.
+        """
+        self.path: str = path
+        self.checkpoint_every: int = checkpoint_every
+        self.saved_step: int | None = None
+
+    def exists(self) -> bool:
+        """
+        Checks if a checkpoint has been saved to the file.
+
+        Returns: True if the file exists, otherwise False.
+        """
+        return os.path.exists(self.path)
+
+    def load(self, restore_id: bool = True) -> ElevatorBank:
+        """
+        Restores the elevator bank saved in the file, and the next id to generate.
+
+        Parameters:
+            restore_id (bool): If the next id is set to the saved id, otherwise it is only moved past the saved id.
+
+        Returns: The restored elevator bank.
+        """
+        with open(self.path, "rb") as file:
+            elevator: ElevatorBank = load_checkpoint(file.read(), restore_id)
+        self.saved_step = elevator.step_count
+        return elevator
+
+    def save(self, elevator: ElevatorBank) -> None:
+        """
+        Saves a checkpoint of an elevator bank, replacing the file once the checkpoint is fully written.
+
+        Parameters:
+            elevator (ElevatorBank): The elevator bank to save.
+        """
+        partial_path: str = self.path + ".partial"
+        with open(partial_path, "wb") as file:
+            file.writelines(checkpoint_chunks(elevator))
+        os.replace(partial_path, self.path)
+        self.saved_step = elevator.step_count
+
+    def sync(self, elevator: ElevatorBank) -> None:
+        """
+        Saves a checkpoint of an elevator bank if it has taken the given number of steps since it was last saved.
+
+        Parameters:
+            elevator (ElevatorBank): The elevator bank to save.
+        """
+        if self.saved_step is None:
+            self.saved_step = elevator.step_count
+        if (
+            self.checkpoint_every
+            and elevator.step_count - self.saved_step >= self.checkpoint_every
+        ):
+            self.save(elevator)
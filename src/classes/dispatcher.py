@@ -0,0 +1,89 @@
+"""
+dispatcher.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Classes for the Dispatcher objects, which choose the car of an ElevatorBank that answers a hall call.
+"""
+
+from abc import ABC, abstractmethod
+
+from src.classes.elevator import Elevator
+
+
+# pylint: disable-next=too-few-public-methods
+class Dispatcher(ABC):
+    """
+    Chooses the car that answers a hall call. Strategies must implement assign().
+    """
+
+    @abstractmethod
+    def assign(self, cars: list[Elevator], floor: int, up: bool) -> int:
+        """
+        Chooses a car to answer a hall call.
+
+        Parameters:
+            cars (list[Elevator]): The cars of the bank.
+            floor (int): The floor the call was made from.
+            up (bool): If the call is to travel upwards.
+
+        Returns: The index of the chosen car.
+        """
+
+
+# pylint: disable-next=too-few-public-methods
+class NearestCarDispatcher(Dispatcher):
+    """
+    Answers a hall call with the car closest to the floor, regardless of its direction or stops.
+    """
+
+    def assign(self, cars: list[Elevator], floor: int, up: bool) -> int:
+        return min(
+            range(len(cars)),
+            key=lambda index: cars[index].config.distance(
+                cars[index].current_floor, floor
+            ),
+        )
+
+
+class EtaDispatcher(Dispatcher):
+    """
+    Answers a hall call with the car estimated to arrive first, following each car's queued stops in order.
+    """
+
+    def assign(self, cars: list[Elevator], floor: int, up: bool) -> int:
+        return min(
+            range(len(cars)),
+            key=lambda index: self.estimate_arrival(cars[index], floor, up),
+        )
+
+    def estimate_arrival(self, car: Elevator, floor: int, up: bool) -> int:
+        """
+        Estimates the number of steps before a car reaches a floor while travelling in a direction. Each queued stop
+        before the floor costs the moves to reach it and a step with the doors open.
+
+        Parameters:
+            car (Elevator): The car to estimate for.
+            floor (int): The floor the call was made from.
+            up (bool): If the call is to travel upwards.
+
+        Returns: The estimated number of steps.
+        """
+        stops: list[int] = list(car.priority_queue)
+        if car.direction_up:
+            stops += list(car.up_queue) + list(car.down_queue)
+        else:
+            stops += list(car.down_queue) + list(car.up_queue)
+
+        position: int = car.current_floor
+        steps: int = 0
+        for stop in stops:
+            # ? The car answers the call on the way if it passes the floor travelling in the same direction.
+            if min(position, stop) <= floor <= max(position, stop) and (
+                (stop > position) == up or floor == stop
+            ):
+                break
+            steps += car.config.distance(position, stop) + 1
+            position = stop
+        return steps + car.config.distance(position, floor)
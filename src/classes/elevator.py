@@ -2,49 +2,90 @@
 elevator.py
 Samuel Koller
 Created: 17 October 2024
-Updated: 23 October 2024
+Updated: 17 October 2026
 
 Class for the Elevator object, which tracks the state an contents of the elevator.
 """
 
-import bisect
 import logging
+from collections import deque
 
+import numpy as np
+
+from src.classes.call_index import CallIndex
+from src.classes.elevator_load import ElevatorLoad
+from src.classes.floor_queue import FloorQueue
+from src.classes.passenger_table import PassengerTable
 from src.classes.person import Person
-from src.utils.constants import MAX_CAPACITY, MAX_WEIGHT, TOP_FLOOR
+from src.classes.stop_queue import StopQueue
+from src.utils.building_config import BuildingConfig
 from src.utils.custom_exceptions import InvalidButton
 
 logger = logging.Logger("Elevator")
 
 
+# pylint: disable-next=too-many-public-methods,too-many-instance-attributes
 class Elevator:
     """
-    Transports Person objects to their requested destination.
+    Transports persons, held as rows of a PassengerTable, to their requested destination.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        passengers: PassengerTable | None = None,
+        config: BuildingConfig | None = None,
+    ) -> None:
         """
         The elevator object begins with open doors and empty queues, on the first floor, and in the upward direction.
 
         Attributes:
-            up_queue (list[int]): A priority queue of floors in the upward direction to stop at, priority is determined
-                by closest floor in direction of travel.
-            down_queue (list[int]): A priority queue of floors in the downward direction to stop at, priority is
+            up_queue (StopQueue): A priority queue of floors in the upward direction to stop at, priority is
+                determined by closest floor in direction of travel.
+            down_queue (StopQueue): A priority queue of floors in the downward direction to stop at, priority is
                 determined by closest floor in direction of travel.
             priority_queue (list[int]): A priority queue of floors in the the have been prioritized due to an
                 emergency, priority is determined by order of floors queued.
             current_floor (int): The current floor the elevator is on.
             direction_up (bool): The current direction of the elevator.
             is_open (bool): The status of the doors.
-            persons (dict): A dictionary containing persons at each floor and in the elevator.
+            step_count (int): The number of steps the elevator has taken.
+            boardings (int): The number of persons who have boarded the elevator.
+            alightings (int): The number of persons who have alighted the elevator.
+            door_openings (int): The number of times the closed doors have opened.
+            rejected_boardings (int): The number of waiting persons left behind at a stop, as boarding them would
+                breach the weight or capacity limit, counted once per stop as the elevator leaves the floor.
+            priority_stops (int): The number of priority stops made.
+            persons (dict): A dictionary containing the FloorQueue of persons waiting at each floor and the
+                ElevatorLoad of persons in the elevator.
+            calls (CallIndex): The floors persons are waiting on in each direction and the destinations of the
+                persons riding, kept through priority stops so the queues can be rebuilt after them.
+            passengers (PassengerTable): The table of persons the rows in persons refer to, a new table if none is
+                given.
+            config (BuildingConfig): The building the elevator serves, the building of the passenger table if none is
+                given.
         """
-        self.up_queue: list[int] = []
-        self.down_queue: list[int] = []
+        self.up_queue: StopQueue = StopQueue()
+        self.down_queue: StopQueue = StopQueue()
         self.priority_queue: list[int] = []
         self.current_floor: int = 1
         self.direction_up: bool = True
         self.is_open: bool = True
-        self.persons: dict = {"elevator": []}
+        self.step_count: int = 0
+        self.boardings: int = 0
+        self.alightings: int = 0
+        self.door_openings: int = 0
+        self.rejected_boardings: int = 0
+        self.priority_stops: int = 0
+        self.persons: dict = {"elevator": ElevatorLoad()}
+        self.calls: CallIndex = CallIndex()
+        if config is None and passengers is not None:
+            config = passengers.config
+        self.passengers: PassengerTable = (
+            passengers if passengers is not None else PassengerTable(config=config)
+        )
+        self.config: BuildingConfig = (
+            self.passengers.config if config is None else config
+        )
 
     def process_request(self, source, button) -> None:
         """
@@ -54,6 +95,20 @@ class Elevator:
             source (int | str): The source of the button press.
             button (int | str | list[int , str]): The button pressed.
         """
+        source, button, priority = self.parse_request(source, button)
+        self.process_button(source, button, priority)
+
+    def parse_request(self, source, button) -> tuple[int | str, int | str, bool]:
+        """
+        Ensures the button combination is valid without taking any action, so requests can be checked before they are
+        processed.
+
+        Parameters:
+            source (int | str): The source of the button press.
+            button (int | str | list[int , str]): The button pressed.
+
+        Returns: The source, the button with any priority combination reduced to its floor, and if it was prioritized.
+        """
         priority: bool = False
 
         # Check for priority queuing
@@ -62,57 +117,50 @@ class Elevator:
                 priority = True
                 # ? This is done here to return the correct argument in press_button() in app.py
                 # Make sure a number is at the beginning, when taking first index.
-                if (
-                    13 in button
-                    or not 1
-                    <= sorted(button, key=lambda x: (isinstance(x, str), x))[0]
-                    <= TOP_FLOOR
+                if any(
+                    floor in self.config.skipped_floors for floor in button
+                ) or not self.config.is_floor(
+                    sorted(button, key=lambda x: (isinstance(x, str), x))[0]
                 ):
                     raise InvalidButton()
                 button = sorted(button, key=lambda x: (isinstance(x, str), x))
                 button: int = button[0]
 
-        self.process_button(source, button, priority)
-
-    # pylint: disable=too-many-branches
-    def process_button(self, source, button, priority: bool) -> None:
-        """
-        Ensures button combination is valid and takes the appropriate action.
-
-        Parameters:
-            source (int | str): The source of the button press.
-            button (int | str | list[int , str]): The button pressed.
-            priority (bool): If the button was prioritized.
-        """
         if isinstance(button, list) or isinstance(source, list):
             raise InvalidButton()
         if isinstance(source, int):
-            if source == 13 or not 1 <= source <= TOP_FLOOR:
+            if not self.config.is_floor(source):
                 raise InvalidButton()
-            if isinstance(button, str):
-                if button.lower() == "down":
-                    self.add_down_stop(source)
-                elif button.lower() == "up":
-                    self.add_up_stop(source)
-                else:
-                    raise InvalidButton()
-            else:
+            if not isinstance(button, str) or button.lower() not in ("up", "down"):
                 raise InvalidButton()
-
-        if isinstance(source, str):
+        elif isinstance(source, str):
             if source.lower() != "elevator":
                 raise InvalidButton()
-            if isinstance(button, int):
-                if button == 13 or not 1 <= button <= TOP_FLOOR:
-                    raise InvalidButton()
-                self.add_stop(button, priority)
-            else:
+            if not isinstance(button, int) or not self.config.is_floor(button):
                 raise InvalidButton()
+        else:
+            raise InvalidButton()
+        return source, button, priority
+
+    def process_button(self, source, button, priority: bool) -> None:
+        """
+        Takes the appropriate action for a button combination checked by parse_request().
 
-    # pylint: enable=too-many-branches
+        Parameters:
+            source (int | str): The source of the button press.
+            button (int | str): The button pressed.
+            priority (bool): If the button was prioritized.
+        """
+        if isinstance(source, str):
+            self.add_stop(button, priority)
+        elif button.lower() == "down":
+            self.add_down_stop(source)
+        else:
+            self.add_up_stop(source)
 
     def update(self) -> None:
         """Determines what the next action for the elevator is."""
+        self.step_count += 1
         if len(self.priority_queue) == len(self.up_queue) == len(self.down_queue) == 0:
             return
         if self.priority_queue:
@@ -124,12 +172,102 @@ class Elevator:
         elif not self.direction_up:
             self.down_update()
 
+    def fast_forward(self, steps: int) -> None:
+        """
+        Progresses the elevator by the given number of steps, the same as calling update() for each step, but jumping
+        through runs of moves at once.
+
+        Parameters:
+            steps (int): The number of steps to take.
+        """
+        while steps > 0:
+            steps -= self.advance(steps)
+
+    def advance(self, max_steps: int) -> int:
+        """
+        Takes the next action of the elevator. If the elevator is idle, or moving through floors where nothing happens,
+        every step until the next action is taken at once.
+
+        Parameters:
+            max_steps (int): The maximum number of steps to take.
+
+        Returns: The number of steps taken.
+        """
+        if len(self.priority_queue) == len(self.up_queue) == len(self.down_queue) == 0:
+            self.step_count += max_steps
+            return max_steps
+
+        move_run: tuple[int, bool] | None = self.next_move_run()
+        if move_run is None:
+            self.update()
+            return 1
+
+        target, up = move_run
+        low, high = sorted((self.current_floor, target))
+        # ? Persons waiting on a passed floor are requeued when the elevator leaves it, so the run stops there.
+        waiting_floors: int = (
+            (self.calls.up | self.calls.down) & ((1 << high) - 1) & -(1 << (low + 1))
+        )
+        if waiting_floors:
+            target = (
+                (waiting_floors & -waiting_floors).bit_length() - 1
+                if up
+                else waiting_floors.bit_length() - 1
+            )
+            low, high = sorted((self.current_floor, target))
+
+        # ? Skipped floors are passed within the same step as the floor before them.
+        steps: int = self.config.distance(low, high)
+        if steps > max_steps:
+            steps = max_steps
+            target = self.config.floor_after(self.current_floor, steps, up)
+
+        if self.priority_queue:
+            self.down_queue.clear()
+            self.up_queue.clear()
+        self.is_open = False
+        self.current_floor = target
+        self.direction_up = target != self.config.top_floor if up else target == 1
+        self.step_count += steps
+        return steps
+
+    def next_move_run(self) -> tuple[int, bool] | None:
+        """
+        Determines the run of moves the next update() begins, during which only the current floor changes.
+
+        Returns: The floor the run ends at and whether the run is upwards, or None if the next step does not begin a
+            run.
+        """
+        if self.calls.waiting(self.current_floor):
+            return None
+        if self.priority_queue:
+            target: int = self.priority_queue[0]
+            up: bool = target > self.current_floor
+        elif self.direction_up:
+            # ? With no up stops, the elevator moves up to the next down stop.
+            target: int = (
+                self.up_queue.peek() if self.up_queue else self.down_queue.peek()
+            )
+            up: bool = True
+        else:
+            target: int = (
+                self.down_queue.peek() if self.down_queue else self.up_queue.peek()
+            )
+            up: bool = False
+
+        if target == self.current_floor or (target > self.current_floor) != up:
+            return None
+        while target in self.config.skipped_floors:
+            target += 1 if up else -1
+        return target, up
+
     def priority_update(self) -> None:
         """Called when there is an item in the priority queue, determines action to take."""
-        self.down_queue = []
-        self.up_queue = []
+        self.down_queue.clear()
+        self.up_queue.clear()
         if self.current_floor == self.priority_queue[0]:
             self.priority_queue.pop(0)
+            self.priority_stops += 1
             self.open()
         elif self.priority_queue[0] > self.current_floor:
             self.move(True)
@@ -141,10 +279,11 @@ class Elevator:
     def up_update(self) -> None:
         """Called when the current direction of the elevator is up, determines action to take."""
         if self.up_queue:
-            if self.current_floor == self.up_queue[0]:
-                self.up_queue.pop(0)
+            next_stop: int = self.up_queue.peek()
+            if self.current_floor == next_stop:
+                self.up_queue.popleft()
                 self.open()
-            elif self.up_queue[0] > self.current_floor:
+            elif next_stop > self.current_floor:
                 self.move(True)
                 # ? If the next item in the up_queue is below the current floor, start going down
                 # ? The down_queue will be read next
@@ -152,7 +291,12 @@ class Elevator:
                 self.move(False)
         else:
             if self.down_queue:
-                if self.down_queue[0] < self.current_floor:
+                # ? With no up stops left, the elevator turns at a down stop on the current floor, unless at the bottom.
+                if self.down_queue.peek() == self.current_floor:
+                    self.down_queue.popleft()
+                    self.direction_up = self.current_floor == 1
+                    self.open()
+                elif self.down_queue.peek() < self.current_floor:
                     self.move(False)
                 else:
                     self.move(True)
@@ -160,10 +304,11 @@ class Elevator:
     def down_update(self) -> None:
         """Called when the current direction of the elevator is down, determines action to take."""
         if self.down_queue:
-            if self.current_floor == self.down_queue[0]:
-                self.down_queue.pop(0)
+            next_stop: int = self.down_queue.peek()
+            if self.current_floor == next_stop:
+                self.down_queue.popleft()
                 self.open()
-            elif self.down_queue[0] < self.current_floor:
+            elif next_stop < self.current_floor:
                 self.move(False)
             # ? If the next item in the down_queue is aboce the current floor, start going up
             # ? The up_queue will be read next
@@ -171,71 +316,63 @@ class Elevator:
                 self.move(True)
         else:
             if self.up_queue:
-                if self.up_queue[0] < self.current_floor:
+                # ? With no down stops left, the elevator turns at an up stop on the current floor, unless at the top.
+                if self.up_queue.peek() == self.current_floor:
+                    self.up_queue.popleft()
+                    self.direction_up = self.current_floor != self.config.top_floor
+                    self.open()
+                elif self.up_queue.peek() < self.current_floor:
                     self.move(False)
                 else:
                     self.move(True)
 
-    def open(self) -> None:
+    def open(self, turned: bool = False) -> None:
         """
         Opens the doors.
 
         When the elevator is open, it exchanges persons. If the person's destination is the current floor, they are
         off boarded, if there are persons waiting to board, they board without breaching the limits.
+
+        Parameters:
+            turned (bool): If the elevator has already switched direction at this opening, defaults to false.
         """
+        if not self.is_open:
+            self.door_openings += 1
         self.is_open = True
-        self.persons["elevator"] = [
-            person
-            for person in self.persons["elevator"]
-            if person.destination != self.current_floor
-        ]
-
-        total_weight: float = sum(
-            person.weight + person.cargo for person in self.persons["elevator"]
-        )
-        entering_person_index: int = 0
-        while (
-            total_weight < MAX_WEIGHT
-            and self.persons.get(self.current_floor)
-            and len(self.persons.get(self.current_floor)) > entering_person_index
-            and len(self.persons["elevator"]) < MAX_CAPACITY
-        ):
-            entering_person: Person = self.persons[self.current_floor][
-                entering_person_index
-            ]
-            if (
-                entering_person.destination > self.current_floor
-                and self.direction_up
-                or entering_person.destination < self.current_floor
-                and not self.direction_up
-            ):
-                if (
-                    total_weight + entering_person.weight + entering_person.cargo
-                    <= MAX_WEIGHT
-                ):
-                    self.persons[self.current_floor].pop(0)
-                    self.persons["elevator"].append(entering_person)
-                    self.add_stop(entering_person.destination)
-                    total_weight = sum(
-                        person.weight + person.cargo
-                        for person in self.persons["elevator"]
-                    )
-                else:
-                    break
-            entering_person_index += 1
+        load: ElevatorLoad = self.persons["elevator"]
+        alighting_rows: list[int] = load.alight(self.current_floor)
+        if alighting_rows:
+            self.passengers.alight(alighting_rows, self.step_count)
+            self.alightings += len(alighting_rows)
+            self.calls.remove_car(self.current_floor)
+
+        waiting: FloorQueue | None = self.persons.get(self.current_floor)
+        if not waiting:
+            return
+        lane: deque[int] = waiting.lane(self.direction_up)
+        max_weight: float = self.config.max_weight
+        max_capacity: int = self.config.max_capacity
+        while lane and load.weight < max_weight and len(load) < max_capacity:
+            entering_weight: float = self.passengers.load(lane[0])
+            if load.weight + entering_weight > max_weight:
+                break
+            entering_row: int = lane.popleft()
+            self.passengers.board_steps[entering_row] = self.step_count
+            self.boardings += 1
+            destination: int = self.passengers.destination(entering_row)
+            load.board(entering_row, destination, entering_weight)
+            self.calls.add_car(destination)
+            self.add_stop(destination)
+        if not lane:
+            self.calls.remove_hall(self.current_floor, self.direction_up)
 
         # If no one is in the elevator but there are people waiting to get on, the elevator must be switching direction.
-        if len(self.persons.get("elevator")) == 0 and len(
-            self.persons.get(self.current_floor, [])
-        ):
+        # ? It switches once, as a person who can not board alone would otherwise switch it back and forth forever.
+        if len(load) == 0 and waiting and not turned:
             self.direction_up = not self.direction_up
-            self.open()
-            self.up_queue = [
-                stop for stop in self.up_queue if stop != self.current_floor
-            ]
-            self.down_queue = [
-                stop for stop in self.down_queue if stop != self.current_floor
-            ]
+            self.open(turned=True)
+            self.up_queue.discard(self.current_floor)
+            self.down_queue.discard(self.current_floor)
 
     def move(self, up: bool) -> None:
         """
@@ -244,6 +381,13 @@ class Elevator:
         Parameters:
             up (bool): Move up if true, move down if false.
         """
+        # ? Persons still waiting to travel the way the elevator leaves an open floor were left behind at the stop,
+        # ? counted once as it leaves however many times the doors opened for them.
+        if self.is_open and self.direction_up == up:
+            waiting: FloorQueue | None = self.persons.get(self.current_floor)
+            if waiting:
+                self.rejected_boardings += len(waiting.lane(up))
+
         if up:
             self.move_up()
         else:
@@ -251,16 +395,10 @@ class Elevator:
 
         previous_floor: int = self.current_floor - (1 if up else -1)
         # ? If people were unable to board on the previous floor, requeue the previous floor.
-        if self.persons.get(previous_floor, []):
-            # pylint: disable=expression-not-assigned
-            [
-                self.add_person_stop(person)
-                for person in self.persons.get(previous_floor, [])
-            ]
-            # pylint: enable=expression-not-assigned
-
-        # ? Skip the 13th floor by moving again.
-        if self.current_floor == 13:
+        self.add_floor_stops(previous_floor)
+
+        # ? Skip floors that do not exist, such as the 13th floor, by moving again.
+        if self.current_floor in self.config.skipped_floors:
             self.move(up)
 
     def move_up(self) -> None:
@@ -268,7 +406,7 @@ class Elevator:
         self.is_open = False
         self.direction_up = True
         self.current_floor += 1
-        if self.current_floor == TOP_FLOOR:
+        if self.current_floor == self.config.top_floor:
             self.direction_up = False
 
     def move_down(self) -> None:
@@ -306,7 +444,7 @@ class Elevator:
 
         Returns: True if the stop is a valid floor, otherwise False.
         """
-        if not 0 < stop <= TOP_FLOOR:
+        if not 0 < stop <= self.config.top_floor:
             return False
         if stop == self.current_floor:
             self.open()
@@ -320,21 +458,9 @@ class Elevator:
         Parameters:
             stop (int): The stop to be queued in the downward direction.
         """
-        if not self.validate_stop(stop) or stop in self.up_queue:
+        if not self.validate_stop(stop):
             return
-        up_stops: list[int] = self.up_queue
-        up_stops.append(stop)
-        up_stops.sort()
-        split_index: int = bisect.bisect_left(up_stops, self.current_floor)
-
-        if self.direction_up:
-            on_way: list[int] = up_stops[split_index:]
-            on_return: list[int] = list(reversed(up_stops[:split_index]))
-        else:
-            on_way: list[int] = list(reversed(up_stops[:split_index]))
-            on_return: list[int] = up_stops[split_index:]
-
-        self.up_queue = on_way + on_return
+        self.up_queue.add(stop, self.current_floor, self.direction_up)
 
     def add_down_stop(self, stop: int) -> None:
         """
@@ -343,52 +469,152 @@ class Elevator:
         Parameters:
             stop (int): The stop to be queued in the upward direction.
         """
-        if not self.validate_stop(stop) or stop in self.down_queue:
+        if not self.validate_stop(stop):
             return
-        down_stops: list[int] = self.down_queue
-        down_stops.append(stop)
-        down_stops.sort()
-        split_index: int = bisect.bisect_left(down_stops, self.current_floor)
-
-        if self.direction_up:
-            on_way: list[int] = down_stops[split_index:]
-            on_return: list[int] = down_stops[:split_index][::-1]
-        else:
-            on_way: list[int] = down_stops[:split_index][::-1]
-            on_return: list[int] = down_stops[split_index:]
-
-        self.down_queue = on_way + on_return
+        self.down_queue.add(stop, self.current_floor, self.direction_up)
 
-    def add_person(self, person: Person) -> None:
+    def add_person(self, person: Person) -> int:
         """
-        Adds a person to the elevator and queues their location.
+        Adds a person to the passenger table and the elevator system, and queues their location.
 
         Parameters:
             person (Person): The person to add to the elevator.
+
+        Returns: The row of the person in the passenger table.
         """
-        self.persons.setdefault(person.location, []).append(person)
+        row: int = self.passengers.append(person)
+        self.add_person_row(row)
+        return row
+
+    def add_person_row(self, row: int) -> None:
+        """
+        Adds a person already in the passenger table to the elevator system and queues their location.
+
+        Parameters:
+            row (int): The row of the person to add.
+        """
+        location: int = self.passengers.origins.item(row)
+        self.passengers.spawn_steps[row] = self.step_count
+        waiting: FloorQueue | None = self.persons.get(location)
+        if waiting is None:
+            waiting = self.persons[location] = FloorQueue()
+        up: bool = self.passengers.going_up(row)
+        waiting.add(row, up)
+        self.calls.add_hall(location, up)
         # ? If the added person is on the floor of the current elevator and it is open, load immediately.
-        if person.location == self.current_floor and self.is_open:
+        if location == self.current_floor and self.is_open:
             self.open()
-        else:
-            self.add_person_stop(person)
+        # ? Persons joining a call already queued do not queue it again, unless on the floor of the closed elevator.
+        elif location == self.current_floor or location not in (
+            self.up_queue if up else self.down_queue
+        ):
+            self.add_person_stop(row)
 
-    def add_person_stop(self, person: Person) -> None:
+    def add_person_rows(self, rows: range | np.ndarray) -> None:
+        """
+        Adds many persons already in the passenger table to the elevator system at once, queueing each floor and
+        direction they are waiting to travel in a single time.
+
+        Parameters:
+            rows (range | np.ndarray): The rows of the persons to add, in order of arrival.
+        """
+        if isinstance(rows, range):
+            rows = np.arange(rows.start, rows.stop)
+        self.passengers.spawn_steps[rows] = self.step_count
+        origins: np.ndarray = self.passengers.origins[rows]
+        going_up: np.ndarray = origins < self.passengers.destinations[rows]
+        # ? Group the persons by floor and direction, keeping their order of arrival within each group.
+        lane_keys: np.ndarray = origins.astype(np.int64) * 2 + going_up
+        order: np.ndarray = np.argsort(lane_keys, kind="stable")
+        sorted_keys: list[int] = lane_keys[order].tolist()
+        sorted_rows: list[int] = rows[order].tolist()
+        bounds: list[int] = np.flatnonzero(
+            np.diff(lane_keys[order], prepend=-1)
+        ).tolist() + [len(sorted_rows)]
+
+        open_doors: bool = False
+        for start, end in zip(bounds, bounds[1:]):
+            location, up = divmod(sorted_keys[start], 2)
+            waiting: FloorQueue | None = self.persons.get(location)
+            if waiting is None:
+                waiting = self.persons[location] = FloorQueue()
+            waiting.lane(bool(up)).extend(sorted_rows[start:end])
+            self.calls.add_hall(location, bool(up))
+            if location == self.current_floor:
+                open_doors = True
+            elif up:
+                self.add_up_stop(location)
+            else:
+                self.add_down_stop(location)
+
+        # ? Persons added on the floor of the current elevator are loaded immediately.
+        if open_doors:
+            self.open()
+
+    def add_person_stop(self, row: int) -> None:
         """
         Adds the person's floor to the correct queue.
 
         Parameters:
-            person (Person): The person's stop to add.
+            row (int): The row of the person whose stop to add.
         """
-        if person.location < person.destination:
-            self.add_up_stop(person.location)
+        location: int = self.passengers.origins.item(row)
+        if self.passengers.going_up(row):
+            self.add_up_stop(location)
         else:
-            self.add_down_stop(person.location)
+            self.add_down_stop(location)
+
+    def add_floor_stops(self, floor: int) -> None:
+        """
+        Adds a floor to the queue of each direction persons are waiting to travel in from it. Only the call flags of
+        the floor are read, and a floor already queued is left as it is, so this takes the same time however many
+        persons are waiting.
+
+        Parameters:
+            floor (int): The floor to add.
+        """
+        if self.calls.up >> floor & 1 and (
+            floor not in self.up_queue or floor == self.current_floor
+        ):
+            self.add_up_stop(floor)
+        if self.calls.down >> floor & 1 and (
+            floor not in self.down_queue or floor == self.current_floor
+        ):
+            self.add_down_stop(floor)
 
     def requeue_all(self) -> None:
-        """Called after the elevator clears it's priority queue to requeue all persons in the simulation."""
-        for person in self.persons["elevator"]:
-            self.add_stop(person.destination)
-        for i in range(1, TOP_FLOOR + 1):
-            for person in self.persons.get(i, []):
-                self.add_person_stop(person)
+        """
+        Called after the elevator clears it's priority queue to requeue all persons in the simulation. The queues are
+        rebuilt from the call index a bitset at a time, the same as queueing each rider's destination and then each
+        floor from the bottom, so only the calls on the current floor are queued one at a time.
+        """
+        floor: int = self.current_floor
+        below: int = (1 << floor) - 1
+        above: int = -(1 << (floor + 1))
+        # ? A rider travelling to the current floor reopens the doors, as queueing the current floor does.
+        if self.calls.car >> floor & 1:
+            self.open()
+        self.up_queue.add_floors(
+            self.calls.car & above | self.calls.up & below, floor, self.direction_up
+        )
+        self.down_queue.add_floors(
+            (self.calls.car | self.calls.down) & below, floor, self.direction_up
+        )
+        # ? Persons left waiting on the current floor reopen the doors, which may turn the elevator around.
+        self.add_floor_stops(floor)
+        self.up_queue.add_floors(self.calls.up & above, floor, self.direction_up)
+        self.down_queue.add_floors(self.calls.down & above, floor, self.direction_up)
+
+    def index_calls(self) -> None:
+        """Rebuilds the call index from the persons waiting and riding, as after they are restored."""
+        self.calls.clear()
+        for floor in self.persons:
+            if floor == "elevator":
+                continue
+            waiting: FloorQueue = self.persons.get(floor)
+            if waiting.up:
+                self.calls.add_hall(floor, True)
+            if waiting.down:
+                self.calls.add_hall(floor, False)
+        for destination in self.persons["elevator"].destinations():
+            self.calls.add_car(destination)
@@ -0,0 +1,203 @@
+"""
+elevator_bank.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the ElevatorBank object, which runs several elevator cars that share hall calls.
+"""
+
+import numpy as np
+
+from src.classes.dispatcher import Dispatcher, EtaDispatcher
+from src.classes.elevator import Elevator
+from src.classes.passenger_table import PassengerTable
+from src.classes.person import Person
+from src.utils.building_config import BuildingConfig
+from src.utils.custom_exceptions import InvalidButton
+
+
+class ElevatorBank:
+    """
+    Several Elevator cars sharing one PassengerTable. Each hall call is assigned to a car by a dispatcher, and persons
+    waiting on a floor wait for the car answering their call.
+    """
+
+    def __init__(
+        self,
+        cars: int = 1,
+        dispatcher: Dispatcher | None = None,
+        passengers: PassengerTable | None = None,
+        config: BuildingConfig | None = None,
+    ) -> None:
+        """
+        The bank begins with every car on the first floor, and no hall calls.
+
+        Attributes:
+            passengers (PassengerTable): The table of persons shared by every car, a new table if none is given.
+            config (BuildingConfig): The building the cars serve, the building of the passenger table if none is given.
+            cars (list[Elevator]): The cars of the bank.
+            dispatcher (Dispatcher): The strategy choosing the car that answers a hall call, estimated time of arrival
+                if none is given.
+            hall_calls (dict[tuple[int, bool], int]): The car answering each floor and direction of hall call.
+            step_count (int): The number of steps every car has taken.
+        """
+        self.passengers: PassengerTable = (
+            passengers if passengers is not None else PassengerTable(config=config)
+        )
+        self.cars: list[Elevator] = [
+            Elevator(self.passengers, config) for _ in range(max(1, cars))
+        ]
+        self.config: BuildingConfig = self.cars[0].config
+        self.dispatcher: Dispatcher = (
+            dispatcher if dispatcher is not None else EtaDispatcher()
+        )
+        self.hall_calls: dict[tuple[int, bool], int] = {}
+        self.step_count: int = 0
+
+    def process_request(self, source, button, car: int = 0) -> None:
+        """
+        Processes the given button request. Hall calls are given to the car chosen by the dispatcher, buttons pressed
+        inside an elevator go to the given car.
+
+        Parameters:
+            source (int | str): The source of the button press.
+            button (int | str | list[int , str]): The button pressed.
+            car (int): The car the button was pressed in, defaults to the first car.
+        """
+        if self.is_hall_call(source, button):
+            car = self.assign(source, button.lower() == "up")
+        elif not isinstance(car, int) or not 0 <= car < len(self.cars):
+            raise InvalidButton()
+        self.cars[car].process_request(source, button)
+
+    def validate_request(self, source, button, car: int = 0) -> None:
+        """
+        Ensures the given button request is valid without taking any action or assigning a car.
+
+        Parameters:
+            source (int | str): The source of the button press.
+            button (int | str | list[int , str]): The button pressed.
+            car (int): The car the button was pressed in, defaults to the first car.
+        """
+        if self.is_hall_call(source, button):
+            car = 0
+        elif not isinstance(car, int) or not 0 <= car < len(self.cars):
+            raise InvalidButton()
+        self.cars[car].parse_request(source, button)
+
+    def is_hall_call(self, source, button) -> bool:
+        """
+        Checks if a button request is a hall call, an up or down button pressed on a floor of the building.
+
+        Parameters:
+            source (int | str): The source of the button press.
+            button (int | str | list[int , str]): The button pressed.
+
+        Returns: True if the request is a hall call, otherwise False.
+        """
+        return (
+            isinstance(source, int)
+            and isinstance(button, str)
+            and button.lower() in ("up", "down")
+            and self.config.is_floor(source)
+        )
+
+    def assign(self, floor: int, up: bool) -> int:
+        """
+        Finds the car answering a hall call, asking the dispatcher for a car if no car is answering it yet.
+
+        Parameters:
+            floor (int): The floor the call was made from.
+            up (bool): If the call is to travel upwards.
+
+        Returns: The index of the car.
+        """
+        car: int | None = self.hall_calls.get((floor, up))
+        if car is None or not self.answering(self.cars[car], floor, up):
+            car = self.dispatcher.assign(self.cars, floor, up)
+            self.hall_calls[(floor, up)] = car
+        return car
+
+    @staticmethod
+    def answering(car: Elevator, floor: int, up: bool) -> bool:
+        """
+        Checks if a car still has a hall call to answer.
+
+        Parameters:
+            car (Elevator): The car to check.
+            floor (int): The floor the call was made from.
+            up (bool): If the call is to travel upwards.
+
+        Returns: True if the floor is queued in the direction or persons wait there for the car, otherwise False.
+        """
+        if floor in (car.up_queue if up else car.down_queue):
+            return True
+        return bool(car.calls.hall(up) >> floor & 1)
+
+    def add_person(self, person: Person) -> int:
+        """
+        Adds a person to the passenger table and to the car answering their call.
+
+        Parameters:
+            person (Person): The person to add.
+
+        Returns: The row of the person in the passenger table.
+        """
+        row: int = self.passengers.append(person)
+        car: int = self.assign(person.location, self.passengers.going_up(row))
+        self.cars[car].add_person_row(row)
+        return row
+
+    def add_person_rows(self, rows: range) -> None:
+        """
+        Adds many persons already in the passenger table at once, assigning each floor and direction of call to a car a
+        single time.
+
+        Parameters:
+            rows (range): The rows of the persons to add.
+        """
+        origins: np.ndarray = self.passengers.origins[rows.start : rows.stop]
+        going_up: np.ndarray = (
+            origins < self.passengers.destinations[rows.start : rows.stop]
+        )
+        # ? Group the persons by call, keeping their order of arrival, and assign each call after the last is queued.
+        calls: np.ndarray = origins.astype(np.int64) * 2 + going_up
+        order: np.ndarray = np.argsort(calls, kind="stable")
+        sorted_rows: np.ndarray = order + rows.start
+        bounds: list[int] = np.flatnonzero(np.diff(calls[order], prepend=-1)).tolist()
+        for start, end in zip(bounds, bounds[1:] + [len(sorted_rows)]):
+            floor, up = divmod(calls.item(order.item(start)), 2)
+            car: int = self.assign(floor, bool(up))
+            self.cars[car].add_person_rows(sorted_rows[start:end])
+
+    def update(self) -> None:
+        """Takes the next step of every car."""
+        self.fast_forward(1)
+
+    def fast_forward(self, steps: int) -> None:
+        """
+        Progresses every car by the given number of steps, the same as calling update() for each step.
+
+        Parameters:
+            steps (int): The number of steps to take.
+        """
+        while steps > 0:
+            steps -= self.advance(steps)
+
+    def advance(self, max_steps: int) -> int:
+        """
+        Takes the next action of the car furthest behind. Cars do not affect each other between requests, so each
+        jumps through its own idle steps and runs of moves.
+
+        Parameters:
+            max_steps (int): The maximum number of steps the bank may take.
+
+        Returns: The number of steps every car has now taken past the previous step of the bank, which may be zero.
+        """
+        lagging: Elevator = min(self.cars, key=lambda car: car.step_count)
+        lagging.advance(self.step_count + max_steps - lagging.step_count)
+        step_count: int = min(car.step_count for car in self.cars)
+        taken: int = step_count - self.step_count
+        self.step_count = step_count
+        return taken
@@ -0,0 +1,81 @@
+"""
+elevator_load.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the ElevatorLoad object, which tracks the persons riding the elevator and their combined weight.
+"""
+
+
+class ElevatorLoad:
+    """
+    The persons riding the elevator, as rows of the PassengerTable bucketed by destination, with running totals of
+    their weight and headcount.
+    """
+
+    def __init__(self) -> None:
+        """
+        The load begins empty.
+
+        Attributes:
+            by_destination (dict[int, list[int]]): The riding persons, keyed by their destination, in boarding order.
+            destination_weights (dict[int, float]): The combined weight of the riding persons, keyed by destination.
+            weight (float): The combined weight of the riding persons and their cargo.
+            count (int): The number of riding persons.
+        """
+        self.by_destination: dict[int, list[int]] = {}
+        self.destination_weights: dict[int, float] = {}
+        self.weight: float = 0
+        self.count: int = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        for rows in self.by_destination.values():
+            yield from rows
+
+    def board(self, row: int, destination: int, weight: float) -> None:
+        """
+        Adds a person to the load.
+
+        Parameters:
+            row (int): The row of the person boarding.
+            destination (int): The destination of the person.
+            weight (float): The combined weight of the person and their cargo.
+        """
+        rows: list[int] | None = self.by_destination.get(destination)
+        if rows is None:
+            self.by_destination[destination] = [row]
+            self.destination_weights[destination] = weight
+        else:
+            rows.append(row)
+            self.destination_weights[destination] += weight
+        self.weight += weight
+        self.count += 1
+
+    def alight(self, floor: int) -> list[int]:
+        """
+        Removes every person whose destination is the given floor from the load.
+
+        Parameters:
+            floor (int): The floor the elevator is stopped at.
+
+        Returns: The rows of the persons alighting.
+        """
+        rows: list[int] = self.by_destination.pop(floor, [])
+        if rows:
+            self.count -= len(rows)
+            floor_weight: float = self.destination_weights.pop(floor)
+            # ? Reset once empty so floating point error does not build up over a long simulation.
+            self.weight = self.weight - floor_weight if self.count else 0
+        return rows
+
+    def destinations(self) -> list[int]:
+        """
+        Lists the destinations of the riding persons.
+
+        Returns: The destinations, in the order they were first requested.
+        """
+        return list(self.by_destination)
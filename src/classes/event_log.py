@@ -0,0 +1,319 @@
+"""
+event_log.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the EventLog object, which appends every accepted command to a binary log, and functions to read the log
+and replay it.
+"""
+
+import json
+import os
+import struct
+from collections.abc import Iterator
+from typing import BinaryIO
+
+import numpy as np
+
+from src.classes.checkpoint import load_checkpoint, save_checkpoint
+from src.classes.elevator_bank import ElevatorBank
+
+LOG_MAGIC: bytes = b"ELEVLOG\x00"
+LOG_VERSION: int = 1
+LOG_PREFIX: struct.Struct = struct.Struct("<8sH")
+# ? Each record is its kind, the step count of the elevator bank when it was made, and the length of its payload.
+RECORD_HEADER: struct.Struct = struct.Struct("<BQI")
+STEPS_PAYLOAD: struct.Struct = struct.Struct("<Q")
+
+START: int = 0
+CHECKPOINT: int = 1
+STEPS: int = 2
+BUTTON: int = 3
+PERSONS: int = 4
+PERSON_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("origins", "<i4"),
+    ("destinations", "<i4"),
+    ("weights", "<f8"),
+    ("cargo", "<f8"),
+)
+
+
+class EventLog:
+    """
+    An append-only, buffered log of the commands accepted by an elevator bank. Runs of steps are written as a single
+    record when the next command or checkpoint is written, and a checkpoint of the bank is written every given number
+    of steps, so a replay may begin from the last checkpoint before the step sought.
+    Each time a log is opened, a checkpoint of the bank as it is then begins a new session.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        elevator: ElevatorBank,
+        checkpoint_every: int = 10000,
+        buffer_size: int = 1 << 16,
+    ) -> None:
+        """
+        Attributes:
+            path (str): The file the log is appended to, created if it does not exist.
+            elevator (ElevatorBank): The elevator bank whose commands are logged, which must only be changed by the
+                thread writing the log.
+            checkpoint_every (int): The steps between checkpoints, or 0 for only the checkpoint starting the session.
+            logged_step (int): The step count of the bank when the last record was written.
+            file (BinaryIO): The open log.
+        """
+        self.path: str = path
+        self.elevator: ElevatorBank = elevator
+        self.checkpoint_every: int = checkpoint_every
+        self.logged_step: int = elevator.step_count
+        # pylint: disable-next=consider-using-with
+        self.file: BinaryIO = open(path, "ab", buffering=buffer_size)
+        if self.file.tell() == 0:
+            self.file.write(LOG_PREFIX.pack(LOG_MAGIC, LOG_VERSION))
+        self.write(START, save_checkpoint(elevator))
+
+    def write(self, kind: int, payload: bytes, step: int | None = None) -> None:
+        """
+        Appends a record.
+
+        Parameters:
+            kind (int): The kind of record.
+            payload (bytes): The contents of the record.
+            step (int | None): The step count the record was made at, the current step count of the bank if None.
+        """
+        self.file.write(
+            RECORD_HEADER.pack(
+                kind,
+                self.elevator.step_count if step is None else step,
+                len(payload),
+            )
+        )
+        self.file.write(payload)
+
+    def checkpoint_due(self) -> bool:
+        """
+        Checks if the steps taken since the last record reached the next checkpoint step.
+
+        Returns: True if a checkpoint is due, otherwise False.
+        """
+        return bool(self.checkpoint_every) and (
+            self.elevator.step_count // self.checkpoint_every
+            > self.logged_step // self.checkpoint_every
+        )
+
+    def steps(self) -> None:
+        """
+        Appends the steps taken since the last record, followed by a checkpoint if one is due. Called before each
+        command, so a command is replayed after the same number of steps.
+        """
+        step_count: int = self.elevator.step_count
+        if step_count == self.logged_step:
+            return
+        checkpoint: bool = self.checkpoint_due()
+        # ? A run of steps is made at the step it starts from, so a replay may stop part way through it.
+        self.write(
+            STEPS, STEPS_PAYLOAD.pack(step_count - self.logged_step), self.logged_step
+        )
+        self.logged_step = step_count
+        if checkpoint:
+            self.write(CHECKPOINT, save_checkpoint(self.elevator))
+            # ? Records up to each checkpoint reach the file, so a crash loses at most the steps since.
+            self.file.flush()
+
+    def sync(self) -> None:
+        """
+        Appends the steps taken and a checkpoint if one is due, otherwise leaves the steps to be appended as one run.
+        Called after each change to the bank.
+        """
+        if self.checkpoint_due():
+            self.steps()
+
+    def button(self, source, button, car: int = 0) -> None:
+        """
+        Appends a button pressed, after the steps taken before it.
+
+        Parameters:
+            source (int | str): The source of the button press.
+            button (int | str | list[int , str]): The button pressed.
+            car (int): The car the button was pressed in.
+        """
+        self.steps()
+        self.write(
+            BUTTON,
+            json.dumps({"source": source, "button": button, "car": car}).encode(),
+        )
+
+    def persons(self, rows: range) -> None:
+        """
+        Appends persons added to the elevator bank, after the steps taken before them. Their generated weights and
+        cargo are logged, so a replay adds the same persons.
+
+        Parameters:
+            rows (range): The rows of the persons in the passenger table.
+        """
+        self.steps()
+        self.write(
+            PERSONS,
+            b"".join(
+                getattr(self.elevator.passengers, column)[rows.start : rows.stop]
+                .astype(dtype)
+                .tobytes()
+                for column, dtype in PERSON_COLUMNS
+            ),
+        )
+
+    def flush(self) -> None:
+        """Appends the steps taken since the last record, and writes the buffered records to the file."""
+        self.steps()
+        self.file.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the log."""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def read_events(
+    path: str, offset: int | None = None, payloads: bool = True
+) -> Iterator[tuple[int, int, int, object]]:
+    """
+    Reads the records of a log in order.
+
+    Parameters:
+        path (str): The log to read.
+        offset (int | None): The offset of the record to begin from, or None to begin from the first record.
+        payloads (bool): If the payloads are decoded, otherwise they are skipped and given as None.
+
+    Returns: The offset, kind, step count and decoded payload of each record. A record cut short, as by a crash while
+        writing, ends the log.
+    """
+    with open(path, "rb") as file:
+        prefix: bytes = file.read(LOG_PREFIX.size)
+        if len(prefix) < LOG_PREFIX.size or prefix[:8] != LOG_MAGIC:
+            raise ValueError(f"{path} is not an elevator event log.")
+        version: int = LOG_PREFIX.unpack(prefix)[1]
+        if version != LOG_VERSION:
+            raise ValueError(f"Unsupported event log version {version}.")
+        end: int = os.fstat(file.fileno()).st_size
+        if offset is not None:
+            file.seek(offset)
+        while True:
+            record_offset: int = file.tell()
+            header: bytes = file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            kind, step, length = RECORD_HEADER.unpack(header)
+            if record_offset + RECORD_HEADER.size + length > end:
+                return
+            if payloads:
+                yield record_offset, kind, step, decode(kind, file.read(length))
+            else:
+                file.seek(length, os.SEEK_CUR)
+                yield record_offset, kind, step, None
+
+
+def decode(kind: int, payload: bytes) -> object:
+    """
+    Decodes the payload of a record.
+
+    Parameters:
+        kind (int): The kind of record.
+        payload (bytes): The contents of the record.
+
+    Returns: The number of steps, button or columns of persons in the record, or the checkpoint as bytes.
+    """
+    if kind == STEPS:
+        return STEPS_PAYLOAD.unpack(payload)[0]
+    if kind == BUTTON:
+        return json.loads(payload)
+    if kind == PERSONS:
+        count: int = len(payload) // sum(
+            np.dtype(dtype).itemsize for _, dtype in PERSON_COLUMNS
+        )
+        columns: list[np.ndarray] = []
+        offset: int = 0
+        for _, dtype in PERSON_COLUMNS:
+            columns.append(
+                np.frombuffer(payload, dtype=dtype, count=count, offset=offset)
+            )
+            offset += columns[-1].nbytes
+        return columns
+    return payload
+
+
+def sessions(path: str) -> list[list[tuple[int, int]]]:
+    """
+    Finds the checkpoints of each session of a log, reading only the headers of its records.
+
+    Parameters:
+        path (str): The log to read.
+
+    Returns: The step count and offset of each checkpoint of each session, in order, beginning with the checkpoint
+        starting the session.
+    """
+    found: list[list[tuple[int, int]]] = []
+    for offset, kind, step, _ in read_events(path, payloads=False):
+        if kind == START:
+            found.append([])
+        if kind in (START, CHECKPOINT) and found:
+            found[-1].append((step, offset))
+    return found
+
+
+def replay(path: str, step: int | None = None, session: int = -1) -> ElevatorBank:
+    """
+    Drives a new elevator bank through the commands of a log, without logging or tracing, as fast as it can step.
+    The replay begins from the last checkpoint at or before the step sought, rather than the start of the session.
+
+    Parameters:
+        path (str): The log to replay.
+        step (int | None): The step count to stop at, after the commands made at that step, or None to replay the
+            whole session.
+        session (int): The session to replay, counting from 0 for the first, or from -1 for the last.
+
+    Returns: The elevator bank as it was at the step.
+    """
+    found: list[list[tuple[int, int]]] = sessions(path)
+    if not -len(found) <= session < len(found):
+        raise ValueError(f"{path} has no session {session}.")
+    checkpoints: list[tuple[int, int]] = [
+        checkpoint
+        for checkpoint in found[session]
+        if step is None or checkpoint[0] <= step
+    ]
+    if not checkpoints:
+        raise ValueError(f"Session {session} of {path} begins after step {step}.")
+
+    events: Iterator[tuple[int, int, int, object]] = read_events(
+        path, checkpoints[-1][1]
+    )
+    elevator: ElevatorBank = load_checkpoint(next(events)[3])
+    for _, kind, record_step, payload in events:
+        if kind == START or step is not None and record_step > step:
+            break
+        apply_event(elevator, kind, payload, step)
+    return elevator
+
+
+def apply_event(
+    elevator: ElevatorBank, kind: int, payload, step: int | None = None
+) -> None:
+    """
+    Applies a record of a log to an elevator bank.
+
+    Parameters:
+        elevator (ElevatorBank): The elevator bank to change.
+        kind (int): The kind of record.
+        payload (object): The decoded payload of the record.
+        step (int | None): The step count not to step past, or None for no limit.
+    """
+    if kind == STEPS:
+        if step is not None:
+            payload = min(payload, step - elevator.step_count)
+        elevator.fast_forward(payload)
+    elif kind == BUTTON:
+        elevator.process_request(**payload)
+    elif kind == PERSONS:
+        elevator.add_person_rows(elevator.passengers.extend(*payload))
@@ -0,0 +1,59 @@
+"""
+floor_queue.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the FloorQueue object, which tracks the persons waiting for the elevator on a floor.
+"""
+
+from collections import deque
+
+
+class FloorQueue:
+    """
+    The persons waiting on a floor, as rows of the PassengerTable, split into a first in, first out lane for each
+    direction of travel.
+    """
+
+    def __init__(self) -> None:
+        """
+        The floor begins with no one waiting.
+
+        Attributes:
+            up (deque[int]): The persons waiting to travel upwards, in order of arrival.
+            down (deque[int]): The persons waiting to travel downwards, in order of arrival.
+        """
+        self.up: deque[int] = deque()
+        self.down: deque[int] = deque()
+
+    def __len__(self) -> int:
+        return len(self.up) + len(self.down)
+
+    def __iter__(self):
+        yield from self.up
+        yield from self.down
+
+    def add(self, row: int, up: bool) -> None:
+        """
+        Adds a person to the back of the lane for their direction of travel.
+
+        Parameters:
+            row (int): The row of the person arriving.
+            up (bool): If the person is travelling upwards.
+        """
+        if up:
+            self.up.append(row)
+        else:
+            self.down.append(row)
+
+    def lane(self, up: bool) -> deque[int]:
+        """
+        Finds the lane for a direction of travel.
+
+        Parameters:
+            up (bool): The upward lane if true, the downward lane if false.
+
+        Returns: The persons waiting to travel in that direction.
+        """
+        return self.up if up else self.down
@@ -0,0 +1,270 @@
+"""
+instrumentation.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Classes for the Instrumentation object, which times the hot paths of the elevator and exports its metrics in the
+Prometheus text format, and the TimingHistogram objects it times with.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from src.classes.elevator import Elevator
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.latency_histogram import LatencyHistogram
+
+TIMED_METHODS: tuple[str, ...] = ("update", "open", "add_up_stop", "add_down_stop")
+
+CAR_COUNTERS: tuple[tuple[str, str, str], ...] = (
+    ("elevator_steps_total", "step_count", "The steps taken by each car."),
+    (
+        "elevator_door_openings_total",
+        "door_openings",
+        "The times the closed doors of each car have opened.",
+    ),
+    (
+        "elevator_boardings_total",
+        "boardings",
+        "The persons who have boarded each car.",
+    ),
+    (
+        "elevator_alightings_total",
+        "alightings",
+        "The persons who have alighted each car.",
+    ),
+    (
+        "elevator_rejected_boardings_total",
+        "rejected_boardings",
+        "The waiting persons left behind by each car, as boarding would breach its weight or capacity limit.",
+    ),
+    (
+        "elevator_priority_stops_total",
+        "priority_stops",
+        "The priority stops made by each car.",
+    ),
+)
+
+JOURNEY_SUMMARIES: tuple[tuple[str, str, str], ...] = (
+    ("elevator_wait_steps", "wait", "The steps from arriving to boarding."),
+    ("elevator_ride_steps", "ride", "The steps from boarding to alighting."),
+    ("elevator_trip_steps", "trip", "The steps from arriving to alighting."),
+)
+
+
+class TimingHistogram:
+    """
+    Counts durations into fixed buckets, in the form of a Prometheus histogram. Durations may be observed from many
+    threads.
+    """
+
+    BOUNDS: tuple[float, ...] = (
+        0.000001,
+        0.000005,
+        0.00001,
+        0.00005,
+        0.0001,
+        0.0005,
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+        0.5,
+        1.0,
+        5.0,
+    )
+
+    def __init__(self) -> None:
+        """
+        The histogram begins empty.
+
+        Attributes:
+            counts (list[int]): The durations observed within each bound but not the bound before, and above the last.
+            total (float): The sum of the durations observed, in seconds.
+            count (int): The number of durations observed.
+            lock (threading.Lock): Held while observing, so observations from many threads are not lost.
+        """
+        self.counts: list[int] = [0] * (len(self.BOUNDS) + 1)
+        self.total: float = 0.0
+        self.count: int = 0
+        self.lock: threading.Lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """
+        Observes a duration.
+
+        Parameters:
+            seconds (float): The duration, in seconds.
+        """
+        with self.lock:
+            self.counts[bisect_left(self.BOUNDS, seconds)] += 1
+            self.total += seconds
+            self.count += 1
+
+    def lines(self, name: str, labels: str) -> list[str]:
+        """
+        Exports the histogram.
+
+        Parameters:
+            name (str): The name of the metric.
+            labels (str): The labels of the histogram, such as 'function="update"'.
+
+        Returns: The lines of the cumulative buckets, sum and count, in the Prometheus text format.
+        """
+        with self.lock:
+            counts, total, count = list(self.counts), self.total, self.count
+        lines: list[str] = []
+        cumulative: int = 0
+        for bound, bucket in zip(self.BOUNDS + (float("inf"),), counts):
+            cumulative += bucket
+            le: str = "+Inf" if bound == float("inf") else f"{bound:g}"
+            lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {total!r}")
+        lines.append(f"{name}_count{{{labels}}} {count}")
+        return lines
+
+
+class Instrumentation:
+    """
+    Times the hot paths of elevators and the handling of requests, and exports these with the counters of each car and
+    the journey metrics in the Prometheus text format. When disabled, nothing is wrapped or timed, so there is no cost.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        The instrumentation begins with no timings.
+
+        Attributes:
+            enabled (bool): If elevators and requests are timed.
+            timings (dict[tuple[str, str], TimingHistogram]): The histogram of each metric and label, such as
+                ("elevator_function_duration_seconds", 'function="update"').
+        """
+        self.enabled: bool = enabled
+        self.timings: dict[tuple[str, str], TimingHistogram] = {}
+
+    def histogram(self, name: str, labels: str) -> TimingHistogram:
+        """
+        Finds the histogram of a metric and label, creating it if needed.
+
+        Parameters:
+            name (str): The name of the metric.
+            labels (str): The labels of the histogram.
+
+        Returns: The histogram.
+        """
+        key: tuple[str, str] = (name, labels)
+        histogram: TimingHistogram | None = self.timings.get(key)
+        if histogram is None:
+            # ? Requests are timed from many threads, and setdefault keeps the first histogram created for a key.
+            histogram = self.timings.setdefault(key, TimingHistogram())
+        return histogram
+
+    def instrument(self, elevator: Elevator | ElevatorBank) -> None:
+        """
+        Times the hot paths of every car of an elevator bank, if enabled. Only the given cars are changed, by wrapping
+        their methods.
+
+        Parameters:
+            elevator (Elevator | ElevatorBank): The elevator or bank of elevators to time.
+        """
+        if not self.enabled:
+            return
+        cars: list[Elevator] = (
+            elevator.cars if isinstance(elevator, ElevatorBank) else [elevator]
+        )
+        for car in cars:
+            for method in TIMED_METHODS:
+                setattr(
+                    car,
+                    method,
+                    self.timed(
+                        getattr(car, method),
+                        self.histogram(
+                            "elevator_function_duration_seconds",
+                            f'function="{method}"',
+                        ),
+                    ),
+                )
+
+    @staticmethod
+    def timed(function: Callable, histogram: TimingHistogram) -> Callable:
+        """
+        Wraps a function so each call is timed.
+
+        Parameters:
+            function (Callable): The function to time.
+            histogram (TimingHistogram): The histogram to observe each duration in.
+
+        Returns: The wrapped function.
+        """
+
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> Any:
+            start: float = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+
+        return wrapper
+
+    def observe_request(self, endpoint: str | None, seconds: float) -> None:
+        """
+        Records the time taken to handle a request.
+
+        Parameters:
+            endpoint (str | None): The name of the route, or None if no route matched.
+            seconds (float): The time taken, in seconds.
+        """
+        self.histogram(
+            "elevator_request_duration_seconds", f'endpoint="{endpoint or "none"}"'
+        ).observe(seconds)
+
+    def export(self, elevator: ElevatorBank) -> str:
+        """
+        Exports the metrics of an elevator bank in the Prometheus text format.
+
+        Parameters:
+            elevator (ElevatorBank): The elevator bank to export.
+
+        Returns: The counters of each car, the summaries of the journeys, and any timings.
+        """
+        lines: list[str] = []
+        for name, attribute, description in CAR_COUNTERS:
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+            lines += [
+                f'{name}{{car="{index}"}} {getattr(car, attribute)}'
+                for index, car in enumerate(elevator.cars)
+            ]
+
+        for name, attribute, description in JOURNEY_SUMMARIES:
+            histogram: LatencyHistogram = getattr(
+                elevator.passengers.journeys, attribute
+            )
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} summary"]
+            lines += [
+                f'{name}{{quantile="{quantile}"}} {histogram.percentile(percent)}'
+                for quantile, percent in (("0.5", 50), ("0.9", 90), ("0.99", 99))
+                if histogram.count
+            ]
+            lines += [
+                f"{name}_sum {histogram.total}",
+                f"{name}_count {histogram.count}",
+            ]
+
+        described: set[str] = set()
+        for (name, labels), timing in sorted(self.timings.items()):
+            if name not in described:
+                described.add(name)
+                lines += [
+                    f"# HELP {name} The seconds taken by each {name.split('_')[1]}.",
+                    f"# TYPE {name} histogram",
+                ]
+            lines += timing.lines(name, labels)
+        return "\n".join(lines) + "\n"
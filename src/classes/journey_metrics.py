@@ -0,0 +1,59 @@
+"""
+journey_metrics.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the JourneyMetrics object, which aggregates the wait, ride and trip times of completed journeys.
+"""
+
+import numpy as np
+
+from src.classes.latency_histogram import LatencyHistogram
+
+
+class JourneyMetrics:
+    """
+    Aggregates the journeys of persons who have alighted, in a fixed amount of memory however many journeys there are.
+    """
+
+    def __init__(self) -> None:
+        """
+        The metrics begin with no journeys.
+
+        Attributes:
+            wait (LatencyHistogram): The steps between beginning to wait and boarding.
+            ride (LatencyHistogram): The steps between boarding and alighting.
+            trip (LatencyHistogram): The steps between beginning to wait and alighting.
+        """
+        self.wait: LatencyHistogram = LatencyHistogram()
+        self.ride: LatencyHistogram = LatencyHistogram()
+        self.trip: LatencyHistogram = LatencyHistogram()
+
+    def record(
+        self, spawn_steps: np.ndarray, board_steps: np.ndarray, alight_steps: np.ndarray
+    ) -> None:
+        """
+        Records completed journeys.
+
+        Parameters:
+            spawn_steps (np.ndarray): The step each person began waiting on.
+            board_steps (np.ndarray): The step each person boarded on.
+            alight_steps (np.ndarray): The step each person alighted on.
+        """
+        self.wait.record(board_steps - spawn_steps)
+        self.ride.record(alight_steps - board_steps)
+        self.trip.record(alight_steps - spawn_steps)
+
+    def summary(self) -> dict:
+        """
+        Summarizes the journeys recorded.
+
+        Returns: A dictionary of the number of journeys, and the summary of the wait, ride and trip times.
+        """
+        return {
+            "journeys": self.trip.count,
+            "wait": self.wait.summary(),
+            "ride": self.ride.summary(),
+            "trip": self.trip.summary(),
+        }
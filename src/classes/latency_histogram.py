@@ -0,0 +1,130 @@
+"""
+latency_histogram.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the LatencyHistogram object, which summarizes any number of step counts in a fixed amount of memory.
+"""
+
+import numpy as np
+
+
+class LatencyHistogram:
+    """
+    A histogram of non-negative step counts in the style of an HDR histogram. Small values each have their own bucket,
+    and larger values share buckets that widen with their magnitude, so every value is kept to a fixed number of
+    significant bits and the memory used does not grow with the number of values.
+    """
+
+    def __init__(self, significant_bits: int = 7, max_bits: int = 48) -> None:
+        """
+        The histogram begins empty.
+
+        Attributes:
+            significant_bits (int): The bits of each value kept exactly, so percentiles are within
+                1 / 2 ** (significant_bits - 1) of the value recorded.
+            max_value (int): The largest value that can be recorded, larger values are recorded as it.
+            counts (np.ndarray): The number of values recorded in each bucket.
+            count (int): The number of values recorded.
+            total (int): The sum of the values recorded.
+            minimum (int | None): The smallest value recorded, or None if none have been.
+            maximum (int | None): The largest value recorded, or None if none have been.
+        """
+        self.significant_bits: int = significant_bits
+        self.max_value: int = (1 << max_bits) - 1
+        self.counts: np.ndarray = np.zeros(
+            (max_bits - significant_bits + 2) << (significant_bits - 1), dtype=np.int64
+        )
+        self.count: int = 0
+        self.total: int = 0
+        self.minimum: int | None = None
+        self.maximum: int | None = None
+
+    def bucket_indices(self, values: np.ndarray) -> np.ndarray:
+        """
+        Finds the bucket of each value.
+
+        Parameters:
+            values (np.ndarray): The values, which must be between 0 and max_value.
+
+        Returns: The index of the bucket of each value.
+        """
+        # ? The exponent of a float is the bit length of the integer, exactly for values below 2 ** 53.
+        shifts: np.ndarray = np.maximum(
+            np.frexp(values.astype(np.float64))[1] - self.significant_bits, 0
+        )
+        return (shifts << (self.significant_bits - 1)) + (values >> shifts)
+
+    def bucket_high(self, index: int) -> int:
+        """
+        Finds the largest value of a bucket.
+
+        Parameters:
+            index (int): The index of the bucket.
+
+        Returns: The largest value recorded in the bucket.
+        """
+        half: int = 1 << (self.significant_bits - 1)
+        if index < 2 * half:
+            return index
+        shift: int = index // half - 1
+        return ((index - shift * half) << shift) + (1 << shift) - 1
+
+    def record(self, values) -> None:
+        """
+        Records many values at once.
+
+        Parameters:
+            values (np.ndarray | list[int]): The values to record, negative values are recorded as 0.
+        """
+        values = np.clip(np.asarray(values, dtype=np.int64), 0, self.max_value)
+        if values.size == 0:
+            return
+        np.add.at(self.counts, self.bucket_indices(values), 1)
+        self.count += values.size
+        self.total += int(values.sum())
+        low, high = values.min().item(), values.max().item()
+        self.minimum = low if self.minimum is None else min(self.minimum, low)
+        self.maximum = high if self.maximum is None else max(self.maximum, high)
+
+    def mean(self) -> float | None:
+        """
+        Finds the exact mean of the values recorded.
+
+        Returns: The mean, or None if no values have been recorded.
+        """
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percent: float) -> int | None:
+        """
+        Finds a percentile of the values recorded, to the significant bits of the histogram.
+
+        Parameters:
+            percent (float): The percentile to find, between 0 and 100.
+
+        Returns: The largest value of the bucket holding the percentile, no more than the largest value recorded, or
+            None if no values have been recorded.
+        """
+        if not self.count:
+            return None
+        rank: int = max(1, int(np.ceil(percent / 100 * self.count)))
+        index: int = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return min(self.bucket_high(index), self.maximum)
+
+    def summary(self, percents: tuple[float, ...] = (50, 90, 95, 99)) -> dict:
+        """
+        Summarizes the values recorded.
+
+        Parameters:
+            percents (tuple[float, ...]): The percentiles to include.
+
+        Returns: A dictionary of the count, mean, minimum, maximum and each percentile, as "p50" and so on.
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean(),
+            "min": self.minimum,
+            "max": self.maximum,
+            **{f"p{percent:g}": self.percentile(percent) for percent in percents},
+        }
@@ -0,0 +1,367 @@
+"""
+passenger_table.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the PassengerTable object, which stores every person in a simulation as rows of NumPy arrays.
+"""
+
+import numpy as np
+
+from src.classes.journey_metrics import JourneyMetrics
+from src.classes.person import Person
+from src.utils.building_config import BuildingConfig, default_config
+from src.utils.custom_exceptions import InvalidFloor, InvalidPerson
+from src.utils.id_generator import id_block
+from src.utils.random_generator import random_generator
+
+
+# pylint: disable-next=too-many-instance-attributes
+class PassengerTable:
+    """
+    Compact storage for the persons in a simulation, held as a struct of arrays so each person is a row index rather
+    than a Python object.
+    """
+
+    COLUMNS: tuple[str, ...] = (
+        "ids",
+        "origins",
+        "destinations",
+        "weights",
+        "cargo",
+        "spawn_steps",
+        "board_steps",
+        "alight_steps",
+    )
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        seed: int | None = None,
+        config: BuildingConfig | None = None,
+    ) -> None:
+        """
+        The table begins empty, with room for the given number of rows before growing. Generated floors, weights and
+        cargo are drawn from a generator seeded with the given seed, or the shared random generator if none is given.
+        Floors and weights are validated against the given building, or the default building if none is given.
+
+        Attributes:
+            ids (np.ndarray): The unique identifier of each person.
+            origins (np.ndarray): The floor each person arrived on.
+            destinations (np.ndarray): The destination of each person.
+            weights (np.ndarray): The weight of each person.
+            cargo (np.ndarray): The weight of each person's cargo.
+            spawn_steps (np.ndarray): The step each person began waiting on, or -1 if they have not been added to an
+                elevator.
+            board_steps (np.ndarray): The step each person boarded on, or -1 if they have not boarded.
+            alight_steps (np.ndarray): The step each person alighted on, or -1 if they have not alighted.
+            size (int): The number of rows in use.
+            rng (np.random.Generator): The random number generator used to generate values.
+            config (BuildingConfig): The building the persons are in.
+            journeys (JourneyMetrics): The wait, ride and trip times of the persons who have alighted.
+        """
+        self.ids: np.ndarray = np.empty(capacity, dtype=np.int64)
+        self.origins: np.ndarray = np.empty(capacity, dtype=np.int32)
+        self.destinations: np.ndarray = np.empty(capacity, dtype=np.int32)
+        self.weights: np.ndarray = np.empty(capacity, dtype=np.float64)
+        self.cargo: np.ndarray = np.empty(capacity, dtype=np.float64)
+        self.spawn_steps: np.ndarray = np.empty(capacity, dtype=np.int64)
+        self.board_steps: np.ndarray = np.empty(capacity, dtype=np.int64)
+        self.alight_steps: np.ndarray = np.empty(capacity, dtype=np.int64)
+        self.size: int = 0
+        self.rng: np.random.Generator = (
+            np.random.default_rng(seed) if seed is not None else random_generator()
+        )
+        self.config: BuildingConfig = config if config is not None else default_config()
+        self.journeys: JourneyMetrics = JourneyMetrics()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def reserve(self, rows: int) -> None:
+        """
+        Grows the arrays, at least doubling them, if the given number of rows would not fit.
+
+        Parameters:
+            rows (int): The number of rows about to be added.
+        """
+        needed: int = self.size + rows
+        capacity: int = len(self.ids)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        for column in self.COLUMNS:
+            grown: np.ndarray = np.empty(capacity, dtype=getattr(self, column).dtype)
+            grown[: self.size] = getattr(self, column)[: self.size]
+            setattr(self, column, grown)
+
+    def append(self, person: Person) -> int:
+        """
+        Adds a person to the table.
+
+        Parameters:
+            person (Person): The person to add.
+
+        Returns: The row of the person.
+        """
+        self.reserve(1)
+        row: int = self.size
+        self.ids[row] = person.id
+        self.origins[row] = person.location
+        self.destinations[row] = person.destination
+        self.weights[row] = person.weight
+        self.cargo[row] = person.cargo
+        self.spawn_steps[row] = self.board_steps[row] = self.alight_steps[row] = -1
+        self.size += 1
+        return row
+
+    def extend(self, origins, destinations, weights=None, cargo=None) -> range:
+        """
+        Adds many persons to the table at once. Missing or out of range weights and cargo are generated the same way as
+        for a Person, in a single draw for all persons. Cargo is out of range if the person could not board alone
+        with it.
+
+        Parameters:
+            origins (int | array-like): The floor each person arrived on, or one floor for all persons.
+            destinations (int | array-like): The destination of each person, or one floor for all persons.
+            weights (array-like | None): The weight of each person, NaN or None to generate a weight.
+            cargo (array-like | None): The weight of each person's cargo, NaN or None to generate the cargo weight.
+
+        Returns: The rows of the persons.
+        """
+        origins, destinations = np.broadcast_arrays(
+            np.asarray(origins, dtype=np.int64),
+            np.asarray(destinations, dtype=np.int64),
+        )
+        count: int = origins.size
+        if len(self.invalid_floors(origins, destinations)):
+            raise InvalidFloor(config=self.config)
+
+        # ? If no weight provided, normally distribute weight, constrain to between 20 (persons less than 20 pounds
+        # ? considered cargo) and the maximum weight
+        max_weight: float = self.config.max_weight
+        generated_weights: np.ndarray = np.clip(
+            self.rng.normal(loc=150, scale=100, size=count), 20, max_weight
+        )
+        # ? If no cargo provided, normally distribute cargo weight, constrain to between 0 and 100 (arbitrary maximum)
+        # ? or the weight left once the person is in the elevator, so each person can board alone
+        generated_cargo: np.ndarray = self.rng.normal(loc=25, scale=5, size=count)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+            generated_weights = np.where(
+                (weights >= 20) & (weights <= max_weight), weights, generated_weights
+            )
+        max_cargo: np.ndarray = np.minimum(100, max_weight - generated_weights)
+        generated_cargo = np.clip(generated_cargo, 0, max_cargo)
+        if cargo is not None:
+            cargo = np.asarray(cargo, dtype=np.float64)
+            generated_cargo = np.where(
+                (cargo >= 0) & (cargo <= max_cargo), cargo, generated_cargo
+            )
+
+        self.reserve(count)
+        rows: range = range(self.size, self.size + count)
+        ids: range = id_block(count)
+        self.ids[rows.start : rows.stop] = np.arange(ids.start, ids.stop)
+        self.origins[rows.start : rows.stop] = origins
+        self.destinations[rows.start : rows.stop] = destinations
+        self.weights[rows.start : rows.stop] = generated_weights
+        self.cargo[rows.start : rows.stop] = generated_cargo
+        for steps in (self.spawn_steps, self.board_steps, self.alight_steps):
+            steps[rows.start : rows.stop] = -1
+        self.size += count
+        return rows
+
+    def extend_records(self, records: list[dict]) -> range:
+        """
+        Adds many persons to the table at once from a list of records, as accepted by the create_person route.
+
+        Parameters:
+            records (list[dict]): The persons to add, each following the format of {"origin": int,
+                "destination": int}, with optional keys of {"weight": float, "cargo": float}.
+
+        Returns: The rows of the persons.
+        """
+        invalid: tuple[int, Exception] | None = self.invalid_record(records)
+        if invalid is not None:
+            raise invalid[1]
+        return self.extend(*self.columns_from_records(records))
+
+    @staticmethod
+    def columns_from_records(records: list[dict]) -> tuple[np.ndarray, ...]:
+        """
+        Converts a list of person records into columns.
+
+        Parameters:
+            records (list[dict]): The persons, each following the format of {"origin": int, "destination": int}, with
+                optional keys of {"weight": float, "cargo": float}.
+
+        Returns: The origins, destinations, weights and cargo, with NaN for weights and cargo not provided.
+        """
+        return (
+            np.array([record["origin"] for record in records], dtype=np.int64),
+            np.array([record["destination"] for record in records], dtype=np.int64),
+            np.array(
+                [record.get("weight", np.nan) for record in records], dtype=np.float64
+            ),
+            np.array(
+                [
+                    np.nan if record.get("cargo") is None else record["cargo"]
+                    for record in records
+                ],
+                dtype=np.float64,
+            ),
+        )
+
+    def invalid_record(self, records: list[dict]) -> tuple[int, Exception] | None:
+        """
+        Finds the first person record that can not be added, checked before columns_from_records(). Floors must be
+        integers in the building, not strings or floats that would convert to one, and a person given both a weight
+        and cargo must be able to board alone with them.
+
+        Parameters:
+            records (list[dict]): The persons, each following the format of {"origin": int, "destination": int}, with
+                optional keys of {"weight": float, "cargo": float}.
+
+        Returns: The index of the first invalid record and the error describing it, or None if every record is valid.
+        """
+        max_weight: float = self.config.max_weight
+        for index, record in enumerate(records):
+            if not isinstance(record, dict) or any(
+                isinstance(record.get(key), bool)
+                or not isinstance(record.get(key), int)
+                for key in ("origin", "destination")
+            ):
+                return index, InvalidPerson()
+            if any(
+                isinstance(record.get(key), bool)
+                or not isinstance(record.get(key), (int, float, type(None)))
+                for key in ("weight", "cargo")
+            ):
+                return index, InvalidPerson()
+            # ? Floors are checked before conversion, as an integer too large for the columns can not be converted.
+            if not (
+                self.config.is_floor(record["origin"])
+                and self.config.is_floor(record["destination"])
+            ):
+                return index, InvalidFloor(config=self.config)
+            weight, cargo = record.get("weight"), record.get("cargo")
+            if weight is not None and cargo is not None and weight + cargo > max_weight:
+                return index, InvalidPerson(
+                    f"A person must be able to board alone, with a weight and cargo of at most {max_weight} together."
+                )
+        return None
+
+    def invalid_floors(
+        self, origins: np.ndarray, destinations: np.ndarray
+    ) -> np.ndarray:
+        """
+        Finds the persons with an origin or destination that is not in the system.
+
+        Parameters:
+            origins (np.ndarray): The floor each person arrived on.
+            destinations (np.ndarray): The destination of each person.
+
+        Returns: The indexes of the invalid persons, in ascending order.
+        """
+        valid: np.ndarray = np.ones(
+            np.broadcast(origins, destinations).shape, dtype=bool
+        )
+        for floors in (origins, destinations):
+            valid &= self.config.valid_floors(floors)
+        return np.flatnonzero(~valid)
+
+    def random_floors(self, count: int) -> np.ndarray:
+        """
+        Draws floors uniformly from every floor in the system.
+
+        Parameters:
+            count (int): The number of floors to draw.
+
+        Returns: The floors drawn.
+        """
+        return self.rng.choice(self.config.floors, size=count)
+
+    def destination(self, row: int) -> int:
+        """
+        Finds the destination of a person.
+
+        Parameters:
+            row (int): The row of the person.
+
+        Returns: The destination of the person.
+        """
+        return self.destinations.item(row)
+
+    def load(self, row: int) -> float:
+        """
+        Finds the combined weight of a person and their cargo.
+
+        Parameters:
+            row (int): The row of the person.
+
+        Returns: The weight the person adds to the elevator.
+        """
+        return self.weights.item(row) + self.cargo.item(row)
+
+    def going_up(self, row: int) -> bool:
+        """
+        Finds the direction a person is travelling in.
+
+        Parameters:
+            row (int): The row of the person.
+
+        Returns: True if the person is travelling upwards, otherwise False.
+        """
+        return self.origins.item(row) < self.destinations.item(row)
+
+    def person(self, row: int) -> dict:
+        """
+        Describes a person.
+
+        Parameters:
+            row (int): The row of the person.
+
+        Returns: A dictionary of the id, origin, destination, weight and cargo of the person.
+        """
+        return {
+            "id": self.ids.item(row),
+            "origin": self.origins.item(row),
+            "destination": self.destinations.item(row),
+            "weight": self.weights.item(row),
+            "cargo": self.cargo.item(row),
+        }
+
+    def alight(self, rows: list[int], step: int) -> None:
+        """
+        Records persons alighting, completing their journeys.
+
+        Parameters:
+            rows (list[int]): The rows of the persons alighting.
+            step (int): The step they alight on.
+        """
+        self.alight_steps[rows] = step
+        self.journeys.record(
+            self.spawn_steps[rows], self.board_steps[rows], self.alight_steps[rows]
+        )
+
+    def wait_times(self) -> np.ndarray:
+        """
+        Finds how long each person who has boarded waited for the elevator.
+
+        Returns: The steps between each boarded person beginning to wait and boarding, in row order.
+        """
+        boarded: np.ndarray = self.board_steps[: self.size] >= 0
+        return (self.board_steps[: self.size] - self.spawn_steps[: self.size])[boarded]
+
+    def trip_times(self) -> np.ndarray:
+        """
+        Finds how long each person who has alighted took to reach their destination.
+
+        Returns: The steps between each alighted person beginning to wait and alighting, in row order.
+        """
+        alighted: np.ndarray = self.alight_steps[: self.size] >= 0
+        return (self.alight_steps[: self.size] - self.spawn_steps[: self.size])[
+            alighted
+        ]
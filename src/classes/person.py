@@ -2,15 +2,14 @@
 person.py
 Samuel Koller
 Created: 19 October 2024
-Updated: 22 October 2024
+Updated: 17 October 2026
 
 Class for the Person object, which tracks the location of the person and other attributes.
 """
 
-import numpy as np
-
-from src.utils.constants import MAX_WEIGHT, TOP_FLOOR
+from src.utils.building_config import BuildingConfig, default_config
 from src.utils.custom_exceptions import InvalidFloor
+from src.utils.random_generator import random_generator
 
 from ..utils import id_generator
 
@@ -21,15 +20,21 @@ class Person:
     Information regarding a person and their journey.
     """
 
+    __slots__ = ("id", "location", "destination", "weight", "cargo")
+
+    # pylint: disable-next=too-many-arguments
     def __init__(
         self,
         origin: int,
         destination: int,
         weight: float = 0,
         cargo: float | None = None,
+        *,
+        config: BuildingConfig | None = None,
     ) -> None:
         """
-        Sets initial location to origin, and generates an identifier.
+        Sets initial location to origin, and generates an identifier. The origin, destination and weight are validated
+        against the given building, or the default building if none is given.
 
         Attributes:
             id (int): A unique identifier given to the person.
@@ -39,26 +44,33 @@ class Person:
             cargo (float): The weight of the person's cargo.
         """
         self.id: int = id_generator()
+        if config is None:
+            config = default_config()
 
-        if 1 <= origin <= TOP_FLOOR and origin != 13:
+        if config.is_floor(origin):
             self.location: int = origin
         else:
-            raise InvalidFloor()
-        if 1 <= destination <= TOP_FLOOR and destination != 13:
+            raise InvalidFloor(config=config)
+        if config.is_floor(destination):
             self.destination: int = destination
         else:
-            raise InvalidFloor()
+            raise InvalidFloor(config=config)
 
         # ? If no weight provided, normally distribute weight, constrain to between 20 (persons less than 20 pounds
-        # ? considered cargo) and MAX_WEIGHT
-        if 20 <= weight <= MAX_WEIGHT:
+        # ? considered cargo) and the maximum weight
+        if 20 <= weight <= config.max_weight:
             self.weight: float = weight
         else:
             self.weight: float = max(
-                20, min(np.random.normal(loc=150, scale=100), MAX_WEIGHT)
+                20,
+                min(random_generator().normal(loc=150, scale=100), config.max_weight),
             )
         # ? If no cargo provided, normally distribute cargo weight, constrain to between 0 and 100 (arbitrary maximum)
-        if cargo is not None and 0 <= cargo <= 100:
+        # ? or the weight left once the person is in the elevator, so the person can board alone
+        max_cargo: float = min(100, config.max_weight - self.weight)
+        if cargo is not None and 0 <= cargo <= max_cargo:
             self.cargo: float = cargo
         else:
-            self.cargo: float = max(0, min(np.random.normal(loc=25, scale=5), 100))
+            self.cargo: float = max(
+                0, min(random_generator().normal(loc=25, scale=5), max_cargo)
+            )
@@ -0,0 +1,319 @@
+"""
+session_registry.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the SessionRegistry object, which holds many independent elevator simulations within a memory budget.
+"""
+
+import os
+import re
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from src.classes.checkpoint import CheckpointFile
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.passenger_table import PassengerTable
+from src.classes.ticker import Ticker
+from src.utils.custom_exceptions import SessionNotFound
+
+SESSION_ID_PATTERN: re.Pattern = re.compile(r"[A-Za-z0-9_-]{1,64}")
+# ? The estimated bytes of a session besides its passenger table and cars, of each person queued or riding, of each
+# ? car's queues, call index and load, and of each floor a car has persons waiting on.
+SESSION_OVERHEAD: int = 1 << 17
+PERSON_OVERHEAD: int = 64
+CAR_OVERHEAD: int = 1 << 11
+FLOOR_OVERHEAD: int = 1 << 11
+
+
+class SessionRegistry:
+    """
+    Independent elevator banks, each changed only by its own ticker, held in memory while within a budget. When the
+    sessions in memory are estimated to exceed the budget, the least recently used are saved to checkpoints on disk
+    and dropped, then restored when next used.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        memory_budget: int = 256 << 20,
+        max_cars: int = 64,
+    ) -> None:
+        """
+        The registry begins with no sessions in memory. Sessions already saved in the directory are restored when used.
+
+        Attributes:
+            directory (str | None): The directory sessions are saved to, or None for a new temporary directory once
+                a session is first saved.
+            memory_budget (int): The estimated bytes the sessions in memory may use. The sessions in use are kept in
+                memory regardless.
+            max_cars (int): The most cars the elevator bank of a session may have.
+            sessions (OrderedDict[str, Ticker]): The ticker of each session in memory, least recently used first.
+            pins (dict[str, int]): The number of requests using each session, which may not be saved or deleted.
+            busy (set[str]): The sessions being restored from or saved to disk, which are waited on until done.
+            lock (threading.Lock): Held while the sessions in memory are changed, but not while a session is restored
+                or saved, so a large session never holds up requests to the others.
+            changed (threading.Condition): Notified, with the lock, when a session is no longer busy.
+        """
+        self.directory: str | None = directory
+        self.memory_budget: int = memory_budget
+        self.max_cars: int = max_cars
+        self.sessions: OrderedDict[str, Ticker] = OrderedDict()
+        self.pins: dict[str, int] = {}
+        self.busy: set[str] = set()
+        self.lock: threading.Lock = threading.Lock()
+        self.changed: threading.Condition = threading.Condition(self.lock)
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def path(self, session_id: str) -> str:
+        """
+        Finds the checkpoint file of a session, creating the directory if needed.
+
+        Parameters:
+            session_id (str): The id of the session.
+
+        Returns: The path of the session's checkpoint.
+        """
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix="elevator-sessions-")
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, f"{session_id}.ckpt")
+
+    def exists(self, session_id: str) -> bool:
+        """
+        Checks if a session exists, in memory or on disk. Called with the lock held.
+
+        Parameters:
+            session_id (str): The id of the session.
+
+        Returns: True if the session exists, otherwise False.
+        """
+        return (
+            session_id in self.sessions
+            or session_id in self.busy
+            or (
+                self.directory is not None
+                and bool(SESSION_ID_PATTERN.fullmatch(session_id))
+                and os.path.exists(self.path(session_id))
+            )
+        )
+
+    def create(self, session_id: str | None = None, cars: int = 1) -> str:
+        """
+        Adds a new session, with an empty elevator bank on the first floor.
+
+        Parameters:
+            session_id (str | None): The id of the session, of up to 64 letters, digits, underscores and hyphens, or
+                None for a random id.
+            cars (int): The number of cars in the session's elevator bank, from 1 to max_cars.
+
+        Returns: The id of the session.
+        """
+        session_id = uuid.uuid4().hex if session_id is None else session_id
+        if not SESSION_ID_PATTERN.fullmatch(session_id):
+            raise ValueError(
+                "Session ids are 1 to 64 letters, digits, underscores or hyphens."
+            )
+        # ? The bank is built while the request waits, so a session may not have an unbounded number of cars.
+        if (
+            isinstance(cars, bool)
+            or not isinstance(cars, int)
+            or not 1 <= cars <= self.max_cars
+        ):
+            raise ValueError(f"A session has from 1 to {self.max_cars} cars.")
+        with self.lock:
+            if self.exists(session_id):
+                raise FileExistsError(f"Session {session_id} already exists.")
+            self.sessions[session_id] = self.start(session_id, ElevatorBank(cars))
+            victims: list[tuple[str, Ticker]] = self.evict()
+        self.save(victims)
+        return session_id
+
+    def start(self, session_id: str, elevator: ElevatorBank) -> Ticker:
+        """
+        Starts the ticker of a session, which saves the session to its checkpoint when stopped.
+
+        Parameters:
+            session_id (str): The id of the session.
+            elevator (ElevatorBank): The elevator bank of the session.
+
+        Returns: The running ticker.
+        """
+        ticker: Ticker = Ticker(
+            elevator,
+            tick_rate=None,
+            checkpoint_file=CheckpointFile(self.path(session_id)),
+        )
+        ticker.start()
+        return ticker
+
+    @contextmanager
+    def session(self, session_id: str) -> Iterator[Ticker]:
+        """
+        Uses a session, restoring it from disk if it is not in memory. The session is kept in memory until the request
+        using it is done.
+
+        Parameters:
+            session_id (str): The id of the session.
+
+        Returns: The ticker of the session, through which every change to its elevator bank is made.
+        """
+        ticker: Ticker | None = self.acquire(session_id)
+        if ticker is None:
+            try:
+                # ? Ids of restored persons are kept, and new ids continue past every session's.
+                ticker = self.start(
+                    session_id,
+                    CheckpointFile(self.path(session_id)).load(restore_id=False),
+                )
+            except BaseException:
+                with self.changed:
+                    self.busy.discard(session_id)
+                    self.release(session_id)
+                    self.changed.notify_all()
+                raise
+            with self.changed:
+                self.sessions[session_id] = ticker
+                self.busy.discard(session_id)
+                self.changed.notify_all()
+        with self.lock:
+            victims: list[tuple[str, Ticker]] = self.evict()
+        self.save(victims)
+        try:
+            yield ticker
+        finally:
+            with self.lock:
+                self.release(session_id)
+                victims = self.evict()
+            self.save(victims)
+
+    def acquire(self, session_id: str) -> Ticker | None:
+        """
+        Pins a session, once it is not being restored or saved by another request.
+
+        Parameters:
+            session_id (str): The id of the session.
+
+        Returns: The ticker of the session, or None if the session is on disk, in which case it is marked busy for the
+            caller to restore.
+        """
+        with self.changed:
+            self.changed.wait_for(lambda: session_id not in self.busy)
+            ticker: Ticker | None = self.sessions.get(session_id)
+            if ticker is None:
+                if not self.exists(session_id):
+                    raise SessionNotFound(session_id)
+                self.busy.add(session_id)
+            else:
+                self.sessions.move_to_end(session_id)
+            self.pins[session_id] = self.pins.get(session_id, 0) + 1
+        return ticker
+
+    def release(self, session_id: str) -> None:
+        """
+        Unpins a session. Called with the lock held.
+
+        Parameters:
+            session_id (str): The id of the session.
+        """
+        self.pins[session_id] -= 1
+        if not self.pins[session_id]:
+            del self.pins[session_id]
+
+    def delete(self, session_id: str) -> None:
+        """
+        Removes a session from memory and disk.
+
+        Parameters:
+            session_id (str): The id of the session.
+        """
+        with self.changed:
+            self.changed.wait_for(lambda: session_id not in self.busy)
+            if not self.exists(session_id):
+                raise SessionNotFound(session_id)
+            if session_id in self.pins:
+                raise RuntimeError(f"Session {session_id} is in use.")
+            ticker: Ticker | None = self.sessions.pop(session_id, None)
+            if ticker is not None:
+                ticker.checkpoint_file = None
+            if os.path.exists(self.path(session_id)):
+                os.remove(self.path(session_id))
+        if ticker is not None:
+            ticker.stop()
+
+    def evict(self) -> list[tuple[str, Ticker]]:
+        """
+        Drops the least recently used sessions not in use until the sessions in memory are within the budget, and
+        marks them busy until saved. Called with the lock held.
+
+        Returns: The id and ticker of each session dropped, to be saved with save() once the lock is released.
+        """
+        sizes: dict[str, int] = {
+            session_id: self.estimate_size(ticker.elevator)
+            for session_id, ticker in self.sessions.items()
+        }
+        total: int = sum(sizes.values())
+        victims: list[tuple[str, Ticker]] = []
+        for session_id in list(self.sessions):
+            if total <= self.memory_budget:
+                break
+            if session_id in self.pins:
+                continue
+            victims.append((session_id, self.sessions.pop(session_id)))
+            self.busy.add(session_id)
+            total -= sizes[session_id]
+        return victims
+
+    def save(self, victims: list[tuple[str, Ticker]]) -> None:
+        """
+        Stops the tickers of dropped sessions, which applies any commands still queued and saves them, then marks them
+        no longer busy. Called without the lock held.
+
+        Parameters:
+            victims (list[tuple[str, Ticker]]): The id and ticker of each session dropped.
+        """
+        for session_id, ticker in victims:
+            try:
+                ticker.stop()
+            finally:
+                with self.changed:
+                    self.busy.discard(session_id)
+                    self.changed.notify_all()
+
+    def close(self) -> None:
+        """Saves and drops every session in memory."""
+        with self.lock:
+            victims: list[tuple[str, Ticker]] = list(self.sessions.items())
+            self.sessions.clear()
+            self.busy.update(session_id for session_id, _ in victims)
+        self.save(victims)
+
+    @staticmethod
+    def estimate_size(elevator: ElevatorBank) -> int:
+        """
+        Estimates the memory used by an elevator bank, from the size of its passenger table and its cars.
+
+        Parameters:
+            elevator (ElevatorBank): The elevator bank.
+
+        Returns: The estimated bytes.
+        """
+        passengers: PassengerTable = elevator.passengers
+        return (
+            SESSION_OVERHEAD
+            + sum(
+                getattr(passengers, column).nbytes for column in PassengerTable.COLUMNS
+            )
+            + PERSON_OVERHEAD * len(passengers)
+            + sum(
+                CAR_OVERHEAD + FLOOR_OVERHEAD * len(car.persons)
+                for car in elevator.cars
+            )
+        )
@@ -0,0 +1,174 @@
+"""
+simulation.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the Simulation object, which runs the elevator state machine headlessly for a given number of steps.
+"""
+
+from src.classes.elevator import Elevator
+from src.classes.passenger_table import PassengerTable
+from src.utils.building_config import BuildingConfig
+
+
+class Simulation:
+    """
+    Runs an Elevator through a schedule of events without the Flask server, keeping only aggregate results.
+    """
+
+    def __init__(
+        self,
+        elevator: Elevator | None = None,
+        schedule: dict | None = None,
+        seed: int | None = None,
+        config: BuildingConfig | None = None,
+    ) -> None:
+        """
+        The simulation begins at step zero, with a new elevator if none is given. A new elevator serves the given
+        building, or the default building if none is given, and generates the weights and cargo of scheduled persons
+        from the given seed, so the same seed gives the same results.
+
+        Attributes:
+            elevator (Elevator): The elevator being simulated.
+            schedule (dict[int, dict]): Events keyed by the step they are applied before, each event follows the format
+                of {"buttons": list, "persons": list}, where the lists match the bodies of the press_button and
+                create_person routes.
+            step_count (int): The number of steps taken so far.
+            totals (dict[str, int]): Running totals of the floors travelled, doors opened, persons created and buttons
+                pressed.
+            snapshots (list[dict]): Sampled snapshots of the elevator state.
+        """
+        self.elevator: Elevator = (
+            elevator
+            if elevator is not None
+            else Elevator(PassengerTable(seed=seed, config=config))
+        )
+        self.schedule: dict[int, dict] = {
+            int(step): event for step, event in (schedule or {}).items()
+        }
+        self.step_count: int = 0
+        self.totals: dict[str, int] = {
+            "floors_travelled": 0,
+            "door_openings": 0,
+            "persons_created": 0,
+            "buttons_pressed": 0,
+        }
+        self.snapshots: list[dict] = []
+        self.initial_persons: int = self.count_persons()
+
+    def run(self, steps: int, snapshot_every: int = 0) -> dict:
+        """
+        Runs the elevator for the given number of steps, applying scheduled events as their step is reached.
+
+        Parameters:
+            steps (int): The number of steps to take.
+            snapshot_every (int): Record a snapshot every given number of steps, defaults to 0 (no snapshots).
+
+        Returns: The aggregate results of the simulation so far.
+        """
+        end: int = self.step_count + steps
+        event_steps: list[int] = sorted(
+            step for step in self.schedule if self.step_count <= step < end
+        )
+
+        while self.step_count < end:
+            if event_steps and event_steps[0] == self.step_count:
+                self.apply_event(self.schedule[event_steps.pop(0)])
+
+            # ? Run uninterrupted until the next event, snapshot or the end of the run.
+            chunk_end: int = event_steps[0] if event_steps else end
+            if snapshot_every > 0:
+                chunk_end = min(
+                    chunk_end, (self.step_count // snapshot_every + 1) * snapshot_every
+                )
+            self.run_chunk(chunk_end - self.step_count)
+
+            if snapshot_every > 0 and self.step_count % snapshot_every == 0:
+                self.snapshots.append(self.snapshot())
+
+        return self.results()
+
+    def run_chunk(self, steps: int) -> None:
+        """
+        Runs the elevator for the given number of steps with no events in between, jumping through idle steps and
+        runs of moves at once.
+
+        Parameters:
+            steps (int): The number of steps to take.
+        """
+        elevator: Elevator = self.elevator
+        floors_travelled: int = 0
+        door_openings: int = 0
+
+        while steps > 0:
+            floor: int = elevator.current_floor
+            was_open: bool = elevator.is_open
+            taken: int = elevator.advance(steps)
+            steps -= taken
+            self.step_count += taken
+            floors_travelled += abs(elevator.current_floor - floor)
+            if elevator.is_open and not was_open:
+                door_openings += 1
+
+        self.totals["floors_travelled"] += floors_travelled
+        self.totals["door_openings"] += door_openings
+
+    def apply_event(self, event: dict) -> None:
+        """
+        Presses the buttons and creates the persons of a scheduled event.
+
+        Parameters:
+            event (dict): The event to apply, following the format of {"buttons": list, "persons": list}.
+        """
+        for button in event.get("buttons", []):
+            self.elevator.process_request(**button)
+            self.totals["buttons_pressed"] += 1
+        if event.get("persons"):
+            rows: range = self.elevator.passengers.extend_records(event["persons"])
+            self.elevator.add_person_rows(rows)
+            self.totals["persons_created"] += len(rows)
+
+    def count_persons(self) -> int:
+        """
+        Counts the persons still in the simulation.
+
+        Returns: The number of persons waiting on floors or riding the elevator.
+        """
+        return sum(len(persons) for persons in self.elevator.persons.values())
+
+    def snapshot(self) -> dict:
+        """
+        Captures the current state of the elevator.
+
+        Returns: A dictionary of the current step, floor, status, queues and the number of persons waiting and riding.
+        """
+        riding: int = len(self.elevator.persons["elevator"])
+        return {
+            "step": self.step_count,
+            "floor": self.elevator.current_floor,
+            "status": "Open" if self.elevator.is_open else "Moving",
+            "priority_queue": list(self.elevator.priority_queue),
+            "up_queue": list(self.elevator.up_queue),
+            "down_queue": list(self.elevator.down_queue),
+            "waiting": self.count_persons() - riding,
+            "riding": riding,
+        }
+
+    def results(self) -> dict:
+        """
+        Summarizes the simulation.
+
+        Returns: A dictionary of the aggregate totals, the persons delivered, the final state and any snapshots.
+        """
+        final_state: dict = self.snapshot()
+        return {
+            "steps": self.step_count,
+            **self.totals,
+            "persons_delivered": self.initial_persons
+            + self.totals["persons_created"]
+            - final_state["waiting"]
+            - final_state["riding"],
+            "final_state": final_state,
+            "snapshots": self.snapshots,
+        }
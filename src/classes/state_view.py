@@ -0,0 +1,71 @@
+"""
+state_view.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the StateView object, a versioned snapshot of an elevator bank that is serialized at most once.
+"""
+
+from functools import cached_property
+
+from src.utils.serializer import to_json
+
+
+class StateView:
+    """
+    A published snapshot of an elevator bank and its version. The version only increases when the cars change, not
+    when only the step does, so a reader holding the entity tag of a version knows the cars have not changed while
+    the elevator steps in real time. The snapshot is serialized the first time it is read, and the serialized body is
+    shared by every later read.
+    """
+
+    def __init__(self, state: dict, version: int = 0, token: str = "") -> None:
+        """
+        The view should not be changed once created, a new view replaces it.
+
+        Attributes:
+            state (dict): The snapshot of the elevator bank, in the form of StepTracer.snapshot().
+            version (int): The number of times the snapshot has changed.
+            etag (str): The entity tag of the version, unique to the token and version.
+        """
+        self.state: dict = state
+        self.version: int = version
+        self.etag: str = f"{token}-{version}"
+
+    def replace(self, state: dict) -> "StateView":
+        """
+        Creates the view of a newer snapshot.
+
+        Parameters:
+            state (dict): The newer snapshot.
+
+        Returns: This view if the snapshot is unchanged, a view of the same version if only the step has changed,
+            otherwise a view of the next version.
+        """
+        if state == self.state:
+            return self
+        token: str = self.etag.rsplit("-", 1)[0]
+        if self.versioned(state) == self.versioned(self.state):
+            return StateView(state, self.version, token)
+        return StateView(state, self.version + 1, token)
+
+    @staticmethod
+    def versioned(state: dict) -> dict:
+        """
+        Finds the part of a snapshot that is versioned.
+
+        Parameters:
+            state (dict): The snapshot, of a bank or a car.
+
+        Returns: The snapshot without the step of the bank or any of its cars.
+        """
+        content: dict = {key: value for key, value in state.items() if key != "step"}
+        if "cars" in content:
+            content["cars"] = [StateView.versioned(car) for car in content["cars"]]
+        return content
+
+    @cached_property
+    def body(self) -> bytes:
+        """The snapshot and its version as JSON, serialized on first read."""
+        return to_json({"version": self.version, **self.state})
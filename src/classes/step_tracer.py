@@ -0,0 +1,156 @@
+"""
+step_tracer.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the StepTracer object, which records snapshots of the elevator or elevator bank as it steps.
+"""
+
+import logging
+from collections import deque
+from collections.abc import Iterator
+
+from src.classes.elevator import Elevator
+from src.classes.elevator_bank import ElevatorBank
+
+
+class StepTracer:
+    """
+    Records sampled snapshots of the elevator after its steps to the debug log and a buffer of the most recent
+    snapshots. Snapshots are only built when they will be logged or kept.
+    """
+
+    def __init__(
+        self, logger: logging.Logger, sample_every: int = 1, buffer_size: int = 0
+    ) -> None:
+        """
+        The tracer begins with an empty buffer.
+
+        Attributes:
+            logger (logging.Logger): The logger snapshots are written to at the debug level.
+            sample_every (int): The minimum number of steps between snapshots.
+            snapshots (deque[dict]): The most recent snapshots, holding at most the buffer size.
+            last_step (int | None): The step of the last snapshot, or None if none have been recorded.
+        """
+        self.logger: logging.Logger = logger
+        self.sample_every: int = max(1, sample_every)
+        self.snapshots: deque[dict] = deque(maxlen=max(0, buffer_size))
+        self.last_step: int | None = None
+
+    def enabled(self) -> bool:
+        """
+        Checks if recorded snapshots will be used.
+
+        Returns: True if the buffer holds snapshots or the logger writes debug messages, otherwise False.
+        """
+        return bool(self.snapshots.maxlen) or self.logger.isEnabledFor(logging.DEBUG)
+
+    def record(self, elevator: Elevator | ElevatorBank) -> None:
+        """
+        Records a snapshot of the elevator, if enough steps have been taken since the last snapshot.
+
+        Parameters:
+            elevator (Elevator | ElevatorBank): The elevator or bank of elevators to record.
+        """
+        if (
+            self.last_step is not None
+            and elevator.step_count - self.last_step < self.sample_every
+        ):
+            return
+        self.last_step = elevator.step_count
+        snapshot: dict = self.snapshot(elevator)
+        self.snapshots.append(snapshot)
+        self.logger.debug("Step %s: %s", snapshot["step"], snapshot)
+
+    @staticmethod
+    def snapshot(elevator: Elevator | ElevatorBank) -> dict:
+        """
+        Captures the current state of the elevator.
+
+        Parameters:
+            elevator (Elevator | ElevatorBank): The elevator or bank of elevators to capture.
+
+        Returns: A dictionary of the step, floor, status, queues and the number of persons at each location, or of the
+            step and a snapshot of each car for a bank.
+        """
+        if isinstance(elevator, ElevatorBank):
+            return {
+                "step": elevator.step_count,
+                "cars": [StepTracer.snapshot(car) for car in elevator.cars],
+            }
+        return {
+            "step": elevator.step_count,
+            "floor": elevator.current_floor,
+            "status": "Open" if elevator.is_open else "Moving",
+            "priority_queue": list(elevator.priority_queue),
+            "up_queue": list(elevator.up_queue),
+            "down_queue": list(elevator.down_queue),
+            "persons": {
+                location: len(persons)
+                for location, persons in elevator.persons.items()
+                if persons
+            },
+        }
+
+    @staticmethod
+    def changes(elevator: Elevator | ElevatorBank, steps: int) -> Iterator[dict]:
+        """
+        Takes steps with the elevator, yielding a compact record each time the state of a car changes. Steps are only
+        taken as records are requested, so any number of steps uses the same memory. Runs of moves through floors where
+        nothing happens are taken at once, and recorded once.
+
+        Parameters:
+            elevator (Elevator | ElevatorBank): The elevator or bank of elevators to step.
+            steps (int): The number of steps to take.
+
+        Returns: The records, each of the step, car, floor, if the doors are open, the length of each queue, and the
+            number of persons who boarded and alighted since the car's last record.
+        """
+        cars: list[Elevator] = (
+            elevator.cars if isinstance(elevator, ElevatorBank) else [elevator]
+        )
+        states: list[tuple] = [StepTracer.car_state(car) for car in cars]
+        counts: list[tuple[int, int]] = [
+            (car.boardings, car.alightings) for car in cars
+        ]
+        remaining_steps: int = steps
+        while remaining_steps > 0:
+            remaining_steps -= elevator.advance(remaining_steps)
+            for index, car in enumerate(cars):
+                state: tuple = StepTracer.car_state(car)
+                count: tuple[int, int] = (car.boardings, car.alightings)
+                if state == states[index] and count == counts[index]:
+                    continue
+                floor, is_open, priority, up, down = state
+                yield {
+                    "step": car.step_count,
+                    "car": index,
+                    "floor": floor,
+                    "open": is_open,
+                    "priority": priority,
+                    "up": up,
+                    "down": down,
+                    "boarded": count[0] - counts[index][0],
+                    "alighted": count[1] - counts[index][1],
+                }
+                states[index] = state
+                counts[index] = count
+
+    @staticmethod
+    def car_state(car: Elevator) -> tuple[int, bool, int, int, int]:
+        """
+        Captures the state of a car that is recorded by changes().
+
+        Parameters:
+            car (Elevator): The car to capture.
+
+        Returns: The floor, if the doors are open, and the length of the priority, up and down queues.
+        """
+        return (
+            car.current_floor,
+            car.is_open,
+            len(car.priority_queue),
+            len(car.up_queue),
+            len(car.down_queue),
+        )
@@ -0,0 +1,150 @@
+"""
+stop_queue.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the StopQueue object, which holds the floors queued in one direction of travel.
+"""
+
+
+class StopQueue:
+    """
+    A set of floors to stop at, ordered by the closest floor in the direction of travel at the time the last floor was
+    queued, followed by the remaining floors on the return.
+
+    The floors are held as a bitset, so checking for a floor is a single bit test and finding the next floor is a
+    single bit scan, no matter how many floors are queued.
+    """
+
+    def __init__(self) -> None:
+        """
+        The queue begins empty.
+
+        Attributes:
+            bits (int): A bitset of the queued floors, where bit n is set if floor n is queued.
+            size (int): The number of queued floors.
+            pivot_floor (int): The floor the elevator was on when the last floor was queued.
+            pivot_up (bool): The direction of the elevator when the last floor was queued.
+        """
+        self.bits: int = 0
+        self.size: int = 0
+        self.pivot_floor: int = 1
+        self.pivot_up: bool = True
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, stop: int) -> bool:
+        return stop > 0 and bool(self.bits >> stop & 1)
+
+    def __iter__(self):
+        above: list[int] = self.floors(self.bits >> self.pivot_floor, self.pivot_floor)
+        below: list[int] = self.floors(self.bits & ((1 << self.pivot_floor) - 1), 0)
+        below.reverse()
+        return iter(above + below if self.pivot_up else below + above)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, StopQueue)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    @staticmethod
+    def floors(bits: int, offset: int) -> list[int]:
+        """
+        Lists the floors of a bitset in ascending order.
+
+        Parameters:
+            bits (int): The bitset of floors.
+            offset (int): The floor of the lowest bit.
+
+        Returns: The floors in the bitset.
+        """
+        floors: list[int] = []
+        while bits:
+            lowest_bit: int = bits & -bits
+            floors.append(lowest_bit.bit_length() - 1 + offset)
+            bits ^= lowest_bit
+        return floors
+
+    def add(self, stop: int, current_floor: int, direction_up: bool) -> bool:
+        """
+        Queues a floor, reordering the queue around the current floor and direction of travel.
+
+        Parameters:
+            stop (int): The floor to queue.
+            current_floor (int): The current floor of the elevator.
+            direction_up (bool): The current direction of the elevator.
+
+        Returns: True if the floor was queued, False if it was already queued.
+        """
+        if stop in self:
+            return False
+        self.bits |= 1 << stop
+        self.size += 1
+        self.pivot_floor = current_floor
+        self.pivot_up = direction_up
+        return True
+
+    def add_floors(self, bits: int, current_floor: int, direction_up: bool) -> bool:
+        """
+        Queues every floor of a bitset at once, the same as adding each floor in turn.
+
+        Parameters:
+            bits (int): The bitset of floors to queue, where bit n is floor n.
+            current_floor (int): The current floor of the elevator.
+            direction_up (bool): The current direction of the elevator.
+
+        Returns: True if any floor was queued, False if every floor was already queued.
+        """
+        new_bits: int = bits & ~self.bits
+        if not new_bits:
+            return False
+        self.bits |= new_bits
+        self.size += new_bits.bit_count()
+        self.pivot_floor = current_floor
+        self.pivot_up = direction_up
+        return True
+
+    def discard(self, stop: int) -> None:
+        """
+        Removes a floor from the queue if queued.
+
+        Parameters:
+            stop (int): The floor to remove.
+        """
+        if stop in self:
+            self.bits ^= 1 << stop
+            self.size -= 1
+
+    def clear(self) -> None:
+        """Removes all floors from the queue."""
+        self.bits = 0
+        self.size = 0
+
+    def peek(self) -> int:
+        """
+        Finds the next floor in the queue.
+
+        Returns: The closest floor in the direction of travel, or the closest floor on the return if there are none.
+        """
+        if not self.bits:
+            raise IndexError("peek from an empty StopQueue")
+        above: int = self.bits >> self.pivot_floor
+        below: int = self.bits & ((1 << self.pivot_floor) - 1)
+        if self.pivot_up and above or not below:
+            return (above & -above).bit_length() - 1 + self.pivot_floor
+        return below.bit_length() - 1
+
+    def popleft(self) -> int:
+        """
+        Removes the next floor in the queue.
+
+        Returns: The floor removed.
+        """
+        stop: int = self.peek()
+        self.discard(stop)
+        return stop
@@ -0,0 +1,202 @@
+"""
+sweep_runner.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the SweepRunner object, which runs seeded elevator simulations for many configurations across a process pool.
+"""
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.classes.elevator import Elevator
+from src.classes.passenger_table import PassengerTable
+from src.utils.building_config import BuildingConfig, default_config
+
+SWEPT_CONSTANTS: dict[str, str] = {
+    "TOP_FLOOR": "top_floor",
+    "MAX_CAPACITY": "max_capacity",
+    "MAX_WEIGHT": "max_weight",
+}
+
+
+def run_scenario(configuration: dict, seed: int, steps: int) -> dict:
+    """
+    Runs one seeded simulation of an elevator with persons arriving at random, as a Poisson process, between random
+    floors.
+
+    Parameters:
+        configuration (dict): The TOP_FLOOR, MAX_CAPACITY and MAX_WEIGHT of the building, defaulting to the values in
+            constants.py, and the "arrival_rate" of persons per step.
+        seed (int): The seed of the arrivals, weights and cargo.
+        steps (int): The number of steps to run.
+
+    Returns: A dictionary of the persons created and the wait and trip times of the persons who boarded and alighted.
+    """
+    config: BuildingConfig = BuildingConfig(
+        **{
+            attribute: configuration[name]
+            for name, attribute in SWEPT_CONSTANTS.items()
+            if name in configuration
+        }
+    )
+    passengers: PassengerTable = PassengerTable(seed=seed, config=config)
+    elevator: Elevator = Elevator(passengers)
+    arrival_steps, origins, destinations = random_arrivals(
+        passengers, configuration["arrival_rate"], steps
+    )
+    count: int = len(arrival_steps)
+
+    arrival_bounds: list[int] = np.flatnonzero(
+        np.diff(arrival_steps, prepend=-1)
+    ).tolist() + [count]
+    for start, end in zip(arrival_bounds, arrival_bounds[1:]):
+        elevator.fast_forward(arrival_steps.item(start) - elevator.step_count)
+        rows: range = passengers.extend(origins[start:end], destinations[start:end])
+        elevator.add_person_rows(rows)
+    elevator.fast_forward(steps - elevator.step_count)
+
+    return {
+        "persons_created": count,
+        "wait_times": passengers.wait_times(),
+        "trip_times": passengers.trip_times(),
+    }
+
+
+def random_arrivals(
+    passengers: PassengerTable, arrival_rate: float, steps: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Draws persons arriving at random, as a Poisson process, between random floors.
+
+    Parameters:
+        passengers (PassengerTable): The table whose random number generator to draw from.
+        arrival_rate (float): The mean persons arriving per step.
+        steps (int): The number of steps to draw arrivals for.
+
+    Returns: The step each person arrives before, in ascending order, and their origins and destinations.
+    """
+    count: int = passengers.rng.poisson(arrival_rate * steps)
+    arrival_steps: np.ndarray = np.sort(passengers.rng.integers(0, steps, size=count))
+    origins: np.ndarray = passengers.random_floors(count)
+    destinations: np.ndarray = passengers.random_floors(count)
+    # ? Persons travel to a different floor, redrawing the destinations of those who would not.
+    same: np.ndarray = origins == destinations
+    while same.any():
+        destinations[same] = passengers.random_floors(int(same.sum()))
+        same = origins == destinations
+    return arrival_steps, origins, destinations
+
+
+class SweepRunner:
+    """
+    Runs independent seeded simulations of every combination of swept values, fanned out over a pool of processes,
+    and aggregates the wait and trip times of each configuration.
+    """
+
+    def __init__(
+        self,
+        sweep: dict[str, list],
+        runs: int = 10,
+        steps: int = 10000,
+        seed: int | None = None,
+    ) -> None:
+        """
+        The configurations are every combination of the swept values, with the values in constants.py for any not
+        swept.
+        Every configuration is run with the same seeds, so configurations are compared on the same arrivals.
+
+        Attributes:
+            configurations (list[dict]): The constants and arrival rate of each configuration.
+            runs (int): The number of simulations of each configuration.
+            steps (int): The number of steps of each simulation.
+            seeds (list[int]): The seed of each simulation of a configuration, drawn from the given seed.
+        """
+        defaults: dict = {
+            name: [getattr(default_config(), attribute)]
+            for name, attribute in SWEPT_CONSTANTS.items()
+        }
+        defaults["arrival_rate"] = [0.1]
+        swept: dict[str, list] = {**defaults, **sweep}
+        self.configurations: list[dict] = [
+            dict(zip(swept, values)) for values in itertools.product(*swept.values())
+        ]
+        self.runs: int = runs
+        self.steps: int = steps
+        self.seeds: list[int] = (
+            np.random.SeedSequence(seed).generate_state(runs).tolist()
+        )
+
+    def run(self, workers: int | None = None) -> list[dict]:
+        """
+        Runs every simulation of every configuration.
+
+        Parameters:
+            workers (int | None): The number of processes to use, the number of processors if None, or 1 to run in
+                this process.
+
+        Returns: The aggregated results of each configuration, in order.
+        """
+        tasks: list[tuple[dict, int, int]] = [
+            (configuration, seed, self.steps)
+            for configuration in self.configurations
+            for seed in self.seeds
+        ]
+        if workers == 1:
+            outcomes: list[dict] = [run_scenario(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(run_scenario, *zip(*tasks)))
+
+        return [
+            self.aggregate(
+                configuration,
+                outcomes[index * self.runs : (index + 1) * self.runs],
+            )
+            for index, configuration in enumerate(self.configurations)
+        ]
+
+    def aggregate(self, configuration: dict, outcomes: list[dict]) -> dict:
+        """
+        Combines the simulations of a configuration.
+
+        Parameters:
+            configuration (dict): The configuration simulated.
+            outcomes (list[dict]): The results of each simulation.
+
+        Returns: A dictionary of the configuration, persons created and delivered, throughput per step, and the mean,
+            p50, p95 and p99 of the wait and trip times.
+        """
+        wait_times: np.ndarray = np.concatenate(
+            [outcome["wait_times"] for outcome in outcomes]
+        )
+        trip_times: np.ndarray = np.concatenate(
+            [outcome["trip_times"] for outcome in outcomes]
+        )
+        return {
+            "configuration": configuration,
+            "runs": len(outcomes),
+            "persons_created": sum(outcome["persons_created"] for outcome in outcomes),
+            "persons_delivered": len(trip_times),
+            "throughput": len(trip_times) / (self.steps * len(outcomes)),
+            "wait_time": self.summarize(wait_times),
+            "trip_time": self.summarize(trip_times),
+        }
+
+    @staticmethod
+    def summarize(times: np.ndarray) -> dict:
+        """
+        Summarizes a set of times.
+
+        Parameters:
+            times (np.ndarray): The times to summarize.
+
+        Returns: A dictionary of the mean, p50, p95 and p99, or None for each if there are no times.
+        """
+        if times.size == 0:
+            return {"mean": None, "p50": None, "p95": None, "p99": None}
+        p50, p95, p99 = np.percentile(times, [50, 95, 99]).tolist()
+        return {"mean": times.mean().item(), "p50": p50, "p95": p95, "p99": p99}
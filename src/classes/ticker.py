@@ -0,0 +1,215 @@
+"""
+ticker.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the Ticker object, the single worker thread that changes an elevator bank, stepping it in real time or on
+request.
+"""
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+from src.classes.checkpoint import CheckpointFile
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.event_log import EventLog
+from src.classes.state_view import StateView
+from src.classes.step_tracer import StepTracer
+
+logger = logging.getLogger("Elevator")
+
+
+# pylint: disable-next=too-many-instance-attributes
+class Ticker:
+    """
+    The only thread that changes an elevator bank. Commands are submitted to an inbox and applied in the order
+    submitted, and a snapshot of the bank is published after they are applied, so other threads read the snapshot
+    rather than the bank. With a tick rate, the bank is also stepped in real time, and commands are applied at the
+    start of the next tick, so submitting a command never waits on the simulation.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        elevator: ElevatorBank,
+        tick_rate: float | None = 1.0,
+        tracer: StepTracer | None = None,
+        event_log: EventLog | None = None,
+        *,
+        checkpoint_file: CheckpointFile | None = None,
+    ) -> None:
+        """
+        The ticker begins stopped, with an empty inbox and a snapshot of the bank as given.
+
+        Attributes:
+            elevator (ElevatorBank): The elevator bank to change.
+            interval (float | None): The seconds between ticks, or None to only change the bank on request.
+            tracer (StepTracer | None): The tracer to record each tick with, or None to not record.
+            event_log (EventLog | None): The log of the bank's commands, kept up to date with its steps, or None.
+            checkpoint_file (CheckpointFile | None): The file the bank is saved to as it steps and when the ticker
+                stops, or None.
+            inbox (queue.SimpleQueue[tuple[Callable[[], Any], Future] | None]): The commands waiting to be applied,
+                each with the future of its result.
+            view (StateView): The latest snapshot of the bank. Views are replaced, never changed, so a view read by
+                another thread stays consistent. Versions are unique to this ticker.
+            thread (threading.Thread | None): The worker thread, or None if not started.
+            stopping (threading.Event): Set to stop the thread.
+        """
+        self.elevator: ElevatorBank = elevator
+        self.interval: float | None = None if tick_rate is None else 1 / tick_rate
+        self.tracer: StepTracer | None = tracer
+        self.event_log: EventLog | None = event_log
+        self.checkpoint_file: CheckpointFile | None = checkpoint_file
+        self.inbox: queue.SimpleQueue[tuple[Callable[[], Any], Future] | None] = (
+            queue.SimpleQueue()
+        )
+        self.view: StateView = StateView(
+            StepTracer.snapshot(elevator), token=uuid.uuid4().hex
+        )
+        self.thread: threading.Thread | None = None
+        self.stopping: threading.Event = threading.Event()
+
+    def running(self) -> bool:
+        """
+        Checks if the worker thread is applying commands.
+
+        Returns: True if the thread is alive, otherwise False.
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+    def submit(self, command: Callable[[], Any]) -> Future:
+        """
+        Adds a command to the inbox, to be applied by the worker thread.
+
+        Parameters:
+            command (Callable[[], Any]): The command, which may change the elevator bank when called.
+
+        Returns: The future of the command's result, set once the snapshot after it is published.
+        """
+        future: Future = Future()
+        self.inbox.put((command, future))
+        return future
+
+    def drain(
+        self, request: tuple[Callable[[], Any], Future] | None = None
+    ) -> list[tuple[Future, Any, Exception | None]]:
+        """
+        Applies every command in the inbox, in the order submitted. A command that fails is logged and skipped.
+
+        Parameters:
+            request (tuple[Callable[[], Any], Future] | None): A command already taken from the inbox, to apply first.
+
+        Returns: The future, result and any exception of each command applied, to be set once published.
+        """
+        outcomes: list[tuple[Future, Any, Exception | None]] = []
+        while True:
+            if request is None:
+                try:
+                    request = self.inbox.get_nowait()
+                except queue.Empty:
+                    return outcomes
+                # ? The stop sentinel only wakes the thread.
+                if request is None:
+                    continue
+            command, future = request
+            request = None
+            if not future.set_running_or_notify_cancel():
+                continue
+            # ? Any failure is handed to the submitter rather than stopping the worker.
+            try:
+                outcomes.append((future, command(), None))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.warning("Skipped command: %s", exc)
+                outcomes.append((future, None, exc))
+
+    def publish(self, outcomes: list[tuple[Future, Any, Exception | None]]) -> None:
+        """
+        Publishes a snapshot of the elevator bank, as a new version if it changed, then sets the futures of the
+        commands applied before it. Any checkpoint due is written to the event log and checkpoint file first.
+
+        Parameters:
+            outcomes (list[tuple[Future, Any, Exception | None]]): The future, result and any exception of each
+                command applied.
+        """
+        if self.event_log is not None:
+            self.event_log.sync()
+        if self.checkpoint_file is not None:
+            self.checkpoint_file.sync(self.elevator)
+        self.view = self.view.replace(StepTracer.snapshot(self.elevator))
+        for future, result, exc in outcomes:
+            if exc is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exc)
+
+    def tick(self) -> None:
+        """Applies the commands in the inbox, takes the next step of the elevator bank, then publishes."""
+        outcomes: list[tuple[Future, Any, Exception | None]] = self.drain()
+        self.elevator.update()
+        if self.tracer is not None and self.tracer.enabled():
+            self.tracer.record(self.elevator)
+        self.publish(outcomes)
+
+    def start(self) -> None:
+        """Starts the worker thread, if not already running."""
+        if self.running():
+            return
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, name="Ticker", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stops the worker thread, waiting for the current tick or commands to finish.
+
+        Parameters:
+            timeout (float | None): The most seconds to wait for the thread, or None to wait until it stops.
+        """
+        self.stopping.set()
+        self.inbox.put(None)
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def run(self) -> None:
+        """Applies commands until stopped, ticking at the tick rate if there is one, run by the worker thread."""
+        if self.interval is None:
+            while not self.stopping.is_set():
+                request: tuple[Callable[[], Any], Future] | None = self.inbox.get()
+                if request is not None:
+                    self.publish(self.drain(request))
+            self.finish()
+            return
+
+        next_tick: float = time.monotonic() + self.interval
+        while not self.stopping.wait(max(0.0, next_tick - time.monotonic())):
+            self.tick()
+            # ? A tick that runs late starts the schedule again, rather than rushing through the missed ticks.
+            next_tick = max(next_tick + self.interval, time.monotonic())
+        self.finish()
+
+    def finish(self) -> None:
+        """
+        Applies the commands still in the inbox once stopped, so a command accepted before the ticker stopped is never
+        lost, then flushes.
+        """
+        outcomes: list[tuple[Future, Any, Exception | None]] = self.drain()
+        if outcomes:
+            self.publish(outcomes)
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the steps taken and any buffered records to the event log, and saves the bank to the checkpoint file,
+        for those there are.
+        """
+        if self.event_log is not None:
+            self.event_log.flush()
+        if self.checkpoint_file is not None:
+            self.checkpoint_file.save(self.elevator)
@@ -2,11 +2,14 @@
 utils
 Samuel Koller
 Created: 18 October 2024
-Updated: 22 October 2024
+Updated: 17 October 2026
 
 Contains utilities for the program, such as configurations.
 """
 
+from .building_config import *
 from .constants import *
 from .custom_exceptions import *
 from .id_generator import *
+from .random_generator import *
+from .serializer import *
@@ -0,0 +1,145 @@
+"""
+building_config.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Class for the BuildingConfig object, which holds the shape and limits of the building an elevator serves.
+"""
+
+import numpy as np
+
+from src.utils import constants
+
+
+class BuildingConfig:
+    """
+    The floors of a building and the limits of its elevators, defaulting to the values in constants.py. Each elevator,
+    person and passenger table is given a configuration, so buildings of different shapes can be simulated side by side.
+    """
+
+    def __init__(
+        self,
+        top_floor: int = constants.TOP_FLOOR,
+        max_weight: float = constants.MAX_WEIGHT,
+        max_capacity: int = constants.MAX_CAPACITY,
+        skipped_floors=None,
+    ) -> None:
+        """
+        The configuration should not be changed once created, as it is shared by everything given it.
+
+        Attributes:
+            top_floor (int): The highest floor of the building.
+            max_weight (float): The most weight an elevator may carry.
+            max_capacity (int): The most persons an elevator may carry.
+            skipped_floors (frozenset[int]): The floors that do not exist, such as the thirteenth. The first and top
+                floors may not be skipped. Defaults to the floors in constants.py below the top floor, so a building
+                with a lower top floor drops the skipped floors it does not reach.
+            floors (np.ndarray): Every floor of the building, in ascending order.
+            floor_index (dict[int, int]): The position of each floor in floors.
+        """
+        self.top_floor: int = top_floor
+        self.max_weight: float = max_weight
+        self.max_capacity: int = max_capacity
+        self.skipped_floors: frozenset[int] = (
+            frozenset(skipped_floors)
+            if skipped_floors is not None
+            else frozenset(
+                floor for floor in constants.SKIPPED_FLOORS if floor < top_floor
+            )
+        )
+        if top_floor < 2 or {1, top_floor} & self.skipped_floors:
+            raise ValueError(
+                "A building needs a top floor above 1, and cannot skip its first or top floor."
+            )
+        self.floors: np.ndarray = np.array(
+            [
+                floor
+                for floor in range(1, top_floor + 1)
+                if floor not in self.skipped_floors
+            ],
+            dtype=np.int64,
+        )
+        self.floor_index: dict[int, int] = {
+            floor: index for index, floor in enumerate(self.floors.tolist())
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"BuildingConfig(top_floor={self.top_floor}, max_weight={self.max_weight}, "
+            f"max_capacity={self.max_capacity}, skipped_floors={sorted(self.skipped_floors)})"
+        )
+
+    def is_floor(self, floor) -> bool:
+        """
+        Checks if a floor is in the building.
+
+        Parameters:
+            floor (int): The floor to check.
+
+        Returns: True if the floor is in range and not skipped, otherwise False.
+        """
+        return floor in self.floor_index
+
+    def valid_floors(self, floors: np.ndarray) -> np.ndarray:
+        """
+        Checks if many floors are in the building at once.
+
+        Parameters:
+            floors (np.ndarray): The floors to check.
+
+        Returns: True for each floor in range and not skipped, otherwise False.
+        """
+        return np.isin(floors, self.floors)
+
+    def distance(self, start: int, end: int) -> int:
+        """
+        Counts the moves between two floors, skipping the skipped floors.
+
+        Parameters:
+            start (int): The floor to start from.
+            end (int): The floor to end at.
+
+        Returns: The number of moves.
+        """
+        low, high = sorted((start, end))
+        return (
+            high - low - sum(1 for floor in self.skipped_floors if low < floor < high)
+        )
+
+    def floor_after(self, floor: int, moves: int, up: bool) -> int:
+        """
+        Finds the floor reached after a number of moves, skipping the skipped floors.
+
+        Parameters:
+            floor (int): The floor to start from, which must be in the building.
+            moves (int): The number of moves to make.
+            up (bool): Move up if true, move down if false.
+
+        Returns: The floor reached, stopping at the first or top floor.
+        """
+        index: int = self.floor_index[floor] + (moves if up else -moves)
+        return self.floors.item(max(0, min(index, len(self.floors) - 1)))
+
+    def describe_floors(self) -> str:
+        """
+        Describes the floors of the building.
+
+        Returns: The range of floors, and any skipped floors within it.
+        """
+        skipped: list[int] = sorted(
+            floor for floor in self.skipped_floors if 1 < floor < self.top_floor
+        )
+        return f"1 <= floor <= {self.top_floor}" + (
+            f", excluding {', '.join(str(floor) for floor in skipped)}."
+            if skipped
+            else "."
+        )
+
+
+DEFAULT_CONFIG: BuildingConfig = BuildingConfig()
+
+
+def default_config() -> BuildingConfig:
+    """Returns the shared configuration built from the values in constants.py."""
+    return DEFAULT_CONFIG
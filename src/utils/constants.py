@@ -2,11 +2,54 @@
 constants.py
 Samuel Koller
 Created: 18 October 2024
-Updated: 22 October 2024
+Updated: 17 October 2026
 
 Configurable constants to edit the default program.
 """
 
-TOP_FLOOR: int = 20  # Default: 20, minimum of 20
+TOP_FLOOR: int = 20  # Default: 20, minimum of 2
 MAX_WEIGHT: float = 2000  # Default: 2000
 MAX_CAPACITY: int = 10  # Default: 10
+SKIPPED_FLOORS: tuple[int, ...] = (
+    13,
+)  # Default: (13,), floors the building does not have
+ELEVATOR_CARS: int = 1  # Default: 1, the number of cars in the elevator bank
+REAL_TIME: bool = False  # Default: False, step the elevator on a background thread
+TICK_RATE: float = 1.0  # Default: 1.0, the steps per second when stepping in real time
+RANDOM_SEED: int | None = None  # Default: None, a different seed each run
+LOG_LEVEL: str = (
+    "INFO"  # Default: INFO, DEBUG logs a snapshot of the elevator after its steps
+)
+METRICS_ENABLED: bool = (
+    False  # Default: False, time the elevator and requests for the metrics endpoint
+)
+JSON_SERIALIZER: str | None = (
+    None  # Default: None, orjson if installed, otherwise "json" for the standard library
+)
+TRACE_SAMPLE_EVERY: int = (
+    1  # Default: 1, the minimum number of steps between step snapshots
+)
+TRACE_BUFFER_SIZE: int = (
+    0  # Default: 0, the number of recent step snapshots kept for /trace, 0 to keep none and build none
+)
+EVENT_LOG_PATH: str | None = (
+    None  # Default: None, the file to append accepted commands to, None to not log them
+)
+EVENT_LOG_CHECKPOINT_EVERY: int = (
+    10000  # Default: 10000, the steps between checkpoints in the event log
+)
+CHECKPOINT_PATH: str | None = (
+    None  # Default: None, the file to save the elevator to and restore it from, None to not save it
+)
+CHECKPOINT_EVERY: int = (
+    10000  # Default: 10000, the steps between saves to CHECKPOINT_PATH, 0 to only save on shutdown
+)
+SESSION_DIRECTORY: str | None = (
+    None  # Default: None, the directory simulations under /sim are saved to, None for a temporary directory
+)
+SESSION_MEMORY_BUDGET: int = (
+    256  # Default: 256, the megabytes of simulations under /sim kept in memory before the least recent are saved
+)
+SESSION_MAX_CARS: int = (
+    64  # Default: 64, the most cars the elevator bank of a simulation under /sim may have
+)
@@ -2,26 +2,26 @@
 custom_exceptions.py
 Samuel Koller
 Created: 22 October 2024
-Updated: 22 October 2024
+Updated: 17 October 2026
 
 Custom Exceptions used throughout the program.
 """
 
-from src.utils.constants import TOP_FLOOR
+from src.utils.building_config import BuildingConfig, default_config
 
 
 class InvalidFloor(AttributeError):
     """
-    Custom exception for requesting an invalid floor.
+    Custom exception for requesting an invalid floor. The message describes the floors of the given building, or the
+    default building if none is given.
     """
 
-    def __init__(
-        self,
-        message=(
-            f"The selected floor is not in range, 1 <= floor <= {TOP_FLOOR}"
-            f"{', excluding 13.'if TOP_FLOOR > 13 else '.'}"
-        ),
-    ):
+    def __init__(self, message=None, config: BuildingConfig | None = None):
+        if message is None:
+            message = (
+                "The selected floor is not in range, "
+                + (config if config is not None else default_config()).describe_floors()
+            )
         super().__init__(message)
 
 
@@ -39,3 +39,28 @@ class InvalidButton(AttributeError):
         ),
     ):
         super().__init__(message)
+
+
+class InvalidPerson(TypeError):
+    """
+    Custom exception for submitting a person without an integer origin and destination, or with a weight or cargo
+    that is not a number.
+    """
+
+    def __init__(
+        self,
+        message=(
+            "A person must be an object with an integer origin and destination, and a numeric weight and cargo if "
+            "given."
+        ),
+    ):
+        super().__init__(message)
+
+
+class SessionNotFound(LookupError):
+    """
+    Custom exception for requesting a simulation session that does not exist, in memory or on disk.
+    """
+
+    def __init__(self, session_id: str):
+        super().__init__(f"Session {session_id} does not exist.")
@@ -2,7 +2,7 @@
 id_generator.py
 Samuel Koller
 Created: 19 October 2024
-Updated: 22 October 2024
+Updated: 17 October 2026
 
 Generates unique identifiers.
 """
@@ -15,3 +15,32 @@ def id_generator():
     global INITIAL_ID  # pylint: disable=global-statement
     INITIAL_ID += 1
     return INITIAL_ID
+
+
+def id_block(count: int) -> range:
+    """
+    Returns the next given number of ids and increments past them.
+
+    Parameters:
+        count (int): The number of ids to return.
+    """
+    global INITIAL_ID  # pylint: disable=global-statement
+    first_id: int = INITIAL_ID + 1
+    INITIAL_ID += count
+    return range(first_id, first_id + count)
+
+
+def next_id() -> int:
+    """Returns the id that will be generated next, without incrementing."""
+    return INITIAL_ID + 1
+
+
+def set_next_id(first_id: int) -> None:
+    """
+    Sets the id that will be generated next, such as when restoring a saved simulation.
+
+    Parameters:
+        first_id (int): The next id to generate.
+    """
+    global INITIAL_ID  # pylint: disable=global-statement
+    INITIAL_ID = first_id - 1
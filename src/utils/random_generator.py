@@ -0,0 +1,30 @@
+"""
+random_generator.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Holds the shared random number generator, so generated values are reproducible when seeded.
+"""
+
+import numpy as np
+
+from src.utils.constants import RANDOM_SEED
+
+GENERATOR: np.random.Generator = np.random.default_rng(RANDOM_SEED)
+
+
+def random_generator() -> np.random.Generator:
+    """Returns the shared random number generator."""
+    return GENERATOR
+
+
+def seed_random_generator(seed: int | None) -> None:
+    """
+    Replaces the shared random number generator with a newly seeded one.
+
+    Parameters:
+        seed (int | None): The seed to use, or None for an unpredictable seed.
+    """
+    global GENERATOR  # pylint: disable=global-statement
+    GENERATOR = np.random.default_rng(seed)
@@ -0,0 +1,114 @@
+"""
+serializer.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Serializes responses to JSON, with orjson when it is installed and the standard library otherwise.
+"""
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON: bool = True
+except ImportError:
+    HAS_ORJSON = False
+
+STREAM_BATCH_SIZE: int = 256
+
+
+def json_default(value: Any) -> Any:
+    """
+    Converts a value JSON does not support, such as a NumPy value or a queue of floors.
+
+    Parameters:
+        value (Any): The value to convert.
+
+    Returns: The value as a Python number or list.
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, Iterable):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_orjson(value: Any) -> bytes:
+    """Serializes a value to JSON with orjson, or the standard library for integers orjson can not hold."""
+    try:
+        return orjson.dumps(
+            value,
+            default=json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    except orjson.JSONEncodeError:
+        # ? orjson only holds 64-bit integers, and a larger one may be echoed back from a request.
+        return dumps_json(value)
+
+
+def dumps_json(value: Any) -> bytes:
+    """Serializes a value to JSON with the standard library."""
+    return json.dumps(value, default=json_default, separators=(",", ":")).encode()
+
+
+SERIALIZERS: dict[str, Callable[[Any], bytes]] = {"json": dumps_json}
+if HAS_ORJSON:
+    SERIALIZERS["orjson"] = dumps_orjson
+SERIALIZER: Callable[[Any], bytes] = SERIALIZERS.get("orjson", dumps_json)
+
+
+def use_serializer(name: str | None) -> None:
+    """
+    Replaces the serializer used by to_json().
+
+    Parameters:
+        name (str | None): "orjson" or "json", or None for orjson if it is installed.
+    """
+    global SERIALIZER  # pylint: disable=global-statement
+    if name is None:
+        name = "orjson" if HAS_ORJSON else "json"
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown or unavailable serializer: {name}")
+    SERIALIZER = SERIALIZERS[name]
+
+
+def to_json(value: Any) -> bytes:
+    """
+    Serializes a value to JSON with the serializer in use.
+
+    Parameters:
+        value (Any): The value to serialize.
+
+    Returns: The JSON, encoded as UTF-8.
+    """
+    return SERIALIZER(value)
+
+
+def iter_json(fields: dict, key: str, items: Iterable) -> Iterator[bytes]:
+    """
+    Serializes an object with a list of items to JSON in pieces, so a large list is streamed rather than built as one
+    string.
+
+    Parameters:
+        fields (dict): The other fields of the object.
+        key (str): The key of the list, after the other fields.
+        items (Iterable): The items of the list, serialized in batches as they are iterated.
+
+    Returns: The pieces of the JSON, encoded as UTF-8, which joined are to_json({**fields, key: list(items)}).
+    """
+    head: bytes = to_json(fields)
+    yield head[:-1] + (b"," if fields else b"") + to_json(key) + b":["
+    batch: list[bytes] = []
+    first: bool = True
+    for item in items:
+        batch.append(to_json(item))
+        if len(batch) == STREAM_BATCH_SIZE:
+            yield (b"" if first else b",") + b",".join(batch)
+            batch, first = [], False
+    if batch:
+        yield (b"" if first else b",") + b",".join(batch)
+    yield b"]}"
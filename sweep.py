@@ -0,0 +1,84 @@
+"""
+sweep.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Command line entry point for sweeping elevator configurations with seeded simulations across a process pool.
+
+Usage:
+    python sweep.py [--top-floor N ...] [--max-capacity N ...] [--max-weight N ...] [--arrival-rate R ...]
+        [--runs N] [--steps N] [--seed N] [--workers N]
+"""
+
+import argparse
+import json
+
+from src.classes.sweep_runner import SweepRunner
+
+
+def main(argv: list[str] | None = None) -> list[dict]:
+    """
+    Parses the command line arguments, runs the sweep and prints the results as JSON.
+
+    Parameters:
+        argv (list[str] | None): The command line arguments, defaults to the arguments the program was run with.
+
+    Returns: The aggregated results of each configuration.
+    """
+    parser = argparse.ArgumentParser(
+        description="Sweep elevator configurations with seeded simulations."
+    )
+    parser.add_argument(
+        "--top-floor", type=int, nargs="+", help="The top floors to sweep."
+    )
+    parser.add_argument(
+        "--max-capacity", type=int, nargs="+", help="The capacities to sweep."
+    )
+    parser.add_argument(
+        "--max-weight", type=float, nargs="+", help="The weight limits to sweep."
+    )
+    parser.add_argument(
+        "--arrival-rate",
+        type=float,
+        nargs="+",
+        help="The mean persons arriving per step to sweep.",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=10, help="The simulations of each configuration."
+    )
+    parser.add_argument(
+        "--steps", type=int, default=10000, help="The steps of each simulation."
+    )
+    parser.add_argument(
+        "--seed", type=int, help="Seed the simulations, for reproducible results."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="The number of processes to use, defaults to the number of processors.",
+    )
+    args = parser.parse_args(argv)
+    for top_floor in args.top_floor or ():
+        if top_floor < 2:
+            parser.error(f"argument --top-floor: {top_floor} is not above 1.")
+
+    sweep: dict[str, list] = {
+        name: values
+        for name, values in (
+            ("TOP_FLOOR", args.top_floor),
+            ("MAX_CAPACITY", args.max_capacity),
+            ("MAX_WEIGHT", args.max_weight),
+            ("arrival_rate", args.arrival_rate),
+        )
+        if values
+    }
+    results: list[dict] = SweepRunner(
+        sweep, runs=args.runs, steps=args.steps, seed=args.seed
+    ).run(args.workers)
+    print(json.dumps(results, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main()
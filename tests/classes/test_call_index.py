@@ -0,0 +1,51 @@
+"""
+test_call_index.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the CallIndex class.
+"""
+
+from src.classes.call_index import CallIndex
+
+
+def test_call_index_hall():
+    """
+    - Tests the ability to note and remove the floors persons wait on in each direction.
+    - Tests the ability to note a floor more than once without change.
+    """
+    test_index = CallIndex()
+    test_index.add_hall(3, True)
+    test_index.add_hall(3, True)
+    test_index.add_hall(7, False)
+    test_index.add_hall(3, False)
+
+    assert test_index.hall(True) == 1 << 3
+    assert test_index.hall(False) == 1 << 3 | 1 << 7
+    assert test_index.waiting(7)
+    assert not test_index.waiting(4)
+
+    test_index.remove_hall(3, False)
+    test_index.remove_hall(5, True)
+
+    assert test_index.up == 1 << 3
+    assert test_index.down == 1 << 7
+
+
+def test_call_index_car():
+    """
+    - Tests the ability to note and remove the destinations of persons riding.
+    - Tests the ability to remove every call.
+    """
+    test_index = CallIndex()
+    test_index.add_car(12)
+    test_index.add_car(2)
+    test_index.remove_car(12)
+
+    assert test_index.car == 1 << 2
+
+    test_index.add_hall(4, True)
+    test_index.clear()
+
+    assert test_index.up == test_index.down == test_index.car == 0
@@ -0,0 +1,143 @@
+"""
+test_checkpoint.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the checkpoint functions and CheckpointFile class.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from src.classes import checkpoint
+from src.classes.checkpoint import load_checkpoint, save_checkpoint
+from src.classes.dispatcher import NearestCarDispatcher
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.passenger_table import PassengerTable
+from src.classes.step_tracer import StepTracer
+from src.utils.building_config import BuildingConfig
+from src.utils.id_generator import id_generator, next_id
+
+
+def test_checkpoint_restore():
+    """
+    - Tests the ability to restore the queues, doors, direction, waiting persons and riders of each car.
+    - Tests the ability to restore the building, dispatcher, hall calls and passenger table of the bank.
+    - Tests the ability of the restored bank to continue exactly as the saved bank does, generating the same weights.
+    - Tests the ability to restore the next id to generate.
+    """
+    test_config = BuildingConfig(top_floor=30, skipped_floors=(13, 14))
+    test_passengers = PassengerTable(seed=5, config=test_config)
+    test_bank = ElevatorBank(2, NearestCarDispatcher(), test_passengers)
+    test_bank.add_person_rows(
+        test_passengers.extend([1, 1, 1, 20, 8, 8], [30, 12, 5, 2, 25, 1])
+    )
+    test_bank.fast_forward(7)
+    test_bank.process_request("elevator", [22, "close"], 1)
+    test_bank.add_person_rows(test_passengers.extend([3, 29], [28, 4]))
+    test_next_id = next_id()
+
+    test_checkpoint = save_checkpoint(test_bank)
+    id_generator()
+    test_restored = load_checkpoint(test_checkpoint)
+
+    assert next_id() == test_next_id
+    assert StepTracer.snapshot(test_restored) == StepTracer.snapshot(test_bank)
+    assert test_restored.config.skipped_floors == {13, 14}
+    assert isinstance(test_restored.dispatcher, NearestCarDispatcher)
+    assert test_restored.hall_calls == test_bank.hall_calls
+    for test_car, test_restored_car in zip(test_bank.cars, test_restored.cars):
+        assert test_restored_car.direction_up == test_car.direction_up
+        assert vars(test_restored_car.calls) == vars(test_car.calls)
+        assert test_restored_car.priority_queue == test_car.priority_queue
+        assert test_restored_car.persons["elevator"].weight == pytest.approx(
+            test_car.persons["elevator"].weight
+        )
+        for test_floor, test_waiting in test_car.persons.items():
+            assert list(test_restored_car.persons[test_floor]) == list(test_waiting)
+
+    for test_elevator in (test_bank, test_restored):
+        test_elevator.add_person_rows(test_elevator.passengers.extend(1, 9))
+        test_elevator.fast_forward(200)
+
+    assert StepTracer.snapshot(test_restored) == StepTracer.snapshot(test_bank)
+    assert np.array_equal(
+        test_restored.passengers.alight_steps[: len(test_restored.passengers)],
+        test_bank.passengers.alight_steps[: len(test_bank.passengers)],
+    )
+    assert test_restored.passengers.load(8) == test_bank.passengers.load(8)
+    assert (
+        test_restored.passengers.journeys.summary()
+        == test_bank.passengers.journeys.summary()
+    )
+
+
+def test_checkpoint_invalid():
+    """
+    - Tests the ability to refuse data that is not a checkpoint, or of an unknown version.
+    """
+    test_checkpoint = save_checkpoint(ElevatorBank())
+
+    with pytest.raises(ValueError):
+        load_checkpoint(b"not a checkpoint")
+    with pytest.raises(ValueError):
+        load_checkpoint(test_checkpoint[:8] + b"\xff\xff" + test_checkpoint[10:])
+
+
+def test_checkpoint_crowd():
+    """
+    - Tests the ability to save and restore a crowd waiting on every floor, keeping the order of each lane.
+    """
+    test_passengers = PassengerTable(capacity=200000, seed=2)
+    test_bank = ElevatorBank(passengers=test_passengers)
+    test_origins = test_passengers.random_floors(200000)
+    test_origins[test_origins == 1] = 2
+    test_bank.add_person_rows(test_passengers.extend(test_origins, 1))
+
+    test_restored = load_checkpoint(save_checkpoint(test_bank))
+
+    assert len(test_restored.passengers) == 200000
+    for test_floor, test_waiting in test_bank.cars[0].persons.items():
+        test_restored_waiting = test_restored.cars[0].persons[test_floor]
+        assert list(test_restored_waiting) == list(test_waiting)
+    assert np.array_equal(
+        test_restored.passengers.spawn_steps[:200000],
+        test_passengers.spawn_steps[:200000],
+    )
+
+
+def test_checkpoint_file(tmp_path):
+    """
+    - Tests the ability to save a checkpoint to a file and restore it.
+    - Tests the ability to save again once the given number of steps have been taken since the last save.
+    """
+    test_file = checkpoint.CheckpointFile(
+        str(tmp_path / "elevator.ckpt"), checkpoint_every=10
+    )
+    test_bank = ElevatorBank()
+    test_bank.add_person_rows(test_bank.passengers.extend(1, 6))
+
+    assert not test_file.exists()
+
+    test_file.sync(test_bank)
+    test_bank.fast_forward(9)
+    test_file.sync(test_bank)
+
+    assert not test_file.exists()
+
+    test_bank.fast_forward(1)
+    test_file.sync(test_bank)
+    test_bank.fast_forward(5)
+    test_file.sync(test_bank)
+
+    assert test_file.exists()
+    assert not os.path.exists(test_file.path + ".partial")
+    assert test_file.load().step_count == 10
+
+    test_file.save(test_bank)
+    test_restored = checkpoint.CheckpointFile(test_file.path).load()
+
+    assert StepTracer.snapshot(test_restored) == StepTracer.snapshot(test_bank)
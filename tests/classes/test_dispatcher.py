@@ -0,0 +1,54 @@
+"""
+test_dispatcher.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the Dispatcher classes.
+"""
+
+import pytest
+
+from src.classes import dispatcher
+from src.classes.dispatcher import EtaDispatcher, NearestCarDispatcher
+from src.classes.elevator import Elevator
+
+
+def test_dispatcher_abstract():
+    """
+    - Tests the ability to refuse a dispatcher that does not implement assign().
+    """
+    with pytest.raises(TypeError):
+        dispatcher.Dispatcher()  # pylint: disable=abstract-class-instantiated
+
+
+def test_nearest_car_dispatcher():
+    """
+    - Tests the ability to choose the car closest to the floor.
+    - Tests the ability to choose the first car if cars are equally close.
+    """
+    test_cars = [Elevator(), Elevator(), Elevator()]
+    test_cars[1].current_floor = 8
+    test_cars[2].current_floor = 12
+
+    assert NearestCarDispatcher().assign(test_cars, 10, True) == 1
+    assert NearestCarDispatcher().assign(test_cars, 14, True) == 2
+    assert NearestCarDispatcher().assign(test_cars, 1, False) == 0
+
+
+def test_eta_dispatcher():
+    """
+    - Tests the ability to prefer a car that passes the floor in the direction of the call.
+    - Tests the ability to avoid a closer car that must finish its stops in the other direction first.
+    """
+    test_cars = [Elevator(), Elevator()]
+    test_cars[0].process_request(**{"source": "elevator", "button": 18})
+    test_cars[0].update()
+    test_cars[1].current_floor = 9
+    test_cars[1].direction_up = False
+    test_cars[1].process_request(**{"source": "elevator", "button": 2})
+
+    assert EtaDispatcher().estimate_arrival(test_cars[0], 10, True) == 8
+    assert EtaDispatcher().estimate_arrival(test_cars[1], 10, True) == 16
+    assert EtaDispatcher().assign(test_cars, 10, True) == 0
+    assert NearestCarDispatcher().assign(test_cars, 10, True) == 1
@@ -2,7 +2,7 @@
 test_elevator.py
 Samuel Koller
 Created: 17 October 2024
-Updated: 23 October 2024
+Updated: 17 October 2026
 
 Test Suite for the Elevator class.
 """
@@ -35,8 +35,8 @@ def test_elevator_add_ignored_stops():
     test_elevator.add_stop(1)
     test_elevator.add_stop(int(TOP_FLOOR) + 1)
 
-    assert test_elevator.up_queue == []
-    assert test_elevator.down_queue == []
+    assert not test_elevator.up_queue
+    assert not test_elevator.down_queue
 
 
 def test_elevator_add_up_stop_multiple_times():
@@ -464,3 +464,289 @@ def test_elevator_requeues_after_priority():
     assert not test_elevator.priority_queue
     # test_person_elevator going downwards to 3
     assert test_elevator.down_queue == [7, 3]
+
+
+def test_elevator_call_index_survives_priority():
+    """
+    - Tests the ability to keep the floors persons wait on and ride to while the queues are cleared for priority stops.
+    - Tests the ability to requeue each rider's destination and each floor persons wait on once it is done.
+    """
+    test_elevator = Elevator()
+    for test_origin, test_destination in ((1, 9), (5, 2), (5, 8), (12, 3), (16, 20)):
+        test_elevator.add_person(Person(test_origin, test_destination))
+    test_elevator.process_request("elevator", ["close", 10])
+    test_elevator.update()
+
+    assert not test_elevator.up_queue and not test_elevator.down_queue
+    assert test_elevator.calls.up == 1 << 5 | 1 << 16
+    assert test_elevator.calls.down == 1 << 5 | 1 << 12
+    assert test_elevator.calls.car == 1 << 9
+
+    for _ in range(9):
+        test_elevator.update()
+    assert test_elevator.current_floor == 10
+    assert not test_elevator.priority_queue
+    # Floors persons wait on to travel upwards are queued upwards, wherever they are.
+    assert test_elevator.up_queue == [16, 5]
+    assert test_elevator.down_queue == [12, 9, 5]
+
+
+def test_elevator_stranded_persons_requeue_once():
+    """
+    - Tests the ability to requeue a floor persons are stranded on each time the elevator leaves it, once.
+    - Tests the ability to leave the queue unchanged when more persons join a call already queued.
+    """
+    test_elevator = Elevator()
+    for _ in range(15):
+        test_elevator.add_person(Person(1, 9, weight=50, cargo=0))
+    test_elevator.update()
+
+    assert len(test_elevator.persons["elevator"]) == 10
+    assert len(test_elevator.persons[1]) == 5
+    assert test_elevator.current_floor == 2
+    assert test_elevator.up_queue == [9, 1]
+    assert test_elevator.calls.up == 1 << 1
+
+    test_elevator.add_floor_stops(1)
+    test_elevator.add_person(Person(1, 4, weight=50, cargo=0))
+
+    assert test_elevator.up_queue == [9, 1]
+    assert len(test_elevator.up_queue) == 2
+
+
+def test_elevator_fast_forward_idle():
+    """
+    - Tests the ability to fast forward through idle steps at once.
+    """
+    test_elevator = Elevator()
+
+    assert test_elevator.advance(10000) == 10000
+    assert test_elevator.current_floor == 1
+
+
+def test_elevator_fast_forward_run():
+    """
+    - Tests the ability to jump through a run of moves in one action, skipping the thirteenth floor.
+    """
+    test_elevator = Elevator()
+    test_elevator.add_stop(15)
+
+    assert test_elevator.advance(100) == 13
+    assert test_elevator.current_floor == 15
+    assert test_elevator.is_open is False
+    assert test_elevator.up_queue == [15]
+
+
+def test_elevator_fast_forward_partial_run():
+    """
+    - Tests the ability to stop a run of moves after the maximum number of steps, skipping the thirteenth floor.
+    """
+    test_elevator = Elevator()
+    test_elevator.current_floor = 10
+    test_elevator.add_stop(18)
+
+    assert test_elevator.advance(3) == 3
+    assert test_elevator.current_floor == 14
+
+
+def test_elevator_fast_forward_stops_at_waiting_floor():
+    """
+    - Tests the ability to end a run of moves at a passed floor with persons waiting, so they are requeued.
+    """
+    test_elevator = Elevator()
+    test_elevator.add_stop(10)
+    test_elevator.add_person(Person(**{"origin": 5, "destination": 2}))
+    test_elevator.advance(100)
+
+    assert test_elevator.current_floor == 5
+
+    test_elevator.advance(100)
+
+    assert test_elevator.current_floor == 6
+    assert test_elevator.down_queue == [5]
+
+
+def test_elevator_fast_forward_matches_update():
+    """
+    - Tests the ability of fast forwarding to reach the same state as updating step by step.
+    """
+    updated_elevator = Elevator()
+    fast_forwarded_elevator = Elevator()
+    test_persons = [
+        Person(**{"origin": 1, "destination": 18, "weight": 150, "cargo": 0}),
+        Person(**{"origin": 7, "destination": 3, "weight": 150, "cargo": 0}),
+        Person(**{"origin": 16, "destination": 2, "weight": 150, "cargo": 0}),
+    ]
+    for test_elevator in (updated_elevator, fast_forwarded_elevator):
+        for test_person in test_persons:
+            test_elevator.add_person(test_person)
+        test_elevator.process_request(**{"source": "elevator", "button": ["close", 9]})
+
+    for steps in (1, 4, 7, 20, 50):
+        for _ in range(steps):
+            updated_elevator.update()
+        fast_forwarded_elevator.fast_forward(steps)
+
+        assert fast_forwarded_elevator.current_floor == updated_elevator.current_floor
+        assert fast_forwarded_elevator.is_open == updated_elevator.is_open
+        assert fast_forwarded_elevator.direction_up == updated_elevator.direction_up
+        assert fast_forwarded_elevator.up_queue == updated_elevator.up_queue
+        assert fast_forwarded_elevator.down_queue == updated_elevator.down_queue
+        assert fast_forwarded_elevator.priority_queue == updated_elevator.priority_queue
+
+
+def test_elevator_boards_past_opposite_direction():
+    """
+    - Tests the ability to board persons travelling in the current direction when someone travelling in the opposite
+    direction arrived first, leaving them waiting.
+    """
+    test_elevator = Elevator()
+    test_person_down = Person(**{"origin": 5, "destination": 2})
+    test_person_up = Person(**{"origin": 5, "destination": 8})
+    test_row_down = test_elevator.add_person(test_person_down)
+    test_row_up = test_elevator.add_person(test_person_up)
+    test_elevator.current_floor = 5
+    test_elevator.open()
+
+    assert list(test_elevator.persons["elevator"]) == [test_row_up]
+    assert list(test_elevator.persons[5]) == [test_row_down]
+
+
+def test_elevator_add_person_rows():
+    """
+    - Tests the ability to add many persons at once, queueing each floor and direction once.
+    - Tests the ability to keep the order of arrival of persons added at once.
+    - Tests the ability to load persons added at once on the floor of the elevator immediately.
+    """
+    test_elevator = Elevator()
+    test_rows = test_elevator.passengers.extend(
+        [5, 1, 5, 7, 5], [9, 10, 2, 3, 8], [150] * 5, [0] * 5
+    )
+    test_elevator.add_person_rows(test_rows)
+
+    assert list(test_elevator.persons["elevator"]) == [1]
+    assert list(test_elevator.persons[5].up) == [0, 4]
+    assert list(test_elevator.persons[5].down) == [2]
+    assert test_elevator.up_queue == [5, 10]
+    assert test_elevator.down_queue == [5, 7]
+
+
+def test_elevator_step_count():
+    """
+    - Tests the ability to count steps taken one at a time and steps taken at once.
+    """
+    test_elevator = Elevator()
+    test_elevator.process_request(**{"source": "elevator", "button": 15})
+    test_elevator.update()
+    test_elevator.fast_forward(50)
+
+    assert test_elevator.step_count == 51
+
+
+def test_elevator_reaches_end_floors():
+    """
+    - Tests the ability to stop at the top floor for an up stop, without moving past it.
+    - Tests the ability to stop at the bottom floor for a down stop, without moving back up.
+    """
+    test_elevator = Elevator()
+    test_elevator.process_request(**{"source": "elevator", "button": TOP_FLOOR})
+    test_elevator.fast_forward(TOP_FLOOR + 5)
+
+    assert test_elevator.current_floor == TOP_FLOOR
+    assert test_elevator.is_open
+    assert not test_elevator.up_queue
+
+    test_elevator.process_request(**{"source": "elevator", "button": 1})
+    test_elevator.fast_forward(TOP_FLOOR + 5)
+
+    assert test_elevator.current_floor == 1
+    assert test_elevator.is_open
+    assert not test_elevator.down_queue
+
+
+def test_elevator_records_journey_steps():
+    """
+    - Tests the ability to record the step each person began waiting, boarded and alighted on.
+    """
+    test_elevator = Elevator()
+    test_elevator.fast_forward(5)
+    rows = test_elevator.passengers.extend([1, 4], [6, 2])
+    test_elevator.add_person_rows(rows)
+    test_elevator.fast_forward(30)
+
+    assert test_elevator.passengers.spawn_steps[:2].tolist() == [5, 5]
+    assert test_elevator.passengers.board_steps[:2].tolist() == [5, 14]
+    assert test_elevator.passengers.alight_steps[:2].tolist() == [11, 17]
+
+
+def test_elevator_turns_at_down_stop_on_current_floor():
+    """
+    - Tests the ability to answer a down stop on the current floor when no up stops are left, turning downwards.
+    - Tests the ability to keep travelling upwards when answering a down stop on the first floor.
+    """
+    test_elevator = Elevator()
+    test_elevator.current_floor = 5
+    test_elevator.is_open = False
+    test_elevator.down_queue.add(5, 5, True)
+    test_elevator.update()
+
+    assert test_elevator.current_floor == 5
+    assert test_elevator.is_open
+    assert not test_elevator.direction_up
+    assert not test_elevator.down_queue
+
+    test_elevator = Elevator()
+    test_elevator.is_open = False
+    test_elevator.down_queue.add(1, 1, True)
+    test_elevator.update()
+
+    assert test_elevator.current_floor == 1
+    assert test_elevator.is_open
+    assert test_elevator.direction_up
+
+
+def test_elevator_turns_at_up_stop_on_current_floor():
+    """
+    - Tests the ability to answer an up stop on the current floor when no down stops are left, turning upwards.
+    """
+    test_elevator = Elevator()
+    test_elevator.current_floor = 5
+    test_elevator.direction_up = False
+    test_elevator.is_open = False
+    test_elevator.up_queue.add(5, 5, False)
+    test_elevator.update()
+
+    assert test_elevator.current_floor == 5
+    assert test_elevator.is_open
+    assert test_elevator.direction_up
+    assert not test_elevator.up_queue
+
+
+def test_elevator_moves_to_down_stop_above():
+    """
+    - Tests the ability to move up to a down stop and open there, rather than passing it and coming back.
+    """
+    test_elevator = Elevator()
+    test_elevator.process_request(8, "down")
+    test_elevator.fast_forward(8)
+
+    assert test_elevator.current_floor == 8
+    assert test_elevator.is_open
+    assert not test_elevator.direction_up
+    assert not test_elevator.down_queue
+
+
+def test_elevator_turns_once_for_person_too_heavy_to_board():
+    """
+    - Tests the ability to open for a person who can not board alone without switching direction forever.
+    """
+    test_elevator = Elevator()
+    test_rows = test_elevator.passengers.extend([1], [5], [150], [0])
+    # ? A person can only be this heavy if written to the table directly, such as from an earlier version's log.
+    test_elevator.passengers.weights[test_rows.start] = MAX_WEIGHT + 1
+    test_elevator.add_person_rows(test_rows)
+    test_elevator.fast_forward(20)
+
+    assert test_elevator.is_open
+    assert not test_elevator.persons["elevator"]
+    assert list(test_elevator.persons[1].up) == [test_rows.start]
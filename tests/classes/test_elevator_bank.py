@@ -0,0 +1,112 @@
+"""
+test_elevator_bank.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the ElevatorBank class.
+"""
+
+import pytest
+
+from src.classes.dispatcher import NearestCarDispatcher
+from src.classes.elevator import Elevator
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.passenger_table import PassengerTable
+from src.classes.person import Person
+from src.utils.custom_exceptions import InvalidButton
+
+
+def test_elevator_bank_single_car_matches_elevator():
+    """
+    - Tests the ability of a bank with one car to behave the same as an elevator.
+    """
+    test_elevator = Elevator()
+    test_bank = ElevatorBank()
+    for system in (test_elevator, test_bank):
+        system.process_request(**{"source": 7, "button": "down"})
+        system.add_person(Person(origin=4, destination=9))
+        system.process_request(**{"source": "elevator", "button": 15})
+    for _ in range(12):
+        test_elevator.update()
+    test_bank.fast_forward(12)
+
+    assert test_bank.step_count == test_elevator.step_count == 12
+    assert test_bank.cars[0].current_floor == test_elevator.current_floor
+    assert test_bank.cars[0].up_queue == test_elevator.up_queue
+    assert test_bank.cars[0].down_queue == test_elevator.down_queue
+
+
+def test_elevator_bank_hall_calls():
+    """
+    - Tests the ability to assign a hall call to the car chosen by the dispatcher.
+    - Tests the ability to give a repeated hall call to the car already answering it.
+    - Tests the ability to press a button inside a given car.
+    """
+    test_bank = ElevatorBank(3, NearestCarDispatcher())
+    test_bank.cars[2].current_floor = 10
+    test_bank.process_request(**{"source": 9, "button": "up"})
+    test_bank.cars[1].current_floor = 9
+    test_bank.process_request(**{"source": 9, "button": "up"})
+    test_bank.process_request(**{"source": "elevator", "button": 5, "car": 1})
+
+    assert test_bank.hall_calls == {(9, True): 2}
+    assert test_bank.cars[2].up_queue == [9]
+    assert not test_bank.cars[0].up_queue
+    assert test_bank.cars[1].down_queue == [5]
+
+
+def test_elevator_bank_invalid_buttons():
+    """
+    - Tests the ability to reject invalid hall calls and cars.
+    """
+    test_bank = ElevatorBank(2)
+    with pytest.raises(InvalidButton):
+        test_bank.process_request(**{"source": 13, "button": "up"})
+    with pytest.raises(InvalidButton):
+        test_bank.process_request(**{"source": "elevator", "button": 5, "car": 2})
+
+
+def test_elevator_bank_validate_request():
+    """
+    - Tests the ability to check a request without pressing the button or assigning a car.
+    """
+    test_bank = ElevatorBank(2)
+    test_bank.validate_request(**{"source": 5, "button": "down"})
+    test_bank.validate_request(**{"source": "elevator", "button": [7, "close"]})
+
+    assert not test_bank.hall_calls
+    assert not test_bank.cars[0].down_queue
+    assert not test_bank.cars[0].priority_queue
+    with pytest.raises(InvalidButton):
+        test_bank.validate_request(**{"source": 5, "button": "sideways"})
+    with pytest.raises(InvalidButton):
+        test_bank.validate_request(**{"source": "elevator", "button": 13})
+    with pytest.raises(InvalidButton):
+        test_bank.validate_request(**{"source": "elevator", "button": 5, "car": 2})
+    with pytest.raises(InvalidButton):
+        test_bank.validate_request(**{"source": None, "button": 5})
+
+
+def test_elevator_bank_add_person_rows():
+    """
+    - Tests the ability to give every person of a floor and direction to the same car.
+    - Tests the ability of more cars to deliver the same persons in fewer steps.
+    """
+    steps_taken: list[int] = []
+    for cars in (1, 4):
+        test_bank = ElevatorBank(cars, passengers=PassengerTable(seed=1))
+        rows = test_bank.passengers.extend(
+            [1, 1, 5, 9, 12, 16, 19, 20] * 4, [8, 20, 2, 2, 3, 3, 2, 4] * 4
+        )
+        test_bank.add_person_rows(rows)
+        test_car = test_bank.cars[test_bank.hall_calls[(12, False)]]
+
+        assert len(set(test_bank.hall_calls.values())) == cars
+        assert len(test_car.persons[12]) == 4
+
+        while any(len(p) for car in test_bank.cars for p in car.persons.values()):
+            test_bank.fast_forward(1)
+        steps_taken.append(test_bank.step_count)
+
+    assert steps_taken[1] < steps_taken[0]
@@ -0,0 +1,46 @@
+"""
+test_elevator_load.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the ElevatorLoad class.
+"""
+
+from src.classes.elevator_load import ElevatorLoad
+
+
+def test_elevator_load_board():
+    """
+    - Tests the ability to keep a running weight and headcount as persons board.
+    - Tests the ability to bucket persons by destination.
+    """
+    test_load = ElevatorLoad()
+    test_load.board(0, 5, 175)
+    test_load.board(1, 8, 100)
+    test_load.board(2, 5, 210)
+
+    assert len(test_load) == 3
+    assert test_load.weight == 485
+    assert test_load.destinations() == [5, 8]
+    assert list(test_load) == [0, 2, 1]
+
+
+def test_elevator_load_alight():
+    """
+    - Tests the ability to remove every person with the current floor as their destination at once.
+    - Tests the ability to not remove any persons if no one is going to the current floor.
+    """
+    test_load = ElevatorLoad()
+    test_load.board(0, 5, 175)
+    test_load.board(1, 8, 100)
+
+    assert test_load.alight(5) == [0]
+    assert not test_load.alight(6)
+    assert len(test_load) == 1
+    assert test_load.weight == 100
+
+    test_load.alight(8)
+
+    assert not test_load
+    assert test_load.weight == 0
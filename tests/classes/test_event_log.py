@@ -0,0 +1,147 @@
+"""
+test_event_log.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the EventLog class and replay functions.
+"""
+
+from functools import partial
+
+import pytest
+
+from src.classes import event_log
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.event_log import EventLog, read_events, replay, sessions
+from src.classes.step_tracer import StepTracer
+from src.classes.ticker import Ticker
+
+
+def run_commands(test_bank: ElevatorBank, test_log: EventLog) -> dict[int, dict]:
+    """
+    Presses buttons, adds persons and takes steps, logging each accepted command.
+
+    Parameters:
+        test_bank (ElevatorBank): The elevator bank to change.
+        test_log (EventLog): The log of the bank.
+
+    Returns: The snapshot of the bank after the commands made at each step.
+    """
+    test_snapshots: dict[int, dict] = {}
+    for test_round in range(12):
+        test_rows = test_bank.passengers.extend(
+            [1, 4, 9][: test_round % 3 + 1], [7, 12, 2][: test_round % 3 + 1]
+        )
+        test_bank.add_person_rows(test_rows)
+        test_log.persons(test_rows)
+        if test_round % 4 == 1:
+            test_bank.process_request("elevator", [18, "close"])
+            test_log.button("elevator", [18, "close"], 0)
+        test_snapshots[test_bank.step_count] = StepTracer.snapshot(test_bank)
+        test_bank.fast_forward(test_round + 3)
+        test_log.sync()
+    return test_snapshots
+
+
+def test_event_log_records(tmp_path):
+    """
+    - Tests the ability to log a session as a checkpoint, followed by the accepted commands.
+    - Tests the ability to log runs of steps once, at the step they begin from.
+    - Tests the ability to log a checkpoint every given number of steps.
+    """
+    test_path = str(tmp_path / "events.log")
+    test_bank = ElevatorBank()
+    test_log = EventLog(test_path, test_bank, checkpoint_every=20)
+    test_bank.add_person_rows(test_bank.passengers.extend(1, 5, 160, 10))
+    test_log.persons(range(0, 1))
+    test_bank.fast_forward(4)
+    test_bank.fast_forward(3)
+    test_bank.process_request(3, "up")
+    test_log.button(3, "up")
+    test_bank.fast_forward(15)
+    test_log.sync()
+    test_bank.fast_forward(2)
+    test_log.close()
+
+    test_records = [
+        (kind, step, payload) for _, kind, step, payload in read_events(test_path)
+    ]
+
+    assert [(kind, step) for kind, step, _ in test_records] == [
+        (event_log.START, 0),
+        (event_log.PERSONS, 0),
+        (event_log.STEPS, 0),
+        (event_log.BUTTON, 7),
+        (event_log.STEPS, 7),
+        (event_log.CHECKPOINT, 22),
+        (event_log.STEPS, 22),
+    ]
+    assert [column.tolist() for column in test_records[1][2]] == [
+        [1],
+        [5],
+        [160.0],
+        [10.0],
+    ]
+    assert test_records[2][2] == 7
+    assert test_records[3][2] == {"source": 3, "button": "up", "car": 0}
+    assert test_records[6][2] == 2
+
+
+def test_event_log_replay(tmp_path):
+    """
+    - Tests the ability to replay a log to the same state as the logged elevator bank.
+    - Tests the ability to seek to any step, from the last checkpoint before it.
+    - Tests the ability to replay an earlier session, each opening of a log beginning a new session.
+    """
+    test_path = str(tmp_path / "events.log")
+    test_bank = ElevatorBank(2)
+    test_log = EventLog(test_path, test_bank, checkpoint_every=25)
+    test_snapshots = run_commands(test_bank, test_log)
+    test_log.close()
+
+    assert StepTracer.snapshot(replay(test_path)) == StepTracer.snapshot(test_bank)
+    for test_step, test_snapshot in test_snapshots.items():
+        assert StepTracer.snapshot(replay(test_path, test_step)) == test_snapshot
+    assert replay(test_path, 10).step_count == 10
+    assert [step for step, _ in sessions(test_path)[0]] == [0, 25, 52, 75, 102]
+
+    test_second_bank = ElevatorBank()
+    test_second_log = EventLog(test_path, test_second_bank)
+    test_second_bank.fast_forward(5)
+    test_second_log.close()
+
+    assert len(sessions(test_path)) == 2
+    assert replay(test_path).step_count == 5
+    assert StepTracer.snapshot(replay(test_path, session=0)) == StepTracer.snapshot(
+        test_bank
+    )
+    with pytest.raises(ValueError):
+        replay(test_path, session=2)
+
+
+def test_event_log_ticker(tmp_path):
+    """
+    - Tests the ability of the ticker to log the steps it takes, and to write them out as it stops.
+    """
+    test_path = str(tmp_path / "events.log")
+    test_bank = ElevatorBank()
+    test_log = EventLog(test_path, test_bank, checkpoint_every=3)
+    test_ticker = Ticker(test_bank, tick_rate=None, event_log=test_log)
+    test_ticker.start()
+    test_ticker.submit(partial(test_bank.fast_forward, 4)).result()
+    test_ticker.submit(partial(test_bank.fast_forward, 1)).result()
+    test_ticker.stop()
+
+    assert [
+        (kind, step) for _, kind, step, _ in read_events(test_path, payloads=False)
+    ] == [
+        (event_log.START, 0),
+        (event_log.STEPS, 0),
+        (event_log.CHECKPOINT, 4),
+        (event_log.STEPS, 4),
+    ]
+
+    test_log.close()
+
+    assert replay(test_path).step_count == 5
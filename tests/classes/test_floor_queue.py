@@ -0,0 +1,36 @@
+"""
+test_floor_queue.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the FloorQueue class.
+"""
+
+from src.classes.floor_queue import FloorQueue
+
+
+def test_floor_queue_add():
+    """
+    - Tests the ability to add persons to the lane of their direction of travel, in order of arrival.
+    """
+    test_floor = FloorQueue()
+    test_floor.add(0, True)
+    test_floor.add(1, False)
+    test_floor.add(2, True)
+
+    assert list(test_floor.lane(True)) == [0, 2]
+    assert list(test_floor.lane(False)) == [1]
+    assert len(test_floor) == 3
+
+
+def test_floor_queue_empty():
+    """
+    - Tests the ability of a floor with no one waiting to be empty.
+    """
+    test_floor = FloorQueue()
+    test_floor.add(0, True)
+    test_floor.lane(True).popleft()
+
+    assert not test_floor
+    assert not list(test_floor)
@@ -0,0 +1,122 @@
+"""
+test_instrumentation.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the Instrumentation and TimingHistogram classes.
+"""
+
+from src.classes.elevator import Elevator
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.instrumentation import Instrumentation, TimingHistogram
+from src.classes.person import Person
+from src.utils.building_config import BuildingConfig
+
+
+def test_instrumentation_counters():
+    """
+    - Tests the ability to count door openings, boardings, alightings, persons left behind and priority stops.
+    """
+    test_bank = ElevatorBank(config=BuildingConfig(max_capacity=1))
+    for test_destination in (3, 4):
+        test_bank.add_person(
+            Person(
+                **{"origin": 2, "destination": test_destination, "weight": 150},
+                config=test_bank.config,
+            )
+        )
+    test_bank.fast_forward(30)
+    test_bank.process_request(**{"source": "elevator", "button": ["close", 1]})
+    test_bank.fast_forward(30)
+    test_car = test_bank.cars[0]
+
+    assert test_car.boardings == test_car.alightings == 2
+    assert test_car.rejected_boardings == 1
+    assert test_car.priority_stops == 1
+    assert test_car.door_openings >= 4
+
+
+def test_instrumentation_left_behind_once_per_stop():
+    """
+    - Tests the ability to count each person left behind once per stop, through a turnaround and a reopening.
+    """
+    test_car = Elevator(config=BuildingConfig(max_capacity=1))
+    test_car.current_floor = 5
+    test_car.is_open = False
+    test_car.add_person_rows(test_car.passengers.extend([5, 5], [1, 2], 150, 0))
+    test_car.add_person_rows(test_car.passengers.extend([5], [3], 150, 0))
+
+    assert test_car.rejected_boardings == 0
+
+    test_car.update()
+
+    assert test_car.current_floor == 4
+    assert test_car.rejected_boardings == 2
+
+
+def test_instrumentation_disabled():
+    """
+    - Tests the ability to leave elevators unchanged when disabled.
+    """
+    test_bank = ElevatorBank()
+    test_instrumentation = Instrumentation()
+    test_instrumentation.instrument(test_bank)
+    test_bank.update()
+
+    assert "update" not in vars(test_bank.cars[0])
+    assert not test_instrumentation.timings
+    assert "elevator_function_duration_seconds" not in test_instrumentation.export(
+        test_bank
+    )
+
+
+def test_instrumentation_export():
+    """
+    - Tests the ability to time the hot paths of each car and requests when enabled.
+    - Tests the ability to export counters, journeys and timings in the Prometheus text format.
+    """
+    test_bank = ElevatorBank(2)
+    test_instrumentation = Instrumentation(enabled=True)
+    test_instrumentation.instrument(test_bank)
+    test_bank.process_request(**{"source": "elevator", "button": 3, "car": 1})
+    test_bank.add_person(Person(**{"origin": 1, "destination": 2, "weight": 150}))
+    test_bank.fast_forward(10)
+    test_instrumentation.observe_request("step", 0.002)
+    test_export = test_instrumentation.export(test_bank)
+
+    assert 'elevator_steps_total{car="0"} 10' in test_export
+    assert 'elevator_steps_total{car="1"} 10' in test_export
+    assert 'elevator_boardings_total{car="0"} 1' in test_export
+    assert 'elevator_trip_steps{quantile="0.5"}' in test_export
+    assert "elevator_trip_steps_count 1" in test_export
+    assert "# TYPE elevator_function_duration_seconds histogram" in test_export
+    assert (
+        'elevator_function_duration_seconds_count{function="add_up_stop"} 2'
+        in test_export
+    )
+    assert (
+        'elevator_request_duration_seconds_bucket{endpoint="step",le="0.001"} 0'
+        in test_export
+    )
+    assert (
+        'elevator_request_duration_seconds_bucket{endpoint="step",le="0.005"} 1'
+        in test_export
+    )
+    assert test_export.endswith("\n")
+
+
+def test_timing_histogram_lines():
+    """
+    - Tests the ability to export cumulative buckets, the sum and the count.
+    """
+    test_histogram = TimingHistogram()
+    for test_seconds in (0.000001, 0.0002, 0.0002, 10.0):
+        test_histogram.observe(test_seconds)
+    test_lines = test_histogram.lines("test_seconds", 'function="test"')
+
+    assert test_lines[0] == 'test_seconds_bucket{function="test",le="1e-06"} 1'
+    assert test_lines[5] == 'test_seconds_bucket{function="test",le="0.0005"} 3'
+    assert test_lines[13] == 'test_seconds_bucket{function="test",le="5"} 3'
+    assert test_lines[14] == 'test_seconds_bucket{function="test",le="+Inf"} 4'
+    assert test_lines[-1] == 'test_seconds_count{function="test"} 4'
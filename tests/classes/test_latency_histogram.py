@@ -0,0 +1,91 @@
+"""
+test_latency_histogram.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the LatencyHistogram and JourneyMetrics classes.
+"""
+
+import numpy as np
+
+from src.classes.elevator import Elevator
+from src.classes.latency_histogram import LatencyHistogram
+from src.classes.person import Person
+
+
+def test_latency_histogram_empty():
+    """
+    - Tests the ability to summarize no values.
+    """
+    assert LatencyHistogram().summary() == {
+        "count": 0,
+        "mean": None,
+        "min": None,
+        "max": None,
+        "p50": None,
+        "p90": None,
+        "p95": None,
+        "p99": None,
+    }
+
+
+def test_latency_histogram_exact():
+    """
+    - Tests the ability to keep small values exactly.
+    """
+    test_histogram = LatencyHistogram()
+    test_histogram.record(range(100))
+    test_histogram.record([-5])
+
+    assert test_histogram.summary() == {
+        "count": 101,
+        "mean": 4950 / 101,
+        "min": 0,
+        "max": 99,
+        "p50": 49,
+        "p90": 89,
+        "p95": 94,
+        "p99": 98,
+    }
+
+
+def test_latency_histogram_precision():
+    """
+    - Tests the ability to keep large values to the significant bits of the histogram, in a fixed amount of memory.
+    """
+    test_values = np.random.default_rng(7).integers(0, 10**6, size=50000)
+    test_histogram = LatencyHistogram(significant_bits=7)
+    for test_chunk in np.array_split(test_values, 10):
+        test_histogram.record(test_chunk)
+    test_size = test_histogram.counts.size
+
+    for percent in (50, 90, 99):
+        exact = np.percentile(test_values, percent, method="inverted_cdf")
+        assert exact <= test_histogram.percentile(percent) <= exact * (1 + 1 / 64)
+    assert test_histogram.percentile(100) == test_values.max()
+    assert test_histogram.mean() == test_values.mean()
+
+    test_histogram.record(test_values)
+
+    assert test_histogram.counts.size == test_size
+
+
+def test_journey_metrics_elevator():
+    """
+    - Tests the ability of an elevator to record each journey as the person alights.
+    """
+    test_elevator = Elevator()
+    test_elevator.fast_forward(3)
+    test_elevator.add_person(
+        Person(**{"origin": 2, "destination": 4, "weight": 150, "cargo": 0})
+    )
+    test_elevator.fast_forward(20)
+    test_journeys = test_elevator.passengers.journeys.summary()
+    test_row_wait = test_elevator.passengers.wait_times().tolist()
+    test_row_trip = test_elevator.passengers.trip_times().tolist()
+
+    assert test_journeys["journeys"] == 1
+    assert [test_journeys["wait"]["max"]] == test_row_wait
+    assert [test_journeys["trip"]["max"]] == test_row_trip
+    assert test_journeys["ride"]["max"] == test_row_trip[0] - test_row_wait[0]
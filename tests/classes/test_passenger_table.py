@@ -0,0 +1,208 @@
+"""
+test_passenger_table.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the PassengerTable class.
+"""
+
+import numpy as np
+import pytest
+
+from src.classes.passenger_table import PassengerTable
+from src.classes.person import Person
+from src.utils.building_config import BuildingConfig
+from src.utils.constants import MAX_WEIGHT, TOP_FLOOR
+from src.utils.custom_exceptions import InvalidFloor, InvalidPerson
+
+
+def test_passenger_table_append():
+    """
+    - Tests the ability to store a person as a row of the table.
+    """
+    test_table = PassengerTable()
+    test_person = Person(**{"origin": 3, "destination": 1, "weight": 150, "cargo": 25})
+    test_row = test_table.append(test_person)
+
+    assert test_row == 0
+    assert len(test_table) == 1
+    assert test_table.destination(test_row) == 1
+    assert test_table.load(test_row) == 175
+    assert test_table.going_up(test_row) is False
+    assert test_table.person(test_row) == {
+        "id": test_person.id,
+        "origin": 3,
+        "destination": 1,
+        "weight": 150,
+        "cargo": 25,
+    }
+
+
+def test_passenger_table_grows():
+    """
+    - Tests the ability of the table to grow past its initial capacity without losing rows.
+    """
+    test_table = PassengerTable(capacity=2)
+    for destination in range(2, 12):
+        test_table.append(Person(**{"origin": 1, "destination": destination}))
+
+    assert len(test_table) == 10
+    assert [test_table.destination(row) for row in range(10)] == list(range(2, 12))
+
+
+def test_person_slots():
+    """
+    - Tests the ability of a person to be stored without a per-instance dictionary.
+    """
+    test_person = Person(**{"origin": 1, "destination": 10})
+
+    assert not hasattr(test_person, "__dict__")
+
+
+def test_passenger_table_extend():
+    """
+    - Tests the ability to add many persons at once, keeping given weights and cargo.
+    - Tests the ability to generate missing or out of range weights and cargo.
+    """
+    test_table = PassengerTable()
+    test_rows = test_table.extend(
+        [1, 5, 7], 10, [150, np.nan, MAX_WEIGHT + 1], [25, None, -1]
+    )
+
+    assert test_rows == range(0, 3)
+    assert list(test_table.destinations[:3]) == [10, 10, 10]
+    assert test_table.weights[0] == 150
+    assert test_table.cargo[0] == 25
+    assert all(20 <= weight <= MAX_WEIGHT for weight in test_table.weights[1:3])
+    assert all(0 <= cargo <= 100 for cargo in test_table.cargo[1:3])
+    assert len(set(test_table.ids[:3])) == 3
+
+
+def test_passenger_table_extend_cargo_fits():
+    """
+    - Tests the ability to generate cargo that each person can board with alone, keeping their weight.
+    - Tests the ability to replace given cargo that a person could not board with alone.
+    """
+    test_table = PassengerTable(seed=3, config=BuildingConfig(max_weight=30))
+    test_rows = test_table.extend(np.ones(1000, dtype=np.int64), 10)
+    test_weights = test_table.weights[test_rows.start : test_rows.stop]
+    test_cargo = test_table.cargo[test_rows.start : test_rows.stop]
+
+    assert np.all((test_weights >= 20) & (test_weights <= 30))
+    assert np.all((test_cargo >= 0) & (test_weights + test_cargo <= 30))
+
+    test_table = PassengerTable()
+    test_table.extend([1, 1], 10, [MAX_WEIGHT - 5, 150], [50, 50])
+
+    assert 0 <= test_table.cargo[0] <= 5
+    assert test_table.cargo[1] == 50
+
+
+def test_passenger_table_extend_seeded():
+    """
+    - Tests the ability of seeded tables to generate the same persons.
+    """
+    test_table_1 = PassengerTable(seed=7)
+    test_table_2 = PassengerTable(seed=7)
+    for test_table in (test_table_1, test_table_2):
+        test_table.extend(
+            test_table.random_floors(100000), test_table.random_floors(100000)
+        )
+
+    assert np.array_equal(test_table_1.origins[:100000], test_table_2.origins[:100000])
+    assert np.array_equal(test_table_1.weights[:100000], test_table_2.weights[:100000])
+    assert 13 not in test_table_1.origins[:100000]
+
+
+def test_passenger_table_extend_invalid():
+    """
+    - Tests the ability to throw an exception, without adding anyone, if any person has an invalid floor.
+    - Tests the ability to find which persons have invalid floors.
+    """
+    test_table = PassengerTable()
+    test_columns = PassengerTable.columns_from_records(
+        [
+            {"origin": 1, "destination": 5},
+            {"origin": 13, "destination": 5},
+            {"origin": 1, "destination": TOP_FLOOR + 1, "weight": 150},
+        ]
+    )
+
+    assert list(test_table.invalid_floors(test_columns[0], test_columns[1])) == [1, 2]
+    with pytest.raises(InvalidFloor):
+        test_table.extend(*test_columns)
+    assert len(test_table) == 0
+
+
+def test_passenger_table_invalid_records():
+    """
+    - Tests the ability to find the first record without an integer origin and destination, before conversion.
+    - Tests the ability to find a record with a weight or cargo that is not a number.
+    - Tests the ability to find a record with a floor out of range, however large, before conversion.
+    - Tests the ability to find a record with a weight and cargo too heavy to board alone.
+    - Tests the ability to refuse to add records if any is invalid.
+    """
+    test_table = PassengerTable()
+    test_valid = {"origin": 1, "destination": 5, "weight": 150, "cargo": None}
+
+    assert (
+        test_table.invalid_record([test_valid, {"origin": 2, "destination": 3}]) is None
+    )
+    for test_invalid, test_error in (
+        ({"origin": 1}, InvalidPerson),
+        ({"destination": 5}, InvalidPerson),
+        ({"origin": "7", "destination": 5}, InvalidPerson),
+        ({"origin": 7.9, "destination": 5}, InvalidPerson),
+        ({"origin": 1, "destination": True}, InvalidPerson),
+        ({"origin": 1, "destination": 5, "weight": "heavy"}, InvalidPerson),
+        ({"origin": 1, "destination": 5, "cargo": [10]}, InvalidPerson),
+        ([1, 5], InvalidPerson),
+        ({"origin": 13, "destination": 5}, InvalidFloor),
+        ({"origin": 10**30, "destination": 5}, InvalidFloor),
+        ({"origin": 1, "destination": -(10**30)}, InvalidFloor),
+        (
+            {"origin": 1, "destination": 5, "weight": MAX_WEIGHT, "cargo": 1},
+            InvalidPerson,
+        ),
+    ):
+        test_index, test_exception = test_table.invalid_record(
+            [test_valid, test_invalid]
+        )
+        assert test_index == 1
+        assert isinstance(test_exception, test_error)
+
+    with pytest.raises(InvalidFloor):
+        test_table.extend_records([test_valid, {"origin": 10**30, "destination": 5}])
+    assert len(test_table) == 0
+
+
+def test_passenger_table_journey_times():
+    """
+    - Tests the ability to find the wait times of persons who boarded and trip times of persons who alighted.
+    """
+    test_table = PassengerTable()
+    test_table.extend([1, 2, 3], [5, 6, 7])
+    test_table.spawn_steps[:3] = [0, 4, 10]
+    test_table.board_steps[:3] = [3, 9, -1]
+    test_table.alight_steps[:3] = [12, -1, -1]
+
+    assert test_table.wait_times().tolist() == [3, 5]
+    assert test_table.trip_times().tolist() == [12]
+
+
+def test_passenger_table_alight():
+    """
+    - Tests the ability to record alighting persons and feed their journeys to the metrics.
+    """
+    test_table = PassengerTable()
+    test_table.extend([1, 2, 3], [5, 6, 7])
+    test_table.spawn_steps[:3] = [0, 4, 10]
+    test_table.board_steps[:3] = [3, 9, 11]
+    test_table.alight([0, 1], 20)
+
+    assert test_table.alight_steps[:2].tolist() == [20, 20]
+    assert test_table.journeys.summary()["journeys"] == 2
+    assert test_table.journeys.wait.summary()["mean"] == 4
+    assert test_table.journeys.ride.summary()["min"] == 11
+    assert test_table.journeys.trip.summary()["max"] == 20
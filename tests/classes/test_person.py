@@ -2,7 +2,7 @@
 test_person.py
 Samuel Koller
 Created: 19 October 2024
-Updated: 22 October 2024
+Updated: 17 October 2026
 
 Test Suite for the Person class.
 """
@@ -10,8 +10,10 @@ Test Suite for the Person class.
 import pytest
 
 from src.classes.person import Person
-from src.utils.constants import TOP_FLOOR
+from src.utils.building_config import BuildingConfig
+from src.utils.constants import MAX_WEIGHT, TOP_FLOOR
 from src.utils.custom_exceptions import InvalidFloor
+from src.utils.random_generator import seed_random_generator
 
 
 def test_person_given():
@@ -35,6 +37,26 @@ def test_person_generated():
     assert 0 <= test_person.cargo <= 100
 
 
+def test_person_cargo_fits():
+    """
+    - Tests the ability to generate cargo that the person can board with alone.
+    - Tests the ability to replace given cargo that the person could not board with alone.
+    """
+    test_person = Person(**{"origin": 1, "destination": 10, "weight": MAX_WEIGHT - 5})
+    assert 0 <= test_person.cargo <= 5
+
+    test_person = Person(
+        **{"origin": 1, "destination": 10, "weight": MAX_WEIGHT - 5, "cargo": 50}
+    )
+    assert 0 <= test_person.cargo <= 5
+
+    test_config = BuildingConfig(max_weight=30)
+    for _ in range(100):
+        test_person = Person(**{"origin": 1, "destination": 10}, config=test_config)
+        assert 20 <= test_person.weight <= 30
+        assert test_person.weight + test_person.cargo <= 30
+
+
 def test_person_invalid_origin():
     """
     - Tests the ability to error if a person is attempted to be made with an origin of the thirteenth floor.
@@ -49,3 +71,16 @@ def test_person_invalid_destination():
     """
     with pytest.raises(InvalidFloor):
         Person(**{"origin": 1, "destination": TOP_FLOOR + 1})
+
+
+def test_person_generated_seeded():
+    """
+    - Tests the ability to generate the same missing attributes when the random generator is seeded the same.
+    """
+    seed_random_generator(7)
+    test_person_1 = Person(**{"origin": 1, "destination": 10})
+    seed_random_generator(7)
+    test_person_2 = Person(**{"origin": 1, "destination": 10})
+    seed_random_generator(None)
+    assert test_person_1.weight == test_person_2.weight
+    assert test_person_1.cargo == test_person_2.cargo
@@ -0,0 +1,223 @@
+"""
+test_session_registry.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the SessionRegistry class.
+"""
+
+import os
+import threading
+from functools import partial
+
+import pytest
+
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.session_registry import SessionRegistry
+from src.classes.step_tracer import StepTracer
+from src.utils.custom_exceptions import SessionNotFound
+
+
+def drive(test_ticker, test_steps: int) -> None:
+    """Adds a person travelling up and another down, then steps, on the ticker of a session."""
+    test_ticker.submit(partial(test_ticker.elevator.process_request, 1, "up")).result()
+    test_ticker.submit(
+        partial(test_ticker.elevator.process_request, "elevator", 9)
+    ).result()
+    test_ticker.submit(partial(test_ticker.elevator.fast_forward, test_steps)).result()
+
+
+def test_session_registry_create(tmp_path):
+    """
+    - Tests the ability to create sessions with given and random ids, and a number of cars.
+    - Tests the ability to reject invalid and existing ids.
+    - Tests the ability to reject a number of cars that is not an integer from 1 to the most cars.
+    - Tests the ability of each session to change independently of the others.
+    """
+    test_registry = SessionRegistry(str(tmp_path), max_cars=3)
+    assert test_registry.create("first") == "first"
+    test_random = test_registry.create(cars=3)
+    assert len(test_registry) == 2
+
+    with pytest.raises(ValueError):
+        test_registry.create("../escape")
+    with pytest.raises(ValueError):
+        test_registry.create("")
+    with pytest.raises(FileExistsError):
+        test_registry.create("first")
+    for test_cars in (0, 4, True, 2.0):
+        with pytest.raises(ValueError):
+            test_registry.create("many", cars=test_cars)
+    assert not test_registry.exists("many")
+
+    with test_registry.session("first") as test_ticker:
+        drive(test_ticker, 4)
+        assert test_ticker.elevator.step_count == 4
+        assert test_ticker.view.state["cars"][0]["floor"] == 5
+    with test_registry.session(test_random) as test_ticker:
+        assert test_ticker.elevator.step_count == 0
+        assert len(test_ticker.elevator.cars) == 3
+    with pytest.raises(SessionNotFound):
+        with test_registry.session("missing"):
+            pass
+    test_registry.close()
+
+
+def test_session_registry_eviction(tmp_path):
+    """
+    - Tests the ability to save and drop the least recently used sessions beyond the memory budget.
+    - Tests the ability to keep sessions in use in memory, regardless of the budget.
+    - Tests the ability to restore a dropped session exactly as it was when next used.
+    """
+    test_registry = SessionRegistry(str(tmp_path), memory_budget=1)
+    test_registry.create("first")
+    with test_registry.session("first") as test_ticker:
+        drive(test_ticker, 3)
+        test_snapshot = StepTracer.snapshot(test_ticker.elevator)
+        test_registry.create("second")
+        assert list(test_registry.sessions) == ["first"]
+        assert len(test_registry.pins) == 1
+    assert not test_registry.sessions
+    assert os.path.exists(os.path.join(tmp_path, "first.ckpt"))
+    assert os.path.exists(os.path.join(tmp_path, "second.ckpt"))
+
+    with test_registry.session("first") as test_ticker:
+        assert StepTracer.snapshot(test_ticker.elevator) == test_snapshot
+        drive(test_ticker, 2)
+        assert test_ticker.elevator.step_count == 5
+
+    test_reopened = SessionRegistry(str(tmp_path))
+    assert test_reopened.exists("second")
+    with test_reopened.session("first") as test_ticker:
+        assert test_ticker.elevator.step_count == 5
+    test_reopened.close()
+    test_registry.close()
+
+
+def test_session_registry_eviction_keeps_commands(tmp_path):
+    """
+    - Tests the ability to apply commands submitted without waiting before a session is saved and dropped.
+    """
+    test_registry = SessionRegistry(str(tmp_path), memory_budget=0)
+    test_registry.create("first")
+    with test_registry.session("first") as test_ticker:
+        test_bank = test_ticker.elevator
+        for test_floor in (5, 9):
+            test_ticker.submit(
+                partial(test_bank.process_request, "elevator", test_floor)
+            )
+    with test_registry.session("first") as test_ticker:
+        assert test_ticker.elevator.cars[0].up_queue == [5, 9]
+    test_registry.close()
+
+
+def test_session_registry_saves_without_lock(tmp_path):
+    """
+    - Tests the ability to use a session while another is being saved.
+    - Tests the ability to wait for a session being saved before restoring it.
+    """
+    test_registry = SessionRegistry(str(tmp_path), memory_budget=0)
+    test_registry.create("first")
+    test_registry.create("second")
+    test_saving = threading.Event()
+    test_release = threading.Event()
+    test_snapshots = []
+
+    def test_use_first():
+        with test_registry.session("first") as test_ticker:
+            drive(test_ticker, 3)
+            test_snapshots.append(StepTracer.snapshot(test_ticker.elevator))
+            test_save = test_ticker.checkpoint_file.save
+
+            def test_slow_save(test_bank):
+                test_saving.set()
+                test_release.wait(10)
+                test_save(test_bank)
+
+            test_ticker.checkpoint_file.save = test_slow_save
+
+    def test_restore_first():
+        with test_registry.session("first") as test_ticker:
+            test_snapshots.append(StepTracer.snapshot(test_ticker.elevator))
+
+    test_user = threading.Thread(target=test_use_first)
+    test_user.start()
+    assert test_saving.wait(10)
+    assert "first" in test_registry.busy
+    with test_registry.session("second") as test_ticker:
+        assert test_ticker.elevator.step_count == 0
+
+    test_restorer = threading.Thread(target=test_restore_first)
+    test_restorer.start()
+    test_restorer.join(0.2)
+    assert test_restorer.is_alive()
+    test_release.set()
+    test_user.join(10)
+    test_restorer.join(10)
+
+    assert len(test_snapshots) == 2
+    assert test_snapshots[1] == test_snapshots[0]
+    test_registry.close()
+
+
+def test_session_registry_delete(tmp_path):
+    """
+    - Tests the ability to delete a session from memory and disk.
+    - Tests the ability to refuse to delete a session in use, or one that does not exist.
+    """
+    test_registry = SessionRegistry(str(tmp_path))
+    test_registry.create("first")
+    with test_registry.session("first"):
+        with pytest.raises(RuntimeError):
+            test_registry.delete("first")
+    test_registry.close()
+    assert os.path.exists(os.path.join(tmp_path, "first.ckpt"))
+
+    test_registry.delete("first")
+    assert not test_registry.exists("first")
+    assert not os.listdir(tmp_path)
+    with pytest.raises(SessionNotFound):
+        test_registry.delete("first")
+    assert test_registry.create("first") == "first"
+    test_registry.close()
+
+
+def test_session_registry_evicts_many_cars(tmp_path):
+    """
+    - Tests the ability to count the cars of each session against the memory budget, dropping sessions with many.
+    """
+    test_size = SessionRegistry.estimate_size(ElevatorBank())
+    test_registry = SessionRegistry(str(tmp_path), memory_budget=3 * test_size)
+    for test_id in ("first", "second", "third"):
+        test_registry.create(test_id)
+    assert len(test_registry) == 3
+
+    for test_id in ("fourth", "fifth", "sixth"):
+        test_registry.create(test_id, cars=64)
+    assert list(test_registry.sessions) == ["sixth"]
+    assert all(
+        test_registry.exists(test_id) for test_id in ("first", "fourth", "sixth")
+    )
+    with test_registry.session("fifth") as test_ticker:
+        assert len(test_ticker.elevator.cars) == 64
+    test_registry.close()
+
+
+def test_session_registry_estimate_size(tmp_path):
+    """
+    - Tests the ability to estimate a larger size for a session with more persons.
+    - Tests the ability to estimate a larger size for a session with more cars.
+    """
+    test_registry = SessionRegistry(str(tmp_path))
+    test_registry.create("first")
+    with test_registry.session("first") as test_ticker:
+        test_empty = SessionRegistry.estimate_size(test_ticker.elevator)
+        test_ticker.submit(
+            partial(test_ticker.elevator.passengers.extend, [1] * 1000, [5] * 1000)
+        ).result()
+        assert SessionRegistry.estimate_size(test_ticker.elevator) > test_empty
+    assert SessionRegistry.estimate_size(
+        ElevatorBank(64)
+    ) > SessionRegistry.estimate_size(ElevatorBank())
+    test_registry.close()
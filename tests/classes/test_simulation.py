@@ -0,0 +1,117 @@
+"""
+test_simulation.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the Simulation class.
+"""
+
+import pytest
+
+from src.classes.elevator import Elevator
+from src.classes.simulation import Simulation
+from src.utils.custom_exceptions import InvalidButton
+
+
+def test_simulation_idle():
+    """
+    - Tests the ability to run a simulation with no events.
+    """
+    test_simulation = Simulation()
+    results = test_simulation.run(1000)
+
+    assert results["steps"] == 1000
+    assert results["floors_travelled"] == 0
+    assert results["final_state"]["floor"] == 1
+
+
+def test_simulation_matches_elevator_updates():
+    """
+    - Tests the ability of the simulation to reach the same state as updating an elevator step by step.
+    """
+    test_elevator = Elevator()
+    test_elevator.process_request(**{"source": "elevator", "button": 14})
+    test_elevator.process_request(**{"source": 5, "button": "down"})
+    for _ in range(30):
+        test_elevator.update()
+
+    test_simulation = Simulation(
+        schedule={
+            0: {
+                "buttons": [
+                    {"source": "elevator", "button": 14},
+                    {"source": 5, "button": "down"},
+                ]
+            }
+        }
+    )
+    results = test_simulation.run(30)
+
+    assert results["final_state"]["floor"] == test_elevator.current_floor
+    assert results["final_state"]["down_queue"] == test_elevator.down_queue
+    assert results["buttons_pressed"] == 2
+    # ? 1 -> 14 skips the thirteenth floor, then 14 -> 5.
+    assert results["floors_travelled"] == 22
+    assert results["door_openings"] == 2
+
+
+def test_simulation_delivers_persons():
+    """
+    - Tests the ability of the simulation to create scheduled persons and count the persons delivered.
+    """
+    test_simulation = Simulation(
+        schedule={
+            "0": {"persons": [{"origin": 1, "destination": 5}]},
+            "10": {"persons": [{"origin": 3, "destination": 2}]},
+        }
+    )
+    results = test_simulation.run(100)
+
+    assert results["persons_created"] == 2
+    assert results["persons_delivered"] == 2
+    assert results["final_state"]["waiting"] == 0
+    assert results["final_state"]["riding"] == 0
+
+
+def test_simulation_snapshots():
+    """
+    - Tests the ability to sample snapshots of the elevator state.
+    - Tests the ability to continue a simulation across runs.
+    """
+    test_simulation = Simulation(
+        schedule={0: {"buttons": [{"source": "elevator", "button": 10}]}}
+    )
+    test_simulation.run(10, snapshot_every=5)
+    results = test_simulation.run(10, snapshot_every=5)
+
+    assert [snapshot["step"] for snapshot in results["snapshots"]] == [5, 10, 15, 20]
+    assert results["snapshots"][0]["floor"] == 6
+    assert results["steps"] == 20
+
+
+def test_simulation_invalid_event():
+    """
+    - Tests the ability to throw an exception if a scheduled button is invalid.
+    """
+    test_simulation = Simulation(
+        schedule={0: {"buttons": [{"source": 0, "button": "up"}]}}
+    )
+    with pytest.raises(InvalidButton):
+        test_simulation.run(1)
+
+
+def test_simulation_seeded():
+    """
+    - Tests the ability of seeded simulations to generate the same persons and reach the same results.
+    """
+    test_schedule = {
+        step: {"persons": [{"origin": 1, "destination": 9}] * 8}
+        for step in range(0, 200, 20)
+    }
+    test_results = [
+        Simulation(schedule=test_schedule, seed=3).run(200) for _ in range(2)
+    ]
+
+    assert test_results[0] == test_results[1]
+    assert test_results[0]["persons_created"] == 80
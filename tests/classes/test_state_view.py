@@ -0,0 +1,79 @@
+"""
+test_state_view.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the StateView class.
+"""
+
+import json
+
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.state_view import StateView
+from src.classes.step_tracer import StepTracer
+
+
+def test_state_view_versions():
+    """
+    - Tests the ability to keep the version of an unchanged snapshot.
+    - Tests the ability to give a changed snapshot the next version and entity tag.
+    - Tests the ability to keep the version and entity tag of a snapshot where only the step has changed.
+    """
+    test_bank = ElevatorBank()
+    test_view = StateView(StepTracer.snapshot(test_bank), token="test")
+
+    assert test_view.etag == "test-0"
+    assert test_view.replace(StepTracer.snapshot(test_bank)) is test_view
+
+    test_bank.process_request(**{"source": "elevator", "button": 3})
+    test_new_view = test_view.replace(StepTracer.snapshot(test_bank))
+
+    assert test_new_view.version == 1
+    assert test_new_view.etag == "test-1"
+    assert test_view.state["cars"][0]["up_queue"] == []
+    assert test_new_view.state["cars"][0]["up_queue"] == [3]
+
+    test_idle_bank = ElevatorBank(2)
+    test_idle_view = StateView(StepTracer.snapshot(test_idle_bank), token="test")
+    test_idle_bank.fast_forward(7)
+    test_stepped_view = test_idle_view.replace(StepTracer.snapshot(test_idle_bank))
+
+    assert test_stepped_view.etag == test_idle_view.etag
+    assert test_stepped_view.state["step"] == 7
+    assert json.loads(test_stepped_view.body)["step"] == 7
+
+
+def test_state_view_body():
+    """
+    - Tests the ability to serialize the snapshot and its version once.
+    """
+    test_bank = ElevatorBank(2)
+    test_bank.process_request(**{"source": "elevator", "button": 3, "car": 1})
+    test_view = StateView(StepTracer.snapshot(test_bank), version=4)
+
+    assert json.loads(test_view.body) == {
+        "version": 4,
+        "step": 0,
+        "cars": [
+            {
+                "step": 0,
+                "floor": 1,
+                "status": "Open",
+                "priority_queue": [],
+                "up_queue": [],
+                "down_queue": [],
+                "persons": {},
+            },
+            {
+                "step": 0,
+                "floor": 1,
+                "status": "Open",
+                "priority_queue": [],
+                "up_queue": [3],
+                "down_queue": [],
+                "persons": {},
+            },
+        ],
+    }
+    assert test_view.body is test_view.body
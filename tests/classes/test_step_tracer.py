@@ -0,0 +1,125 @@
+"""
+test_step_tracer.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the StepTracer class.
+"""
+
+import logging
+
+from src.classes.elevator import Elevator
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.person import Person
+from src.classes.step_tracer import StepTracer
+from src.utils.constants import TRACE_BUFFER_SIZE
+
+
+def test_step_tracer_disabled():
+    """
+    - Tests the ability to report that snapshots are unused when the log is above debug and nothing is buffered, as by
+      default.
+    - Tests the ability to report that snapshots are used when they are buffered or logged.
+    """
+    test_logger = logging.getLogger("test_step_tracer_disabled")
+    test_logger.setLevel(logging.INFO)
+
+    assert not StepTracer(test_logger).enabled()
+    assert not StepTracer(test_logger, buffer_size=TRACE_BUFFER_SIZE).enabled()
+    assert StepTracer(test_logger, buffer_size=5).enabled()
+
+    test_logger.setLevel(logging.DEBUG)
+
+    assert StepTracer(test_logger).enabled()
+
+
+def test_step_tracer_sampling():
+    """
+    - Tests the ability to only record a snapshot once enough steps have passed.
+    - Tests the ability to keep only the most recent snapshots.
+    """
+    test_logger = logging.getLogger("test_step_tracer_sampling")
+    test_tracer = StepTracer(test_logger, sample_every=3, buffer_size=2)
+    test_elevator = Elevator()
+    test_elevator.process_request(**{"source": "elevator", "button": 10})
+
+    for _ in range(10):
+        test_elevator.update()
+        test_tracer.record(test_elevator)
+
+    assert [snapshot["step"] for snapshot in test_tracer.snapshots] == [7, 10]
+    assert test_tracer.snapshots[-1]["floor"] == 10
+    assert test_tracer.snapshots[-1]["status"] == "Open"
+
+
+def test_step_tracer_logs_snapshots(caplog):
+    """
+    - Tests the ability to log snapshots at the debug level.
+    """
+    test_logger = logging.getLogger("test_step_tracer_logs_snapshots")
+    test_tracer = StepTracer(test_logger)
+    test_elevator = Elevator()
+    test_elevator.process_request(**{"source": "elevator", "button": 3})
+
+    with caplog.at_level(logging.DEBUG, logger="test_step_tracer_logs_snapshots"):
+        test_elevator.update()
+        test_tracer.record(test_elevator)
+
+    assert "Step 1:" in caplog.text
+    assert "'up_queue': [3]" in caplog.text
+
+
+def test_step_tracer_changes():
+    """
+    - Tests the ability to record each change of the elevator's state, with the persons boarding and alighting.
+    - Tests the ability to only take steps as records are requested.
+    """
+    test_elevator = Elevator()
+    test_elevator.add_person(
+        Person(**{"origin": 2, "destination": 4, "weight": 150, "cargo": 0})
+    )
+    test_changes = StepTracer.changes(test_elevator, 20)
+    test_first = next(test_changes)
+
+    assert test_first == {
+        "step": 1,
+        "car": 0,
+        "floor": 2,
+        "open": False,
+        "priority": 0,
+        "up": 1,
+        "down": 0,
+        "boarded": 0,
+        "alighted": 0,
+    }
+    assert test_elevator.step_count == 1
+
+    test_records = [test_first] + list(test_changes)
+
+    assert test_elevator.step_count == 20
+    assert [record["step"] for record in test_records] == sorted(
+        {record["step"] for record in test_records}
+    )
+    assert sum(record["boarded"] for record in test_records) == 1
+    assert sum(record["alighted"] for record in test_records) == 1
+    assert test_records[-1]["floor"] == 4
+    assert test_records[-1]["open"]
+    assert test_elevator.boardings == test_elevator.alightings == 1
+
+
+def test_step_tracer_changes_bank():
+    """
+    - Tests the ability to record the changes of each car of a bank.
+    """
+    test_bank = ElevatorBank(2)
+    test_bank.process_request(**{"source": "elevator", "button": 2, "car": 1})
+    test_records = list(StepTracer.changes(test_bank, 5))
+
+    assert [
+        (record["car"], record["floor"], record["open"]) for record in test_records
+    ] == [
+        (1, 2, False),
+        (1, 2, True),
+    ]
+    assert test_bank.step_count == 5
@@ -0,0 +1,105 @@
+"""
+test_stop_queue.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the StopQueue class.
+"""
+
+import pytest
+
+from src.classes.stop_queue import StopQueue
+
+
+def test_stop_queue_add():
+    """
+    - Tests the ability to queue floors in order of the direction of travel, followed by the return.
+    - Tests the ability to not queue a floor that is already queued.
+    """
+    test_queue = StopQueue()
+    test_queue.add(8, 5, True)
+    test_queue.add(3, 5, True)
+    test_queue.add(10, 5, True)
+
+    assert test_queue.add(3, 5, True) is False
+    assert test_queue == [8, 10, 3]
+    assert len(test_queue) == 3
+    assert 10 in test_queue
+    assert 4 not in test_queue
+
+
+def test_stop_queue_add_downwards():
+    """
+    - Tests the ability to order floors when travelling downwards.
+    """
+    test_queue = StopQueue()
+    test_queue.add(8, 5, False)
+    test_queue.add(3, 5, False)
+    test_queue.add(1, 5, False)
+
+    assert test_queue == [3, 1, 8]
+    assert test_queue.peek() == 3
+
+
+def test_stop_queue_keeps_order_until_next_add():
+    """
+    - Tests the ability to keep the order of the queue from when the last floor was queued.
+    """
+    test_queue = StopQueue()
+    test_queue.add(8, 5, True)
+    test_queue.add(3, 5, True)
+
+    assert test_queue.popleft() == 8
+    assert test_queue.peek() == 3
+
+    test_queue.add(9, 7, False)
+
+    assert test_queue == [3, 9]
+
+
+def test_stop_queue_discard_and_clear():
+    """
+    - Tests the ability to remove a single floor, and every floor, from the queue.
+    """
+    test_queue = StopQueue()
+    test_queue.add(2, 1, True)
+    test_queue.add(4, 1, True)
+    test_queue.discard(2)
+    test_queue.discard(3)
+
+    assert test_queue == [4]
+
+    test_queue.clear()
+
+    assert not test_queue
+    with pytest.raises(IndexError):
+        test_queue.peek()
+
+
+def test_stop_queue_many_floors():
+    """
+    - Tests the ability to queue floors in buildings with thousands of floors.
+    """
+    test_queue = StopQueue()
+    for stop in range(5000, 0, -2):
+        test_queue.add(stop, 2500, True)
+
+    assert test_queue.peek() == 2500
+    assert len(test_queue) == 2500
+    assert list(test_queue)[-1] == 2
+
+
+def test_stop_queue_add_floors():
+    """
+    - Tests the ability to queue every floor of a bitset at once, as if added one at a time.
+    - Tests the ability to keep the order of the queue if every floor is already queued.
+    """
+    test_queue = StopQueue()
+    test_queue.add(2, 1, True)
+
+    assert test_queue.add_floors(1 << 2 | 1 << 4 | 1 << 9, 6, False) is True
+    assert test_queue == [4, 2, 9]
+    assert len(test_queue) == 3
+    assert test_queue.add_floors(1 << 4 | 1 << 9, 1, True) is False
+    assert test_queue == [4, 2, 9]
@@ -0,0 +1,71 @@
+"""
+test_sweep_runner.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the SweepRunner class.
+"""
+
+import numpy as np
+
+from src.classes.sweep_runner import SweepRunner, run_scenario
+
+
+def test_run_scenario():
+    """
+    - Tests the ability to run the same simulation from the same seed.
+    - Tests the ability to simulate buildings of different shapes in the same process.
+    - Tests the ability to simulate a building whose top floor is a default skipped floor.
+    - Tests the ability to deliver persons in a building with a weight limit below the generated cargo.
+    """
+    configuration = {"TOP_FLOOR": 25, "MAX_CAPACITY": 4, "arrival_rate": 0.05}
+    first = run_scenario(configuration, 7, 2000)
+    second = run_scenario(configuration, 7, 2000)
+
+    assert first["persons_created"] > 0
+    assert len(first["wait_times"]) > 0
+    assert np.array_equal(first["wait_times"], second["wait_times"])
+    assert np.array_equal(first["trip_times"], second["trip_times"])
+
+    default = run_scenario({"arrival_rate": 0.05}, 7, 2000)
+
+    assert default["persons_created"] == first["persons_created"]
+    assert not np.array_equal(first["wait_times"], default["wait_times"])
+
+    lower = run_scenario({"TOP_FLOOR": 13, "arrival_rate": 0.05}, 7, 500)
+
+    assert lower["persons_created"] > 0
+
+    light = run_scenario({"MAX_WEIGHT": 30, "arrival_rate": 0.05}, 7, 2000)
+
+    assert len(light["trip_times"]) > 0
+
+
+def test_sweep_runner():
+    """
+    - Tests the ability to run every combination of swept values.
+    - Tests the ability to aggregate the wait and trip times of each configuration.
+    - Tests the ability to give the same results in a pool of processes as in this process.
+    """
+    test_runner = SweepRunner(
+        {"MAX_CAPACITY": [5, 10], "arrival_rate": [0.02, 0.04]},
+        runs=2,
+        steps=2000,
+        seed=1,
+    )
+    results = test_runner.run(workers=1)
+
+    assert len(results) == 4
+    assert results[0]["configuration"] == {
+        "TOP_FLOOR": 20,
+        "MAX_CAPACITY": 5,
+        "MAX_WEIGHT": 2000,
+        "arrival_rate": 0.02,
+    }
+    assert results[0]["runs"] == 2
+    assert results[0]["persons_delivered"] <= results[0]["persons_created"]
+    wait_time = results[0]["wait_time"]
+    assert wait_time["p50"] <= wait_time["p95"] <= wait_time["p99"]
+
+    assert test_runner.run(workers=2) == results
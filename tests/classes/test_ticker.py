@@ -0,0 +1,165 @@
+"""
+test_ticker.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the Ticker class.
+"""
+
+import logging
+import threading
+import time
+from functools import partial
+
+from src.classes.elevator_bank import ElevatorBank
+from src.classes.step_tracer import StepTracer
+from src.classes.ticker import Ticker
+from src.utils.custom_exceptions import InvalidButton
+
+
+def test_ticker_inbox():
+    """
+    - Tests the ability to hold submitted requests until the next tick.
+    - Tests the ability to apply requests in the order submitted, before stepping.
+    - Tests the ability to skip a failing request without stopping the tick.
+    """
+    test_bank = ElevatorBank()
+    test_ticker = Ticker(test_bank)
+    test_futures = [
+        test_ticker.submit(partial(test_bank.process_request, **button))
+        for button in (
+            {"source": "elevator", "button": 3},
+            {"source": "elevator", "button": 13},
+            {"source": 2, "button": "down"},
+        )
+    ]
+
+    assert not test_bank.cars[0].up_queue
+    assert test_bank.step_count == 0
+    assert not any(future.done() for future in test_futures)
+
+    test_ticker.tick()
+
+    assert test_ticker.inbox.empty()
+    assert test_bank.step_count == 1
+    assert test_bank.cars[0].current_floor == 2
+    assert test_bank.cars[0].up_queue == [3]
+    assert test_bank.cars[0].down_queue == [2]
+    assert test_futures[0].result() is None
+    assert isinstance(test_futures[1].exception(), InvalidButton)
+    assert test_futures[2].result() is None
+
+
+def test_ticker_state():
+    """
+    - Tests the ability to publish a new snapshot after each tick, leaving earlier snapshots unchanged.
+    """
+    test_bank = ElevatorBank()
+    test_ticker = Ticker(test_bank)
+    test_state = test_ticker.view.state
+    test_ticker.submit(
+        partial(test_bank.process_request, **{"source": "elevator", "button": 3})
+    )
+    test_ticker.tick()
+
+    assert test_state["step"] == 0
+    assert test_state["cars"][0]["up_queue"] == []
+    assert test_ticker.view.state["step"] == 1
+    assert test_ticker.view.state["cars"][0]["floor"] == 2
+    assert test_ticker.view.state["cars"][0]["up_queue"] == [3]
+
+
+def test_ticker_tracer():
+    """
+    - Tests the ability to record a snapshot of each tick.
+    """
+    test_bank = ElevatorBank()
+    test_tracer = StepTracer(logging.getLogger("test_ticker_tracer"), buffer_size=5)
+    test_ticker = Ticker(test_bank, tracer=test_tracer)
+    test_ticker.tick()
+    test_ticker.tick()
+
+    assert [snapshot["step"] for snapshot in test_tracer.snapshots] == [1, 2]
+
+
+def test_ticker_thread():
+    """
+    - Tests the ability to step in real time on a background thread.
+    - Tests the ability to apply requests submitted while running.
+    - Tests the ability to stop the thread.
+    """
+    test_bank = ElevatorBank()
+    test_ticker = Ticker(test_bank, tick_rate=200)
+    test_ticker.start()
+    test_ticker.start()
+
+    assert test_ticker.running()
+
+    test_ticker.submit(
+        partial(test_bank.process_request, **{"source": "elevator", "button": 3})
+    )
+    deadline: float = time.monotonic() + 10
+    while test_bank.step_count < 10 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    test_ticker.stop()
+
+    assert not test_ticker.running()
+    assert test_bank.step_count >= 10
+    assert test_bank.cars[0].current_floor == 3
+
+    step_count: int = test_bank.step_count
+    time.sleep(0.05)
+
+    assert test_bank.step_count == step_count
+
+
+def test_ticker_requests():
+    """
+    - Tests the ability to apply commands on request, without a tick rate.
+    - Tests the ability to return the result of a command once its snapshot is published.
+    - Tests the ability to apply commands from many threads one at a time.
+    """
+    test_bank = ElevatorBank()
+    test_ticker = Ticker(test_bank, tick_rate=None)
+    test_ticker.start()
+    test_threads = [
+        threading.Thread(
+            target=lambda: [
+                test_ticker.submit(partial(test_bank.fast_forward, 1)).result()
+                for _ in range(50)
+            ]
+        )
+        for _ in range(4)
+    ]
+    for test_thread in test_threads:
+        test_thread.start()
+    for test_thread in test_threads:
+        test_thread.join()
+
+    assert test_bank.step_count == 200
+    assert test_ticker.view.state["step"] == 200
+    assert test_ticker.submit(lambda: test_bank.step_count).result(timeout=10) == 200
+
+    test_ticker.stop(timeout=10)
+
+    assert not test_ticker.running()
+
+
+def test_ticker_stop_applies_inbox():
+    """
+    - Tests the ability to apply the commands still in the inbox when stopped, before the ticker finishes.
+    """
+    for test_tick_rate in (None, 1000.0):
+        test_bank = ElevatorBank()
+        test_ticker = Ticker(test_bank, tick_rate=test_tick_rate)
+        test_futures = [
+            test_ticker.submit(partial(test_bank.process_request, "elevator", floor))
+            for floor in (5, 9)
+        ]
+        # ? Stopped before the loop begins, as if the commands arrived while the last batch was published.
+        test_ticker.stopping.set()
+        test_ticker.run()
+
+        assert all(future.done() for future in test_futures)
+        assert test_bank.cars[0].up_queue == [5, 9]
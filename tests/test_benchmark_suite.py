@@ -0,0 +1,107 @@
+"""
+test_benchmark_suite.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the BenchmarkSuite class.
+"""
+
+from flask import Flask, jsonify
+
+from benchmark_suite import BenchmarkSuite
+
+
+def test_benchmark_suite_run():
+    """
+    - Tests the ability to run every benchmark of the elevator, repeating each.
+    - Tests the ability to run only the named benchmarks.
+    - Tests the ability to skip the route benchmarks without a test client.
+    """
+    suite = BenchmarkSuite(scale=0.01, repeat=2)
+    results = suite.run()
+    names = [result["name"] for result in results]
+
+    assert names[:4] == [
+        "update_idle",
+        "update_light",
+        "update_rush_hour",
+        "update_priority_storm",
+    ]
+    assert "update_stranded" in names
+    assert "add_up_stop_1000" in names and "add_down_stop_10" in names
+    assert "person_construction" in names
+    assert not any(name.startswith("http_") for name in names)
+    for result in results:
+        assert result["operations"] > 0
+        assert result["best"] >= result["median"] > 0
+
+    only = suite.run(["update_light", "add_up_stop_10"])
+
+    assert [result["name"] for result in only] == ["update_light", "add_up_stop_10"]
+    assert only[0]["unit"] == "steps/s"
+
+
+def test_benchmark_suite_workloads():
+    """
+    - Tests the ability to step the elevator the requested number of steps.
+    - Tests the ability to fill a queue of the requested size.
+    """
+    suite = BenchmarkSuite(scale=0.01)
+
+    assert suite.update_workload(0.3, lobby=True)[0] == 200
+    assert suite.update_workload(0.02, priority_every=10)[0] == 200
+    assert suite.update_workload(1.0, lobby=True)[0] == 200
+    assert suite.add_stops(1000, False)[0] == 1000
+    assert suite.add_stops(10, True)[0] == 200
+
+
+def test_benchmark_suite_http():
+    """
+    - Tests the ability to benchmark each route through a test client.
+    """
+    app = Flask(__name__)
+    requests = []
+
+    @app.route("/step/<int:steps>")
+    def step(steps):
+        requests.append(("step", steps))
+        return jsonify({})
+
+    @app.route("/press_button", methods=["POST"])
+    def press_button():
+        requests.append("press_button")
+        return jsonify({})
+
+    @app.route("/create_person", methods=["POST"])
+    def create_person():
+        requests.append("create_person")
+        return jsonify({})
+
+    results = BenchmarkSuite(scale=0.01, repeat=1, client=app.test_client()).run(
+        ["http_step", "http_press_button", "http_create_person"]
+    )
+
+    assert [result["operations"] for result in results] == [5, 5, 5]
+    assert requests.count(("step", 100)) == 5
+    assert requests.count("press_button") == requests.count("create_person") == 5
+
+
+def test_benchmark_suite_compare():
+    """
+    - Tests the ability to compare results with an earlier run, skipping benchmarks not in both.
+    """
+    results = [
+        {"name": "update_idle", "best": 150.0},
+        {"name": "update_light", "best": 50.0},
+        {"name": "person_construction", "best": 10.0},
+    ]
+    baseline = [
+        {"name": "update_idle", "best": 100.0},
+        {"name": "update_light", "best": 100.0},
+    ]
+
+    assert BenchmarkSuite.compare(results, baseline) == [
+        {"name": "update_idle", "best": 150.0, "baseline": 100.0, "change": 0.5},
+        {"name": "update_light", "best": 50.0, "baseline": 100.0, "change": -0.5},
+    ]
@@ -0,0 +1,92 @@
+"""
+test_building_config.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the BuildingConfig class.
+"""
+
+import numpy as np
+import pytest
+
+from src.classes.elevator import Elevator
+from src.classes.person import Person
+from src.utils import BuildingConfig, InvalidFloor, default_config
+
+
+def test_building_config_default():
+    """
+    - Tests the ability of the default building to match the values in constants.py.
+    """
+    test_config = default_config()
+
+    assert test_config.top_floor == 20
+    assert test_config.skipped_floors == {13}
+    assert not test_config.is_floor(13)
+    assert test_config.is_floor(14)
+    assert test_config.distance(10, 15) == 4
+    assert test_config.floor_after(11, 3, True) == 15
+    assert str(InvalidFloor()) == (
+        "The selected floor is not in range, 1 <= floor <= 20, excluding 13."
+    )
+
+
+def test_building_config_floors():
+    """
+    - Tests the ability to skip any set of floors.
+    - Tests the ability to check many floors at once.
+    - Tests the ability to reject a building that skips its first or top floor.
+    - Tests the ability to drop the default skipped floors at or above a lower top floor.
+    """
+    test_config = BuildingConfig(top_floor=10, skipped_floors=(4, 9))
+
+    assert test_config.floors.tolist() == [1, 2, 3, 5, 6, 7, 8, 10]
+    assert test_config.valid_floors(np.array([0, 3, 4, 10, 11])).tolist() == [
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert test_config.distance(2, 10) == 6
+    assert test_config.floor_after(8, 5, False) == 2
+    assert test_config.floor_after(8, 5, True) == 10
+    assert test_config.describe_floors() == "1 <= floor <= 10, excluding 4, 9."
+    with pytest.raises(ValueError):
+        BuildingConfig(top_floor=13, skipped_floors=(13,))
+    with pytest.raises(ValueError):
+        BuildingConfig(top_floor=1)
+    assert BuildingConfig(top_floor=13).floors.tolist() == list(range(1, 14))
+    assert BuildingConfig(top_floor=14).skipped_floors == frozenset({13})
+
+
+def test_building_config_elevator():
+    """
+    - Tests the ability of an elevator to skip the floors of its building and stop at its top floor.
+    - Tests the ability of a person to be validated against their building.
+    """
+    test_config = BuildingConfig(top_floor=10, max_capacity=1, skipped_floors=(4,))
+    test_elevator = Elevator(config=test_config)
+    test_elevator.process_request(**{"source": "elevator", "button": 10})
+    test_elevator.update()
+    test_elevator.update()
+    test_elevator.update()
+
+    assert test_elevator.current_floor == 5
+    assert test_elevator.passengers.config is test_config
+
+    test_elevator.fast_forward(10)
+
+    assert test_elevator.current_floor == 10
+    assert test_elevator.is_open
+    with pytest.raises(InvalidFloor):
+        Person(**{"origin": 4, "destination": 1}, config=test_config)
+    with pytest.raises(InvalidFloor):
+        Person(**{"origin": 1, "destination": 15}, config=test_config)
+    assert (
+        Person(
+            **{"origin": 13, "destination": 1}, config=BuildingConfig(skipped_floors=())
+        ).location
+        == 13
+    )
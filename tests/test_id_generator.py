@@ -2,12 +2,12 @@
 test_id_generator.py
 Samuel Koller
 Created: 19 October 2024
-Updated: 19 October 2024
+Updated: 17 October 2026
 
 Test for the id_generator function.
 """
 
-from src.utils import id_generator
+from src.utils import id_block, id_generator
 
 
 def test_id_generator():
@@ -17,3 +17,14 @@ def test_id_generator():
     first_id = id_generator()
     second_id = id_generator()
     assert first_id + 1 == second_id
+
+
+def test_id_block():
+    """
+    - Tests the ability of the id generator to hand out a block of ids and continue after it.
+    """
+    first_id = id_generator()
+    ids = id_block(3)
+    next_id = id_generator()
+    assert list(ids) == [first_id + 1, first_id + 2, first_id + 3]
+    assert next_id == first_id + 4
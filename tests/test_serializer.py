@@ -0,0 +1,73 @@
+"""
+test_serializer.py
+Samuel Koller
+Created: 17 October 2026
+Updated: 17 October 2026
+
+Test Suite for the serializer functions.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.classes.stop_queue import StopQueue
+from src.utils import serializer
+from src.utils.serializer import iter_json, to_json, use_serializer
+
+
+@pytest.mark.parametrize("name", sorted(serializer.SERIALIZERS))
+def test_serializer_values(name):
+    """
+    - Tests the ability to serialize NumPy values, queues of floors and non-string keys with each serializer.
+    - Tests the ability to serialize integers larger than 64 bits with each serializer.
+    """
+    test_queue = StopQueue()
+    test_queue.add(3, 1, True)
+    use_serializer(name)
+    try:
+        test_json = to_json(
+            {
+                "floor": np.int64(4),
+                "weights": np.array([150.5, 20.0]),
+                "queue": test_queue,
+                "persons": {"elevator": 1, 3: 2},
+                "origin": 10**30,
+            }
+        )
+    finally:
+        use_serializer(None)
+
+    assert json.loads(test_json) == {
+        "floor": 4,
+        "weights": [150.5, 20.0],
+        "queue": [3],
+        "persons": {"elevator": 1, "3": 2},
+        "origin": 10**30,
+    }
+
+
+def test_serializer_unknown():
+    """
+    - Tests the ability to reject a serializer that does not exist.
+    - Tests the ability to reject values that cannot be serialized.
+    """
+    with pytest.raises(ValueError):
+        use_serializer("yaml")
+    with pytest.raises(TypeError):
+        to_json({"value": object()})
+
+
+@pytest.mark.parametrize("count", [0, 1, serializer.STREAM_BATCH_SIZE, 600])
+def test_serializer_stream(count):
+    """
+    - Tests the ability to stream an object with a list of items in pieces, joining to the same JSON.
+    """
+    test_items = [{"step": step} for step in range(count)]
+    test_pieces = list(iter_json({"message": "Test"}, "items", iter(test_items)))
+
+    assert b"".join(test_pieces) == to_json({"message": "Test", "items": test_items})
+    assert json.loads(b"".join(iter_json({}, "items", test_items))) == {
+        "items": test_items
+    }